@@ -1,707 +1,857 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
-import plotly.figure_factory as ff
 import os
-import vispy.scene
-import vispy.io
-import vispy.app
-from vispy.scene import SceneCanvas, visuals
-import tempfile
-import webbrowser
-import pandas as pd
-import plotly.graph_objects as go
+from contextlib import ExitStack
+from osplatform import telemetry
 
 # Streamlit Page Configuration
 st.set_page_config(page_title="AR/VR-Enhanced OS Learning", layout="wide")
 
+# Simulation results are shared across reruns and sessions; identical inputs
+# reuse the cached table and figure (LRU beyond max_entries, expired after ttl seconds)
+CACHE_MAX_ENTRIES = int(os.environ.get("OSPLATFORM_CACHE_MAX_ENTRIES", 256))
+CACHE_TTL = int(os.environ.get("OSPLATFORM_CACHE_TTL", 3600))
+
+# Uploaded traces can hold millions of rows; tables show only the first ones
+TRACE_PREVIEW_ROWS = 1000
+
+# Stage timings and cache counters are process-wide; set a port to let Prometheus scrape them at /metrics
+METRICS_PORT = os.environ.get("OSPLATFORM_METRICS_PORT")
+if METRICS_PORT:
+    try:
+        telemetry.serve(int(METRICS_PORT))
+    except OSError as exc:
+        st.sidebar.warning(f"Metrics endpoint not started: {exc}")
+
+# Live classroom streams are served over WebSockets on this port; set a URL when viewers reach it through a proxy
+STREAM_PORT = int(os.environ.get("OSPLATFORM_STREAM_PORT", 8765))
+STREAM_URL = os.environ.get("OSPLATFORM_STREAM_URL")
+
+# Vendored media (static/vendor/, see osplatform.assets) comes from the app's own app/static route unless a port
+# is set, which serves it over plain HTTP with long-lived immutable cache headers; set a full URL, scheme included,
+# when browsers reach that server through a proxy (an HTTPS app needs one to avoid mixed content)
+ASSET_PORT = os.environ.get("OSPLATFORM_ASSET_PORT")
+ASSET_URL = os.environ.get("OSPLATFORM_ASSET_URL")
+
+
+# Base URL pages load vendored media from; assets (and its server) are only imported by pages that show media
+def asset_base_url():
+    from osplatform import assets
+
+    if ASSET_URL:
+        return ASSET_URL.rstrip("/")
+    # The plain-HTTP asset server would be blocked as mixed content on an HTTPS page
+    if ASSET_PORT and not (st.context.url or "").startswith("https:"):
+        try:
+            assets.serve(int(ASSET_PORT))
+        except OSError as exc:
+            st.sidebar.warning(f"Asset server not started: {exc}")
+        else:
+            return f"http://{(st.context.headers.get('Host') or 'localhost').rsplit(':', 1)[0]}:{ASSET_PORT}"
+    return assets.STATIC_ROUTE
+
 # Sidebar Navigation
 st.title("🔹 AR/VR-Enhanced OS Learning Platform")
 st.sidebar.header("Navigation")
 option = st.sidebar.radio("Select a topic:", ["Home", "Process Scheduling", "Memory Management", "AR/VR Visualization"])
 
-# Home Page
-if option == "Home":
-    st.markdown("""
-        <style>
-            .centered {
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                align-items: center;
-                text-align: center;
-            }
-            .title-style {
-                font-size: 2.5rem;
-                font-weight: 700;
-                margin-top: 30px;
-                color: #1f77b4;
-            }
-            .subtitle-style {
-                font-size: 1.2rem;
-                color: #555;
-                margin-bottom: 20px;
-            }
-        </style>
-        <div class="centered">
-            <div class="title-style">👨‍💻 Welcome to the AR/VR OS Learning Platform! 👩‍💻</div>
-            <div class="subtitle-style">Explore Operating System concepts with visual and interactive simulations.</div>
-        </div>
-    """, unsafe_allow_html=True)
-
-    st.image("https://images.unsplash.com/photo-1516321318423-f06f85e504b3", use_column_width=True)
-
-    st.markdown("### 📚 Features You Can Explore:")
-    st.markdown("- 🔄 **Process Scheduling**: Visualize FCFS, SJF, and Round Robin with Gantt charts")
-    st.markdown("- 💾 **Memory Management**: Simulate First-Fit, Best-Fit, Worst-Fit allocation")
-    st.markdown("- 🧠 **AR/VR Visualization**: Dive into immersive 3D simulations of OS internals")
-
-    st.markdown("---")
-    st.markdown("💡 *Use the navigation sidebar to select a topic and begin your learning journey!*")
-
-# Process Scheduling (Gantt Chart)
-elif option == "Process Scheduling":
-    st.subheader("🔄 Process Scheduling Simulation")
-
-    num_processes = st.number_input("Enter number of processes:", min_value=1, max_value=5, step=1)
-    processes = [f"P{i+1}" for i in range(num_processes)]
-    burst_times = [st.number_input(f"Enter Burst Time for {p}:", min_value=1, max_value=20) for p in processes]
-    arrival_times = [st.number_input(f"Enter Arrival Time for {p}:", min_value=0, max_value=20) for p in processes]
-
-    # Select scheduling algorithm
-    scheduling_algo = st.selectbox("Choose Scheduling Algorithm:", ["FCFS", "SJF", "Round Robin"])
-
-    # FCFS Scheduling with Arrival Time
-    def fcfs_scheduling(processes, burst_time, arrival_time):
-        start_time = [0] * len(processes)
-        completion_time = [0] * len(processes)
-        turnaround_time = [0] * len(processes)
-        waiting_time = [0] * len(processes)
-        
-        # Calculate start time and completion time
-        for i in range(len(processes)):
-            if i == 0:
-                start_time[i] = max(0, arrival_time[i])
-            else:
-                start_time[i] = max(completion_time[i-1], arrival_time[i])
-            completion_time[i] = start_time[i] + burst_time[i]
-            turnaround_time[i] = completion_time[i] - arrival_time[i]
-            waiting_time[i] = turnaround_time[i] - burst_time[i]
-
-        # Create a DataFrame to display the table
-        data = {
-            "Process": processes,
-            "Arrival Time (AT)": arrival_time,
-            "Burst Time (BT)": burst_time,
-            "Completion Time (CT)": completion_time,
-            "Turnaround Time (TAT)": turnaround_time,
-            "Waiting Time (WT)": waiting_time
-        }
-        
-        df = pd.DataFrame(data)
-        st.subheader("📊 Process Scheduling Table")
-        st.dataframe(df)
-
-        # Create a Gantt chart with Plotly
-        fig = go.Figure()
-        for i in range(len(processes)):
-            fig.add_trace(go.Bar(
-                y=[processes[i]],
-                x=[burst_time[i]],
-                orientation='h',
-                base=start_time[i],
-                hoverinfo='x+y+name',
-                name=processes[i],
-                marker=dict(color='skyblue')
-            ))
-
-        fig.update_layout(
-            title="FCFS Scheduling Gantt Chart",
-            xaxis_title="Time",
-            yaxis_title="Process",
-            barmode='stack',
-            showlegend=False
-        )
-        st.plotly_chart(fig)
-
-    # SJF Scheduling with Arrival Time
-    def sjf_scheduling(processes, burst_time, arrival_time):
-        # Sort processes by arrival time
-        sorted_processes = sorted(zip(processes, burst_time, arrival_time), key=lambda x: x[2])
-        sorted_names, sorted_times, sorted_arrivals = zip(*sorted_processes)
-        
-        start_time = [0] * len(sorted_processes)
-        completion_time = [0] * len(sorted_processes)
-        turnaround_time = [0] * len(sorted_processes)
-        waiting_time = [0] * len(sorted_processes)
-        
-        completed = [False] * len(sorted_processes)
-        current_time = 0
-        remaining_processes = len(sorted_processes)
-        
-        while remaining_processes > 0:
-            available_processes = [(i, sorted_times[i]) for i in range(len(sorted_processes)) 
-                                 if not completed[i] and sorted_arrivals[i] <= current_time]
-            
-            if available_processes:
-                next_process_idx = min(available_processes, key=lambda x: x[1])[0]
-                
-                start_time[next_process_idx] = current_time
-                completion_time[next_process_idx] = current_time + sorted_times[next_process_idx]
-                turnaround_time[next_process_idx] = completion_time[next_process_idx] - sorted_arrivals[next_process_idx]
-                waiting_time[next_process_idx] = turnaround_time[next_process_idx] - sorted_times[next_process_idx]
-                
-                completed[next_process_idx] = True
-                current_time = completion_time[next_process_idx]
-                remaining_processes -= 1
-            else:
-                current_time = min(sorted_arrivals[i] for i in range(len(sorted_processes)) if not completed[i])
-        
-        # Create a DataFrame to display the table
-        data = {
-            "Process": sorted_names,
-            "Arrival Time (AT)": sorted_arrivals,
-            "Burst Time (BT)": sorted_times,
-            "Completion Time (CT)": completion_time,
-            "Turnaround Time (TAT)": turnaround_time,
-            "Waiting Time (WT)": waiting_time
-        }
-        
-        df = pd.DataFrame(data)
-        st.subheader("📊 Process Scheduling Table")
-        st.dataframe(df)
-        
-        # Create a Gantt chart with Plotly
-        fig = go.Figure()
-        for i in range(len(sorted_processes)):
-            fig.add_trace(go.Bar(
-                y=[sorted_names[i]],
-                x=[sorted_times[i]],
-                orientation='h',
-                base=start_time[i],
-                hoverinfo='x+y+name',
-                name=sorted_names[i],
-                marker=dict(color='lightcoral')
-            ))
-        
-        fig.update_layout(
-            title="SJF Scheduling Gantt Chart",
-            xaxis_title="Time",
-            yaxis_title="Process",
-            barmode='stack',
-            showlegend=False
-        )
-        st.plotly_chart(fig)
-
-    # Round Robin Scheduling with Arrival Time
-    def round_robin_scheduling(processes, burst_time, arrival_time, quantum=2):
-        remaining_time = burst_time.copy()
-        time = 0
-        gantt_chart = []
-        completion_time = [0] * len(processes)
-        turnaround_time = [0] * len(processes)
-        waiting_time = [0] * len(processes)
-        queue = []
-
-        while any(rt > 0 for rt in remaining_time):
-            # Add newly arrived processes to queue
-            for i, at in enumerate(arrival_time):
-                if at <= time and remaining_time[i] > 0 and i not in queue:
-                    queue.append(i)
-            
-            if queue:
-                i = queue.pop(0)
-                execution_time = min(quantum, remaining_time[i])
-                gantt_chart.append((processes[i], time, time + execution_time))
-                time += execution_time
-                remaining_time[i] -= execution_time
-                
-                # Add process back to queue if not completed
-                if remaining_time[i] > 0:
-                    queue.append(i)
-                
-                # Update completion time for completed process
-                if remaining_time[i] == 0:
-                    completion_time[i] = time
-            
-            else:
-                time += 1
-
-        # Calculate Turnaround and Waiting Time
-        for i in range(len(processes)):
-            turnaround_time[i] = completion_time[i] - arrival_time[i]
-            waiting_time[i] = turnaround_time[i] - burst_time[i]
-
-        # Create a DataFrame to display the table
-        data = {
-            "Process": processes,
-            "Arrival Time (AT)": arrival_time,
-            "Burst Time (BT)": burst_time,
-            "Completion Time (CT)": completion_time,
-            "Turnaround Time (TAT)": turnaround_time,
-            "Waiting Time (WT)": waiting_time
-        }
-
-        df = pd.DataFrame(data)
-        st.subheader("📊 Process Scheduling Table")
-        st.dataframe(df)
-
-        # Create a Gantt chart with Plotly
-        fig = go.Figure()
-        for p, start, end in gantt_chart:
-            fig.add_trace(go.Bar(
-                y=[p],
-                x=[end - start],
-                orientation='h',
-                base=start,
-                hoverinfo='x+y+name',
-                name=p,
-                marker=dict(color='purple')
-            ))
-
-        fig.update_layout(
-            title="Round Robin Scheduling Gantt Chart",
-            xaxis_title="Time",
-            yaxis_title="Process",
-            barmode='stack',
-            showlegend=False
-        )
-        st.plotly_chart(fig)
-
-    # Simulate Button
-    if st.button("Simulate"):
-        if scheduling_algo == "FCFS":
-            fcfs_scheduling(processes, burst_times, arrival_times)
-        elif scheduling_algo == "SJF":
-            sjf_scheduling(processes, burst_times, arrival_times)
-        elif scheduling_algo == "Round Robin":
-            round_robin_scheduling(processes, burst_times, arrival_times, quantum=4)
-
-# Memory Management (3D Blocks)
-elif option == "Memory Management":
-    st.subheader("💾 Memory Allocation Strategies Visualization")
-
-    # Input for Memory Blocks and Processes
-    col1, col2 = st.columns(2)
-    with col1:
-        block_input = st.text_input("Enter Memory Blocks (comma-separated)", "100, 500, 200, 300, 600")
-        blocks = [int(x.strip()) for x in block_input.split(",") if x.strip().isdigit()]
-
-    with col2:
-        process_input = st.text_input("Enter Process Sizes (comma-separated)", "212, 417, 112, 426")
-        processes = [int(x.strip()) for x in process_input.split(",") if x.strip().isdigit()]
-
-    strategy = st.radio("Select Allocation Strategy", ["First-Fit", "Best-Fit", "Worst-Fit"])
-
-    # Allocation Algorithms
-    def first_fit(blocks, processes):
-        allocation = [-1] * len(processes)
-        blocks_copy = blocks.copy()
-        for i in range(len(processes)):
-            for j in range(len(blocks_copy)):
-                if blocks_copy[j] >= processes[i]:
-                    allocation[i] = j
-                    blocks_copy[j] -= processes[i]
-                    break
-        return allocation
-
-    def best_fit(blocks, processes):
-        allocation = [-1] * len(processes)
-        blocks_copy = blocks.copy()
-        for i in range(len(processes)):
-            best_idx = -1
-            min_space = float('inf')
-            for j in range(len(blocks_copy)):
-                if blocks_copy[j] >= processes[i] and blocks_copy[j] - processes[i] < min_space:
-                    best_idx = j
-                    min_space = blocks_copy[j] - processes[i]
-            if best_idx != -1:
-                allocation[i] = best_idx
-                blocks_copy[best_idx] -= processes[i]
-        return allocation
-
-    def worst_fit(blocks, processes):
-        allocation = [-1] * len(processes)
-        blocks_copy = blocks.copy()
-        for i in range(len(processes)):
-            worst_idx = -1
-            max_space = -1
-            for j in range(len(blocks_copy)):
-                if blocks_copy[j] >= processes[i] and blocks_copy[j] > max_space:
-                    worst_idx = j
-                    max_space = blocks_copy[j]
-            if worst_idx != -1:
-                allocation[i] = worst_idx
-                blocks_copy[worst_idx] -= processes[i]
-        return allocation
-
-    # Simulate Allocation
-    if st.button("Simulate Allocation"):
-        original_blocks = blocks.copy()
-        if strategy == "First-Fit":
-            allocation = first_fit(blocks, processes)
-        elif strategy == "Best-Fit":
-            allocation = best_fit(blocks, processes)
-        elif strategy == "Worst-Fit":
-            allocation = worst_fit(blocks, processes)
-
-        # Result Table
-        result = []
-        for i in range(len(processes)):
-            result.append({
-                "Process No": i + 1,
-                "Process Size": processes[i],
-                "Block Allocated": f"Block {allocation[i] + 1}" if allocation[i] != -1 else "Not Allocated"
-            })
-
-        st.subheader("📝 Allocation Result")
-        st.dataframe(pd.DataFrame(result))
-
-        # Visualization
-        st.subheader("📊 Memory Allocation Chart")
-        fig, ax = plt.subplots(figsize=(10, 4))
-        y = 1
-        for i in range(len(processes)):
-            block_idx = allocation[i]
-            if block_idx != -1:
-                start = sum(original_blocks[:block_idx])
-                ax.broken_barh([(start, processes[i])], (y-0.4, 0.8), facecolors='tab:blue')
-                ax.text(start + processes[i]/2, y, f"P{i+1}", ha='center', va='center', color='white')
-
-        # Draw memory blocks
-        current = 0
-        for i, block in enumerate(original_blocks):
-            ax.broken_barh([(current, block)], (y-0.4, 0.8), facecolors='none', edgecolors='black')
-            current += block
-
-        ax.set_ylim(0, 2)
-        ax.set_xlim(0, sum(original_blocks))
-        ax.set_xlabel("Memory Size")
-        ax.set_yticks([])
-        ax.set_title("Memory Blocks and Process Allocation")
-        st.pyplot(fig)
-
-# AR/VR 3D Visualization for OS Concepts
-elif option == "AR/VR Visualization":
-    st.subheader("🕶 AR/VR 3D Process and Memory Management Visualization")
-
-    # Web-Based VR (Three.js for interactive VR experience)
-    def open_vr_scene():
-        html_code = """
-        <!DOCTYPE html>
-        <head>
-            <title>FCFS Conveyor Simulation</title>
-            <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
+# Profiling panel: the whole page run is timed, and profiled on demand; the report is shown after the page
+# The page body runs inside page_run, so a rerun or st.stop() partway through still ends both
+show_profiling = st.sidebar.toggle("Profiling panel")
+with ExitStack() as page_run:
+    page_run.enter_context(telemetry.stage(f"page.{option}"))
+    profile_report = None
+    if show_profiling:
+        profiler = st.sidebar.selectbox("Profiler:", telemetry.PROFILERS)
+        if st.sidebar.button("Profile this page"):
+            try:
+                profile_report = page_run.enter_context(telemetry.profiled(profiler))
+            except (ImportError, ValueError) as exc:
+                st.sidebar.warning(str(exc))
+
+    # Home Page
+    if option == "Home":
+        st.markdown("""
             <style>
-                body { margin: 0; overflow: hidden; }
-                #ui { 
-                    position: absolute; 
-                    top: 10px; 
-                    left: 10px; 
-                    color: white; 
-                    background: rgba(0, 0, 0, 0.8); 
-                    padding: 15px; 
-                    font-family: Arial;
-                    border-radius: 5px;
-                }
-                #controls { 
-                    position: absolute; 
-                    top: 10px; 
-                    right: 10px; 
-                    background: rgba(0, 0, 0, 0.8); 
-                    padding: 10px; 
-                    border-radius: 5px;
+                .centered {
+                    display: flex;
+                    flex-direction: column;
+                    justify-content: center;
+                    align-items: center;
+                    text-align: center;
                 }
-                button { 
-                    margin: 5px; 
-                    padding: 8px 12px; 
-                    cursor: pointer; 
-                    background: #444; 
-                    color: white; 
-                    border: none; 
-                    border-radius: 3px;
+                .title-style {
+                    font-size: 2.5rem;
+                    font-weight: 700;
+                    margin-top: 30px;
+                    color: #1f77b4;
                 }
-                button:hover { background: #666; }
-                #gantt { 
-                    position: absolute; 
-                    bottom: 10px; 
-                    left: 10px; 
-                    width: 50%; 
-                    height: 100px; 
-                    background: rgba(0, 0, 0, 0.8); 
-                    border-radius: 5px;
+                .subtitle-style {
+                    font-size: 1.2rem;
+                    color: #555;
+                    margin-bottom: 20px;
                 }
             </style>
-        </head>
-        <body>
-            <div id="ui">
-                <h3>FCFS Scheduling - Conveyor Belt</h3>
-                <p>Green: Ready, Red: Running, Gray: Completed</p>
-                <p>Processes: <span id="procCount">0</span></p>
-                <p>Avg. Waiting Time: <span id="avgWait">0</span> ms</p>
-                <p>Avg. Turnaround Time: <span id="avgTurn">0</span> ms</p>
-            </div>
-            <div id="controls">
-                <button onclick="addProcess()">Add Process</button>
-                <button onclick="resetSimulation()">Reset</button>
-                <button onclick="togglePause()">Pause/Resume</button>
+            <div class="centered">
+                <div class="title-style">👨‍💻 Welcome to the AR/VR OS Learning Platform! 👩‍💻</div>
+                <div class="subtitle-style">Explore Operating System concepts with visual and interactive simulations.</div>
             </div>
-            <canvas id="gantt"></canvas>
-            <script>
-                // Scene setup
-                const scene = new THREE.Scene();
-                const camera = new THREE.PerspectiveCamera(75, window.innerWidth / window.innerHeight, 0.1, 1000);
-                const renderer = new THREE.WebGLRenderer({ antialias: true });
-                renderer.setSize(window.innerWidth, window.innerHeight);
-                document.body.appendChild(renderer.domElement);
-
-                // Lighting
-                scene.add(new THREE.AmbientLight(0x404040));
-                const directionalLight = new THREE.DirectionalLight(0xffffff, 0.6);
-                directionalLight.position.set(0, 5, 5);
-                scene.add(directionalLight);
-
-                // Process management
-                let processes = [];
-                let currentTime = 0;
-                let isPaused = false;
-                const maxBurstTime = 1000;
-                let totalWaitingTime = 0;
-                let totalTurnaroundTime = 0;
-
-                // Process states
-                const states = {
-                    READY: { color: 0x00ff00, name: 'Ready' },
-                    RUNNING: { color: 0xff0000, name: 'Running' },
-                    COMPLETED: { color: 0x888888, name: 'Completed' }
-                };
-
-                // Conveyor belt
-                const beltGeometry = new THREE.PlaneGeometry(20, 2);
-                const beltMaterial = new THREE.MeshPhongMaterial({ color: 0x333333 });
-                const belt = new THREE.Mesh(beltGeometry, beltMaterial);
-                belt.rotation.x = -Math.PI / 2;
-                belt.position.y = -1;
-                scene.add(belt);
-
-                // CPU representation
-                const cpuGeometry = new THREE.BoxGeometry(1.5, 1.5, 1.5);
-                const cpuMaterial = new THREE.MeshPhongMaterial({ color: 0x3333ff, wireframe: true });
-                const cpu = new THREE.Mesh(cpuGeometry, cpuMaterial);
-                cpu.position.set(-8, 0, 0);
-                scene.add(cpu);
-
-                // Text sprite for labels
-                function createTextSprite(message) {
-                    const canvas = document.createElement('canvas');
-                    canvas.width = 128;
-                    canvas.height = 32;
-                    const context = canvas.getContext('2d');
-                    context.font = 'Bold 20px Arial';
-                    context.fillStyle = 'white';
-                    context.fillText(message, 0, 20);
-                    const texture = new THREE.CanvasTexture(canvas);
-                    const spriteMaterial = new THREE.SpriteMaterial({ map: texture });
-                    const sprite = new THREE.Sprite(spriteMaterial);
-                    sprite.scale.set(1, 0.25, 1);
-                    return sprite;
-                }
-
-                // Gantt chart
-                const ganttCanvas = document.getElementById('gantt');
-                const ganttCtx = ganttCanvas.getContext('2d');
-                let ganttHistory = [];
-
-                function updateGantt() {
-                    ganttCanvas.width = window.innerWidth * 0.5;
-                    ganttCtx.fillStyle = 'rgba(0, 0, 0, 0.8)';
-                    ganttCtx.fillRect(0, 0, ganttCanvas.width, ganttCanvas.height);
-                    ganttCtx.font = '12px Arial';
-                    ganttCtx.fillStyle = 'white';
-
-                    let x = 0;
-                    ganttHistory.forEach(entry => {
-                        const width = (entry.duration / 100) * ganttCanvas.width;
-                        ganttCtx.fillStyle = entry.color;
-                        ganttCtx.fillRect(x, 20, width, 60);
-                        ganttCtx.fillStyle = 'white';
-                        ganttCtx.fillText(`P${entry.id}`, x + 5, 50);
-                        x += width;
-                    });
-
-                    ganttCtx.fillStyle = 'white';
-                    ganttCtx.fillText(`Time: ${(currentTime / 1000).toFixed(1)}s`, 10, 15);
-                }
-
-                // Add new process
-                window.addProcess = function() {
-                    const burstTime = Math.floor(Math.random() * maxBurstTime) + 200;
-                    const geometry = new THREE.BoxGeometry(0.8, 0.8, 0.8);
-                    const material = new THREE.MeshPhongMaterial({ color: states.READY.color });
-                    const cube = new THREE.Mesh(geometry, material);
-                    const index = processes.length;
-                    cube.position.set(index * 2, 0, 0);
-                    cube.userData = {
-                        id: index + 1,
-                        state: 'READY',
-                        burstTime: burstTime,
-                        remainingTime: burstTime,
-                        arrivalTime: currentTime,
-                        startTime: null,
-                        waitingTime: 0,
-                        turnaroundTime: 0
-                    };
-
-                    const label = createTextSprite(`P${index + 1}: ${burstTime}ms`);
-                    label.position.set(index * 2, 1, 0);
-                    scene.add(label);
-                    cube.userData.label = label;
-
-                    processes.push(cube);
-                    scene.add(cube);
-                    updateUI();
-                };
-
-                // Initialize processes
-                function initializeProcesses() {
-                    processes = [];
-                    currentTime = 0;
-                    totalWaitingTime = 0;
-                    totalTurnaroundTime = 0;
-                    ganttHistory = [];
-                    scene.children = scene.children.filter(child => child === cpu || child === belt || child.type === 'Light');
-                    for (let i = 0; i < 3; i++) addProcess();
-                }
-
-                // Update UI
-                function updateUI() {
-                    document.getElementById('procCount').textContent = processes.length;
-                    const avgWait = processes.length > 0 ? (totalWaitingTime / processes.length / 1000).toFixed(2) : 0;
-                    const avgTurn = processes.length > 0 ? (totalTurnaroundTime / processes.length / 1000).toFixed(2) : 0;
-                    document.getElementById('avgWait').textContent = avgWait;
-                    document.getElementById('avgTurn').textContent = avgTurn;
-                }
+        """, unsafe_allow_html=True)
+
+        # Local, pre-sized variants only: first paint never waits on an outbound fetch
+        from osplatform import assets
+
+        try:
+            st.markdown(assets.picture("hero", "Memory blocks filling up above a CPU timeline", base=asset_base_url()),
+                        unsafe_allow_html=True)
+        except assets.AssetMissing as exc:
+            st.error(str(exc))
+
+        st.markdown("### 📚 Features You Can Explore:")
+        st.markdown("- 🔄 **Process Scheduling**: Visualize FCFS, SJF, SRTF, Round Robin and Priority with Gantt charts")
+        st.markdown("- 💾 **Memory Management**: Simulate First-Fit, Best-Fit, Worst-Fit allocation and replay allocate/free traces with Next-Fit and Buddy, and compare FIFO, LRU, Clock, LFU and Optimal page replacement")
+        st.markdown("- 🧠 **AR/VR Visualization**: Dive into immersive 3D simulations of OS internals, replay memory placements on a 3D block grid, or stream one live to a whole class")
+
+        st.markdown("---")
+        st.markdown("💡 *Use the navigation sidebar to select a topic and begin your learning journey!*")
+
+    # Process Scheduling (Gantt Chart)
+    elif option == "Process Scheduling":
+        # Page-specific modules are imported here so other pages never load them
+        import io
+        import numpy as np
+        import pandas as pd
+        import plotly.io as pio
+        from osplatform import random_workload, scheduling, traces
+        from osplatform.charts import gantt_figure
+
+        st.subheader("🔄 Process Scheduling Simulation")
+
+        mode = st.radio("Mode:", ["Simulate", "Compare", "Multi-core"], horizontal=True)
+
+        if mode == "Simulate":
+            source = st.radio("Process Input:", ["Manual Entry", "Upload Trace"], horizontal=True)
+            if source == "Manual Entry":
+                num_processes = st.number_input("Enter number of processes:", min_value=1, max_value=5, step=1)
+                processes = [f"P{i+1}" for i in range(num_processes)]
+                burst_times = [st.number_input(f"Enter Burst Time for {p}:", min_value=1, max_value=20) for p in processes]
+                arrival_times = [st.number_input(f"Enter Arrival Time for {p}:", min_value=0, max_value=20) for p in processes]
+            else:
+                trace_file = st.file_uploader("Process trace with pid, arrival, burst and optional priority columns",
+                                              type=["csv", "parquet", "pq", "bin"])
+
+            # Select scheduling algorithm
+            scheduling_algo = st.selectbox("Choose Scheduling Algorithm:", list(scheduling.ALGORITHMS))
+            if scheduling_algo in scheduling.PRIORITY_ALGORITHMS and source == "Manual Entry":
+                priorities = [st.number_input(f"Enter Priority for {p} (lower runs first):", min_value=0, max_value=20) for p in processes]
+            quantum = 4
+            if scheduling_algo in scheduling.QUANTUM_ALGORITHMS:
+                quantum = st.number_input("Time Quantum:", min_value=1, max_value=1000, value=4)
+            incremental = st.toggle("Incremental mode", help="Re-simulate on every edit, reusing the previous schedule "
+                                                             "up to the first dispatch the edit can affect")
+
+            # Gantt chart title and colour for each algorithm
+            chart_styles = {
+                "FCFS": ("FCFS Scheduling Gantt Chart", 'skyblue'),
+                "SJF": ("SJF Scheduling Gantt Chart", 'lightcoral'),
+                "SRTF": ("SRTF Scheduling Gantt Chart", 'salmon'),
+                "Round Robin": ("Round Robin Scheduling Gantt Chart", 'purple'),
+                "Priority (Non-preemptive)": ("Priority Scheduling Gantt Chart", 'seagreen'),
+                "Priority (Preemptive)": ("Preemptive Priority Scheduling Gantt Chart", 'mediumseagreen'),
+            }
 
-                // Reset simulation
-                window.resetSimulation = function() {
-                    initializeProcesses();
-                    isPaused = false;
-                    updateUI();
-                };
-
-                // Toggle pause/resume
-                window.togglePause = function() {
-                    isPaused = !isPaused;
-                };
-
-                // Camera position
-                camera.position.set(0, 3, 10);
-                camera.lookAt(0, 0, 0);
-
-                // Handle window resize
-                window.addEventListener('resize', () => {
-                    camera.aspect = window.innerWidth / window.innerHeight;
-                    camera.updateProjectionMatrix();
-                    renderer.setSize(window.innerWidth, window.innerHeight);
-                    updateGantt();
-                });
-
-                // Animation loop
-                function animate() {
-                    requestAnimationFrame(animate);
-
-                    if (!isPaused) {
-                        // FCFS Logic
-                        const currentProcess = processes.find(p => p.userData.state === 'RUNNING') || 
-                                            processes.find(p => p.userData.state === 'READY');
-
-                        if (currentProcess && currentProcess.userData.state !== 'RUNNING') {
-                            currentProcess.userData.state = 'RUNNING';
-                            currentProcess.userData.startTime = currentTime;
-                            currentProcess.material.color.set(states.RUNNING.color);
-                            currentProcess.position.set(cpu.position.x, 0, 0);
-                            currentProcess.userData.label.position.set(cpu.position.x, 1, 0);
-                            ganttHistory.push({
-                                id: currentProcess.userData.id,
-                                color: '#ff0000',
-                                duration: 0
-                            });
-                        }
-
-                        if (currentProcess) {
-                            const delta = 16.67; // Approx 60 FPS
-                            currentProcess.userData.remainingTime -= delta;
-                            currentTime += delta;
-                            ganttHistory[ganttHistory.length - 1].duration += delta;
-
-                            // Update waiting time
-                            processes.forEach(p => {
-                                if (p !== currentProcess && p.userData.state === 'READY') {
-                                    p.userData.waitingTime += delta;
-                                }
-                            });
-
-                            // Process completion
-                            if (currentProcess.userData.remainingTime <= 0) {
-                                currentProcess.userData.state = 'COMPLETED';
-                                currentProcess.material.color.set(states.COMPLETED.color);
-                                currentProcess.position.set(cpu.position.x, -2, 0);
-                                currentProcess.userData.label.position.set(cpu.position.x, -1, 0);
-                                currentProcess.userData.turnaroundTime = currentTime - currentProcess.userData.arrivalTime;
-                                totalWaitingTime += currentProcess.userData.waitingTime;
-                                totalTurnaroundTime += currentProcess.userData.turnaroundTime;
-                                updateUI();
-                            }
-
-                            // Move queue
-                            processes.forEach((p, i) => {
-                                if (p.userData.state === 'READY') {
-                                    p.position.x = i * 2;
-                                    p.userData.label.position.x = i * 2;
-                                }
-                            });
-                        }
-
-                        // Animate
-                        processes.forEach(cube => {
-                            if (cube.userData.state === 'RUNNING') {
-                                cube.rotation.x += 0.03;
-                                cube.rotation.y += 0.03;
-                                cube.scale.set(1.2, 1.2, 1.2);
-                            } else {
-                                cube.rotation.x += 0.01;
-                                cube.rotation.y += 0.01;
-                                cube.scale.set(1, 1, 1);
-                            }
-                        });
-
-                        updateGantt();
-                    }
-
-                    renderer.render(scene, camera);
+            # Column headers for the scheduling table, in scheduling.RESULT_COLUMNS order
+            TABLE_LABELS = ["Arrival Time (AT)", "Burst Time (BT)", "Completion Time (CT)",
+                            "Turnaround Time (TAT)", "Waiting Time (WT)"]
+
+            # Simulate and build the scheduling table and Gantt chart (memoized on the inputs)
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def schedule_view(algorithm, quantum, processes, burst_times, arrival_times, priorities, title, color):
+                telemetry.count("cache_misses", cache="schedule_view")
+                with telemetry.stage("scheduling.algorithm"):
+                    result = scheduling.simulate(algorithm, burst_times, arrival_times, quantum=quantum, priority_level=priorities)
+                with telemetry.stage("scheduling.dataframe"):
+                    df = result.table.frame(labels=TABLE_LABELS)
+                    df.insert(0, "Process", processes)
+
+                with telemetry.stage("scheduling.figure"):
+                    fig = gantt_figure(result.gantt, processes, title, color)
+                with telemetry.stage("scheduling.serialize"):
+                    return df, fig.to_json()
+
+            # Simulate an uploaded trace; keyed on the file bytes, showing metrics and the first rows
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def trace_schedule_view(algorithm, quantum, trace_bytes, trace_name, title, color):
+                telemetry.count("cache_misses", cache="trace_schedule_view")
+                with telemetry.stage("scheduling.load_trace"):
+                    workload = traces.load_processes(io.BytesIO(trace_bytes), traces.trace_format(trace_name))
+                with telemetry.stage("scheduling.algorithm"):
+                    result = scheduling.simulate(algorithm, workload.burst, workload.arrival, quantum=quantum,
+                                                 priority_level=workload.priority)
+                with telemetry.stage("scheduling.dataframe"):
+                    names = np.char.add("P", workload.pid.astype(str))
+                    rows = slice(0, TRACE_PREVIEW_ROWS)
+                    df = result.table.frame(rows, labels=TABLE_LABELS)
+                    df.insert(0, "Process", names[rows])
+
+                with telemetry.stage("scheduling.figure"):
+                    fig = gantt_figure(result.gantt, names, title, color)
+                with telemetry.stage("scheduling.serialize"):
+                    return scheduling.summarize(result), df, fig.to_json()
+
+            # Resume the last schedule kept in session state instead of simulating from t=0
+            def incremental_schedule(key, algorithm, burst_times, arrival_times, priority_levels):
+                previous = st.session_state.get(key)
+                with telemetry.stage("scheduling.algorithm"):
+                    if previous is not None and previous.algorithm == algorithm:
+                        result = scheduling.resimulate(previous, burst_times, arrival_times, quantum=quantum,
+                                                       priority_level=priority_levels)
+                    else:
+                        result = scheduling.simulate(algorithm, burst_times, arrival_times, quantum=quantum,
+                                                     priority_level=priority_levels)
+                st.session_state[key] = result
+                return result
+
+            if incremental:
+                title, color = chart_styles[scheduling_algo]
+                if source == "Manual Entry":
+                    priority_levels = priorities if scheduling_algo in scheduling.PRIORITY_ALGORITHMS else None
+                    result = incremental_schedule("manual_schedule", scheduling_algo, burst_times, arrival_times,
+                                                  priority_levels)
+                    with telemetry.stage("scheduling.dataframe"):
+                        df = result.table.frame(labels=TABLE_LABELS)
+                        df.insert(0, "Process", processes)
+                    with telemetry.stage("scheduling.figure"):
+                        fig = gantt_figure(result.gantt, processes, title, color)
+                    with telemetry.stage("scheduling.render"):
+                        st.subheader("📊 Process Scheduling Table")
+                        st.dataframe(df)
+                        st.plotly_chart(fig)
+                elif trace_file is not None:
+                    # Edits go to a session copy of the trace, so the upload itself stays untouched
+                    if st.session_state.get("trace_file_id") != trace_file.file_id:
+                        workload = traces.load_processes(io.BytesIO(trace_file.getvalue()), traces.trace_format(trace_file.name))
+                        st.session_state["trace_file_id"] = trace_file.file_id
+                        st.session_state["trace_columns"] = {name: np.array(getattr(workload, name))
+                                                             for name in ("burst", "arrival", "priority", "pid")}
+                        st.session_state.pop("trace_schedule", None)
+                    columns = st.session_state["trace_columns"]
+
+                    st.subheader("✏️ What-if Edit")
+                    if not len(columns["burst"]):
+                        st.info("The uploaded trace has no processes to edit.")
+                    else:
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            row = st.number_input("Process row:", min_value=0, max_value=len(columns["burst"]) - 1)
+                        with col2:
+                            new_burst = st.number_input("Burst Time:", min_value=0, value=int(columns["burst"][row]))
+                        with col3:
+                            new_arrival = st.number_input("Arrival Time:", min_value=0, value=int(columns["arrival"][row]))
+                        with col4:
+                            new_priority = st.number_input("Priority:", min_value=0, value=int(columns["priority"][row]))
+                        if st.button("Apply Edit"):
+                            columns["burst"][row] = new_burst
+                            columns["arrival"][row] = new_arrival
+                            columns["priority"][row] = new_priority
+
+                    result = incremental_schedule("trace_schedule", scheduling_algo, columns["burst"], columns["arrival"],
+                                                  columns["priority"])
+                    with telemetry.stage("scheduling.dataframe"):
+                        names = np.char.add("P", columns["pid"].astype(str))
+                        rows = slice(0, TRACE_PREVIEW_ROWS)
+                        summary = scheduling.summarize(result)
+                        df = result.table.frame(rows, labels=TABLE_LABELS)
+                        df.insert(0, "Process", names[rows])
+                    with telemetry.stage("scheduling.figure"):
+                        fig = gantt_figure(result.gantt, names, title, color)
+                    with telemetry.stage("scheduling.render"):
+                        st.subheader("📈 Trace Summary")
+                        st.dataframe(pd.DataFrame([summary]))
+                        st.subheader(f"📊 Process Scheduling Table (first {min(TRACE_PREVIEW_ROWS, summary['processes'])} processes)")
+                        st.dataframe(df)
+                        st.plotly_chart(fig)
+                else:
+                    st.warning("Upload a process trace to simulate.")
+
+            # Simulate Button
+            elif st.button("Simulate"):
+                title, color = chart_styles[scheduling_algo]
+                if source == "Manual Entry":
+                    priority_levels = tuple(priorities) if scheduling_algo in scheduling.PRIORITY_ALGORITHMS else None
+                    telemetry.count("cache_requests", cache="schedule_view")
+                    df, fig_json = schedule_view(scheduling_algo, quantum, tuple(processes), tuple(burst_times),
+                                                 tuple(arrival_times), priority_levels, title, color)
+                    with telemetry.stage("scheduling.render"):
+                        st.subheader("📊 Process Scheduling Table")
+                        st.dataframe(df)
+                        st.plotly_chart(pio.from_json(fig_json))
+                elif trace_file is not None:
+                    telemetry.count("cache_requests", cache="trace_schedule_view")
+                    summary, df, fig_json = trace_schedule_view(scheduling_algo, quantum, trace_file.getvalue(),
+                                                                trace_file.name, title, color)
+                    with telemetry.stage("scheduling.render"):
+                        st.subheader("📈 Trace Summary")
+                        st.dataframe(pd.DataFrame([summary]))
+                        st.subheader(f"📊 Process Scheduling Table (first {min(TRACE_PREVIEW_ROWS, summary['processes'])} processes)")
+                        st.dataframe(df)
+                        st.plotly_chart(pio.from_json(fig_json))
+                else:
+                    st.warning("Upload a process trace to simulate.")
+
+        elif mode == "Compare":
+            import plotly.graph_objects as go
+            from osplatform.sweep import sweep
+
+            # Sweep algorithms and Round Robin quanta over random workloads
+            compare_algos = st.multiselect("Algorithms to compare:", list(scheduling.ALGORITHMS), default=list(scheduling.ALGORITHMS))
+            quantum_range = st.slider("Round Robin quantum range:", min_value=1, max_value=64, value=(1, 16))
+            col1, col2 = st.columns(2)
+            with col1:
+                num_workloads = st.number_input("Random workloads (seeds):", min_value=1, max_value=100, value=5)
+            with col2:
+                workload_size = st.number_input("Processes per workload:", min_value=1, max_value=100000, value=200)
+            metric = st.selectbox("Metric to plot:", ["avg_waiting", "avg_turnaround", "avg_response", "throughput", "context_switches"])
+
+            # Run the sweep and build the summary table and chart (memoized on the inputs)
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def compare_view(algorithms, quanta, num_workloads, workload_size, metric):
+                telemetry.count("cache_misses", cache="compare_view")
+                with telemetry.stage("scheduling.sweep"):
+                    workloads = {f"seed {seed}": random_workload(workload_size, seed=seed) for seed in range(num_workloads)}
+                    table = sweep(list(algorithms), list(quanta), workloads)
+                with telemetry.stage("scheduling.dataframe"):
+                    summary = table.groupby(["algorithm", "quantum"], dropna=False, sort=False).mean(numeric_only=True).reset_index()
+
+                # Quantum-dependent algorithms are lines; the rest are flat references
+                with telemetry.stage("scheduling.figure"):
+                    fig = go.Figure()
+                    for algo, rows in summary.groupby("algorithm", sort=False):
+                        if algo in scheduling.QUANTUM_ALGORITHMS:
+                            fig.add_trace(go.Scatter(x=rows["quantum"], y=rows[metric], mode='lines+markers', name=algo))
+                        else:
+                            fig.add_trace(go.Scatter(x=[quanta[0], quanta[-1]], y=[rows[metric].iloc[0]] * 2,
+                                                     mode='lines', line=dict(dash='dash'), name=algo))
+                    fig.update_layout(
+                        title=f"{metric} by Algorithm and Quantum",
+                        xaxis_title="Round Robin Quantum",
+                        yaxis_title=metric
+                    )
+                with telemetry.stage("scheduling.serialize"):
+                    return summary, fig.to_json()
+
+            if st.button("Run Comparison") and compare_algos:
+                quanta = tuple(range(quantum_range[0], quantum_range[1] + 1))
+                telemetry.count("cache_requests", cache="compare_view")
+                summary, fig_json = compare_view(tuple(compare_algos), quanta, num_workloads, workload_size, metric)
+                with telemetry.stage("scheduling.render"):
+                    st.subheader("📊 Comparison Table (mean over workloads)")
+                    st.dataframe(summary)
+                    st.plotly_chart(pio.from_json(fig_json))
+
+        elif mode == "Multi-core":
+            from osplatform import multicore
+
+            # Schedule a random workload on several cores through the discrete-event engine
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                mc_policy = st.selectbox("Policy:", list(multicore.POLICIES), index=2)
+                mc_topology = st.radio("Ready Queues:", list(multicore.TOPOLOGIES), horizontal=True,
+                                       help="One shared queue, or one queue per core with work stealing")
+                mc_cpus = st.number_input("CPUs:", min_value=1, max_value=256, value=4)
+            with col2:
+                mc_processes = st.number_input("Processes:", min_value=1, max_value=1_000_000, value=200)
+                mc_seed = st.number_input("Workload Seed:", min_value=0, value=0)
+                mc_quantum = st.number_input("Base Quantum:", min_value=1, max_value=1000, value=2,
+                                             help="Round Robin quantum; MLFQ doubles it at every level down")
+            with col3:
+                mc_levels = st.number_input("MLFQ Levels:", min_value=1, max_value=8, value=3)
+                mc_boost = st.number_input("MLFQ Boost Period (0 = off):", min_value=0, value=0)
+                mc_switch = st.number_input("Context Switch Cost:", min_value=0, max_value=100, value=0)
+                mc_migration = st.number_input("Migration Cost:", min_value=0, max_value=100, value=0)
+
+            # Column headers for the scheduling table, in scheduling.RESULT_COLUMNS order
+            TABLE_LABELS = ["Arrival Time (AT)", "Burst Time (BT)", "Completion Time (CT)",
+                            "Turnaround Time (TAT)", "Waiting Time (WT)"]
+
+            # Simulate and build the summary, table preview and per-core Gantt chart (memoized on the inputs)
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def multicore_view(policy, topology, cpus, num_processes, seed, quantum, levels, boost, switch_cost,
+                               migration_cost):
+                telemetry.count("cache_misses", cache="multicore_view")
+                # Arrivals are spread so that all cores see both queueing and idle gaps
+                workload = random_workload(num_processes, seed=seed, arrival_span=max(1, num_processes * 21 // (4 * cpus)))
+                with telemetry.stage("scheduling.algorithm"):
+                    result = multicore.simulate(workload.burst, workload.arrival, policy, cpus=cpus, topology=topology,
+                                                quantum=quantum, levels=levels, boost=boost or None,
+                                                switch_cost=switch_cost, migration_cost=migration_cost)
+                with telemetry.stage("scheduling.dataframe"):
+                    names = np.char.add("P", np.arange(1, num_processes + 1).astype(str))
+                    rows = slice(0, TRACE_PREVIEW_ROWS)
+                    df = result.table.frame(rows, labels=TABLE_LABELS)
+                    df.insert(0, "Process", names[rows])
+                    summary = scheduling.summarize(result)
+                    summary["switch_time"] = result.switch_time
+
+                with telemetry.stage("scheduling.figure"):
+                    fig = gantt_figure(result.gantt, names, f"{policy} on {cpus} CPUs ({topology} queues)", 'steelblue')
+                with telemetry.stage("scheduling.serialize"):
+                    return summary, df, fig.to_json()
+
+            if st.button("Run Multi-core Simulation"):
+                telemetry.count("cache_requests", cache="multicore_view")
+                summary, df, fig_json = multicore_view(mc_policy, mc_topology, mc_cpus, mc_processes, mc_seed, mc_quantum,
+                                                       mc_levels, mc_boost, mc_switch, mc_migration)
+                with telemetry.stage("scheduling.render"):
+                    st.subheader("📈 Multi-core Summary")
+                    st.dataframe(pd.DataFrame([summary]))
+                    st.subheader(f"📊 Process Scheduling Table (first {min(TRACE_PREVIEW_ROWS, summary['processes'])} processes)")
+                    st.dataframe(df)
+                    st.plotly_chart(pio.from_json(fig_json))
+
+    # Memory Management (3D Blocks)
+    elif option == "Memory Management":
+        # Page-specific modules are imported here so other pages never load them
+        import pandas as pd
+
+        st.subheader("💾 Memory Allocation Strategies Visualization")
+
+        mode = st.radio("Mode:", ["Static Allocation", "Dynamic Trace", "Paging"], horizontal=True)
+
+        if mode == "Static Allocation":
+            import io
+            import numpy as np
+            from osplatform import allocation as allocation_engine
+            from osplatform.charts import allocation_figure
+
+            # Input for Memory Blocks and Processes
+            col1, col2 = st.columns(2)
+            with col1:
+                block_input = st.text_input("Enter Memory Blocks (comma-separated)", "100, 500, 200, 300, 600")
+                blocks = [int(x.strip()) for x in block_input.split(",") if x.strip().isdigit()]
+
+            with col2:
+                process_input = st.text_input("Enter Process Sizes (comma-separated)", "212, 417, 112, 426")
+                processes = [int(x.strip()) for x in process_input.split(",") if x.strip().isdigit()]
+
+            strategy = st.radio("Select Allocation Strategy", list(allocation_engine.STRATEGIES))
+            incremental = st.toggle("Incremental mode", help="Re-allocate on every edit, keeping every placement "
+                                                             "before the first request the edit can affect")
+
+            # Build the result table and chart image of one allocation
+            def allocation_output(result):
+                # Result Table
+                with telemetry.stage("memory.dataframe"):
+                    allocation = result.allocation.tolist()
+                    df = pd.DataFrame({
+                        "Process No": np.arange(1, len(result) + 1),
+                        "Process Size": result.processes,
+                        "Block Allocated": [f"Block {j + 1}" if j != -1 else "Not Allocated" for j in allocation]
+                    })
+
+                # Visualization
+                with telemetry.stage("memory.figure"):
+                    fig = allocation_figure(result)
+
+                with telemetry.stage("memory.serialize"):
+                    image = io.BytesIO()
+                    fig.savefig(image, format="png", bbox_inches="tight")
+                return df, image.getvalue()
+
+            # Allocate and build the result table and chart image (memoized on the inputs)
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def allocation_view(strategy, blocks, processes):
+                telemetry.count("cache_misses", cache="allocation_view")
+                with telemetry.stage("memory.algorithm"):
+                    result = allocation_engine.allocate(strategy, blocks, processes)
+                return allocation_output(result)
+
+            # Resume the last layout kept in session state instead of placing every process again
+            if incremental:
+                previous = st.session_state.get("memory_layout")
+                with telemetry.stage("memory.algorithm"):
+                    if previous is not None and previous.strategy == strategy:
+                        result = allocation_engine.reallocate(previous, blocks, processes)
+                    else:
+                        result = allocation_engine.allocate(strategy, blocks, processes)
+                st.session_state["memory_layout"] = result
+                df, chart_png = allocation_output(result)
+
+                with telemetry.stage("memory.render"):
+                    st.subheader("📝 Allocation Result")
+                    st.dataframe(df)
+
+                    st.subheader("📊 Memory Allocation Chart")
+                    st.image(chart_png)
+
+            # Simulate Allocation
+            elif st.button("Simulate Allocation"):
+                telemetry.count("cache_requests", cache="allocation_view")
+                df, chart_png = allocation_view(strategy, tuple(blocks), tuple(processes))
+
+                with telemetry.stage("memory.render"):
+                    st.subheader("📝 Allocation Result")
+                    st.dataframe(df)
+
+                    st.subheader("📊 Memory Allocation Chart")
+                    st.image(chart_png)
+
+        elif mode == "Dynamic Trace":
+            import io
+            import plotly.graph_objects as go
+            import plotly.io as pio
+            from osplatform import dynamic_allocation, traces
+            from osplatform.workloads import random_trace
+
+            # Replay an allocate/free trace against one contiguous memory
+            source = st.radio("Trace Source:", ["Random Trace", "Upload Trace"], horizontal=True)
+            capacity = st.number_input("Memory Size (units):", min_value=1, max_value=1 << 30, value=1 << 16)
+            if source == "Random Trace":
+                col1, col2 = st.columns(2)
+                with col1:
+                    num_events = st.number_input("Trace Events:", min_value=1, max_value=10_000_000, value=100_000)
+                    trace_seed = st.number_input("Trace Seed:", min_value=0, value=0)
+                with col2:
+                    max_request = st.number_input("Largest Request Size:", min_value=1, max_value=1 << 20, value=512)
+                    free_probability = st.slider("Probability an event frees memory:", min_value=0.0, max_value=1.0, value=0.5)
+            else:
+                trace_file = st.file_uploader("Memory trace with op (alloc/free), id and size columns",
+                                              type=["csv", "parquet", "pq", "bin"])
+            trace_strategy = st.selectbox("Allocation Strategy:", list(dynamic_allocation.STRATEGIES))
+
+            # Replay the trace and build the metric charts (memoized on the inputs)
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def trace_view(strategy, capacity, random_args=None, trace_bytes=None, trace_name=None):
+                telemetry.count("cache_misses", cache="trace_view")
+                if trace_bytes is None:
+                    num_events, seed, max_request, free_probability = random_args
+                    events = random_trace(num_events, seed=seed, max_size=max_request, free_probability=free_probability)
+                else:
+                    events = traces.iter_memory_events(io.BytesIO(trace_bytes), traces.trace_format(trace_name))
+                with telemetry.stage("memory.replay"):
+                    metrics = dynamic_allocation.replay(events, capacity, strategy)
+                totals = {
+                    "Events": metrics.events,
+                    "Allocations": metrics.allocations,
+                    "Failed Allocations": metrics.failures,
+                    "Frees": metrics.frees,
                 }
 
-                // Start simulation
-                initializeProcesses();
-                animate();
-            </script>
-        </body>
-        </html>
-        """
-
-        # Write HTML to a temporary file
-        with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html') as f:
-            f.write(html_code)
-            temp_file_name = f.name
-
-        # Open it in the default web browser
-        webbrowser.open(f'file://{temp_file_name}')
-
-    # Button to launch the VR Simulation
-    if st.button("Launch VR OS Simulation"):
-        open_vr_scene()
-
-    # Interactive Memory Blocks 3D
-    st.subheader("🌐 Interactive Memory Allocation in VR")
-    st.write("In this section, explore how memory is allocated using different algorithms (First-Fit, Best-Fit, Worst-Fit).")
-    st.write("Imagine a 3D grid where each memory block and process interacts dynamically in the AR/VR space.")
+                with telemetry.stage("memory.figure"):
+                    ratios = go.Figure()
+                    ratios.add_trace(go.Scatter(x=metrics.step, y=metrics.fragmentation, mode='lines', name="External Fragmentation"))
+                    ratios.add_trace(go.Scatter(x=metrics.step, y=metrics.failure_rate, mode='lines', name="Allocation Failure Rate"))
+                    ratios.update_layout(title=f"{strategy}: Fragmentation and Failure Rate", xaxis_title="Event", yaxis_title="Ratio")
+
+                    space = go.Figure()
+                    space.add_trace(go.Scatter(x=metrics.step, y=metrics.used, mode='lines', name="Used Memory"))
+                    space.add_trace(go.Scatter(x=metrics.step, y=metrics.largest_hole, mode='lines', name="Largest Free Hole"))
+                    space.update_layout(title=f"{strategy}: Memory Usage", xaxis_title="Event", yaxis_title="Units")
+                with telemetry.stage("memory.serialize"):
+                    return totals, ratios.to_json(), space.to_json()
+
+            if st.button("Replay Trace"):
+                telemetry.count("cache_requests", cache="trace_view")
+                if source == "Random Trace":
+                    view = trace_view(trace_strategy, capacity, (num_events, trace_seed, max_request, free_probability))
+                elif trace_file is not None:
+                    view = trace_view(trace_strategy, capacity, trace_bytes=trace_file.getvalue(), trace_name=trace_file.name)
+                else:
+                    view = None
+                    st.warning("Upload a memory trace to replay.")
+                if view is not None:
+                    totals, ratios_json, space_json = view
+                    with telemetry.stage("memory.render"):
+                        st.subheader("📝 Trace Summary")
+                        st.dataframe(pd.DataFrame([totals]))
+                        st.plotly_chart(pio.from_json(ratios_json))
+                        st.plotly_chart(pio.from_json(space_json))
+
+        elif mode == "Paging":
+            import io
+            import numpy as np
+            import plotly.graph_objects as go
+            import plotly.io as pio
+            from osplatform import paging, traces
+            from osplatform.workloads import random_references
+
+            # Run a page-reference string through each replacement algorithm over a range of frame counts
+            source = st.radio("Reference Source:", ["Reference String", "Random References", "Upload Trace"], horizontal=True)
+            if source == "Reference String":
+                reference_input = st.text_input("Enter Page References (comma-separated)",
+                                                "7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1")
+                references = [int(x.strip()) for x in reference_input.split(",") if x.strip().isdigit()]
+            elif source == "Random References":
+                col1, col2 = st.columns(2)
+                with col1:
+                    num_references = st.number_input("References:", min_value=1, max_value=10_000_000, value=1_000_000)
+                    reference_seed = st.number_input("Reference Seed:", min_value=0, value=0)
+                with col2:
+                    num_pages = st.number_input("Distinct Pages:", min_value=1, max_value=1 << 20, value=256)
+                    working_set = st.number_input("Working Set Size:", min_value=1, max_value=1 << 20, value=16)
+            else:
+                page_file = st.file_uploader("Page-reference trace with a page column", type=["csv", "parquet", "pq", "bin"])
+            page_algorithms = st.multiselect("Replacement Algorithms:", list(paging.ALGORITHMS), default=["FIFO", "LRU", "OPT"])
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                min_frames = st.number_input("Fewest Frames:", min_value=1, max_value=1 << 16, value=1)
+            with col2:
+                max_frames = st.number_input("Most Frames:", min_value=1, max_value=1 << 16, value=8)
+            with col3:
+                frame_step = st.number_input("Frame Step:", min_value=1, max_value=1 << 16, value=1)
+            frame_counts = tuple(range(min_frames, max(min_frames, max_frames) + 1, frame_step))
+            if source == "Reference String":
+                table_frames = st.number_input("Frames for the Step Table:", min_value=1, max_value=1 << 16, value=3)
+
+            # Simulate every algorithm and build the fault-rate and hit-ratio charts (memoized on the inputs)
+            @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+            def paging_view(algorithms, frame_counts, references=None, random_args=None, trace_bytes=None, trace_name=None):
+                telemetry.count("cache_misses", cache="paging_view")
+                with telemetry.stage("memory.load_trace"):
+                    if references is not None:
+                        references = np.asarray(references, dtype=np.int64)
+                    elif trace_bytes is None:
+                        num_references, seed, num_pages, working_set = random_args
+                        references = random_references(num_references, num_pages, seed=seed, working_set=working_set)
+                    else:
+                        references = traces.load_references(io.BytesIO(trace_bytes), traces.trace_format(trace_name))
+                with telemetry.stage("memory.algorithm"):
+                    curves = [paging.fault_curve(algorithm, references, frame_counts) for algorithm in algorithms]
+
+                with telemetry.stage("memory.dataframe"):
+                    rows = [{
+                        "Algorithm": curve.algorithm,
+                        "Frames": frames,
+                        "Page Faults": faults,
+                        "Fault Rate": rate,
+                        "Hit Ratio": 1 - rate,
+                    } for curve in curves for frames, faults, rate in zip(curve.frames.tolist(), curve.faults.tolist(),
+                                                                           curve.fault_rate.tolist())]
+                    anomalies = {curve.algorithm: paging.belady_anomalies(curve) for curve in curves}
+
+                with telemetry.stage("memory.figure"):
+                    rates = go.Figure()
+                    hits = go.Figure()
+                    for curve in curves:
+                        rates.add_trace(go.Scatter(x=curve.frames, y=curve.fault_rate, mode='lines+markers', name=curve.algorithm))
+                        hits.add_trace(go.Scatter(x=curve.frames, y=curve.hit_ratio, mode='lines+markers', name=curve.algorithm))
+                        # Mark each frame count that faults more than the one before it
+                        rises = [curve.frames.tolist().index(more) for _, more in anomalies[curve.algorithm]]
+                        if rises:
+                            rates.add_trace(go.Scatter(x=curve.frames[rises], y=curve.fault_rate[rises], mode='markers',
+                                                       marker=dict(symbol='x', size=12, color='red'),
+                                                       name=f"{curve.algorithm}: Belady's anomaly"))
+                    rates.update_layout(title=f"Page Fault Rate ({len(references):,} references)",
+                                        xaxis_title="Frames", yaxis_title="Fault Rate")
+                    hits.update_layout(title="Hit Ratio", xaxis_title="Frames", yaxis_title="Hit Ratio")
+                with telemetry.stage("memory.serialize"):
+                    return rows, anomalies, rates.to_json(), hits.to_json()
+
+            # Per-reference hits, faults and evictions of one small run
+            def step_table(algorithm, references, frames):
+                result = paging.simulate(algorithm, references, frames)
+                return pd.DataFrame({
+                    "Reference": references,
+                    "Result": np.where(result.fault, "Fault", "Hit"),
+                    "Evicted": [str(page) if page >= 0 else "" for page in result.victim.tolist()],
+                })
+
+            if st.button("Simulate Paging"):
+                telemetry.count("cache_requests", cache="paging_view")
+                if not page_algorithms:
+                    view = None
+                    st.warning("Select at least one replacement algorithm.")
+                elif source == "Reference String":
+                    view = paging_view(tuple(page_algorithms), frame_counts, references=tuple(references))
+                elif source == "Random References":
+                    view = paging_view(tuple(page_algorithms), frame_counts,
+                                       random_args=(num_references, reference_seed, num_pages, working_set))
+                elif page_file is not None:
+                    view = paging_view(tuple(page_algorithms), frame_counts, trace_bytes=page_file.getvalue(),
+                                       trace_name=page_file.name)
+                else:
+                    view = None
+                    st.warning("Upload a page-reference trace to simulate.")
+                if view is not None:
+                    rows, anomalies, rates_json, hits_json = view
+                    with telemetry.stage("memory.render"):
+                        st.subheader("📝 Page Faults")
+                        st.dataframe(pd.DataFrame(rows))
+                        for algorithm, pairs in anomalies.items():
+                            for frames, more_frames in pairs:
+                                st.info(f"Belady's anomaly: {algorithm} faults more with {more_frames} frames than with {frames}.")
+                        st.plotly_chart(pio.from_json(rates_json))
+                        st.plotly_chart(pio.from_json(hits_json))
+
+                        if source == "Reference String" and references:
+                            st.subheader(f"🔍 Step by Step with {table_frames} Frames")
+                            tabs = st.tabs(page_algorithms)
+                            for tab, algorithm in zip(tabs, page_algorithms):
+                                with tab:
+                                    st.dataframe(step_table(algorithm, references, table_frames))
+
+    # AR/VR 3D Visualization for OS Concepts
+    elif option == "AR/VR Visualization":
+        st.subheader("🕶 AR/VR 3D Process and Memory Management Visualization")
+
+        import streamlit.components.v1 as components
+        from osplatform import random_workload, scheduling, scenes
+
+        asset_base = asset_base_url()
+
+        # Web-Based VR (Three.js for interactive VR experience), driven by one simulated workload
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            vr_algo = st.selectbox("Scene Algorithm:", list(scheduling.ALGORITHMS))
+        with col2:
+            vr_processes = st.number_input("Scene Processes:", min_value=1, max_value=10000, value=5)
+        with col3:
+            vr_seed = st.number_input("Scene Seed:", min_value=0, value=0)
+
+        # The scene's workload and schedule, shared by the embedded scene and the live stream
+        def vr_schedule(algorithm, num_processes, seed):
+            workload = random_workload(num_processes, seed=seed)
+            return scheduling.simulate(algorithm, workload.burst, workload.arrival, quantum=4,
+                                       priority_level=workload.priority)
+
+        # The scene page is a static asset read once per process; each launch only adds a JSON payload
+        @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+        def vr_scene(algorithm, num_processes, seed, asset_base):
+            result = vr_schedule(algorithm, num_processes, seed)
+            payload = scenes.schedule_payload(result, [f"P{i+1}" for i in range(num_processes)])
+            url = scenes.static_url("vr_scene.html", payload) if len(payload) <= scenes.MAX_FRAGMENT else None
+            return scenes.embed("vr_scene.html", payload, asset_base), url
+
+        # Button to launch the VR Simulation
+        if st.button("Launch VR OS Simulation"):
+            scene_html, scene_url = vr_scene(vr_algo, vr_processes, vr_seed, asset_base)
+            components.html(scene_html, height=600)
+            if scene_url:
+                st.markdown(f"[Open the scene in a new tab]({scene_url})")
+
+        # Live Classroom Stream: the instructor's simulation runs once, here, and every
+        # connected scene follows its clock over a WebSocket instead of simulating itself
+        st.subheader("📡 Live Classroom Stream")
+        from urllib.parse import quote
+        from osplatform import dynamic_allocation, streaming
+        from osplatform.workloads import random_trace
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            stream_session = st.text_input("Session Name:", "class")
+        with col2:
+            stream_content = st.selectbox("Stream:", ["Scene Schedule", "Memory Trace"])
+        with col3:
+            stream_speed = st.select_slider("Stream Speed:", options=[0.25, 0.5, 1, 2, 4, 16, 64, 256], value=1)
+        if stream_content == "Memory Trace":
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                stream_strategy = st.selectbox("Stream Allocation Strategy:", list(dynamic_allocation.STRATEGIES))
+            with col2:
+                stream_capacity = st.number_input("Stream Memory Size (units):", min_value=1, max_value=1 << 30, value=1 << 12)
+            with col3:
+                stream_events = st.number_input("Stream Trace Events:", min_value=1, max_value=1_000_000, value=2000)
+
+        col1, col2, col3, col4 = st.columns(4)
+        broadcast_clicked = col1.button("Broadcast")
+        play_clicked = col2.button("Play")
+        pause_clicked = col3.button("Pause")
+        restart_clicked = col4.button("Restart")
+        if broadcast_clicked or play_clicked or pause_clicked or restart_clicked:
+            try:
+                hub = streaming.serve(STREAM_PORT)
+            except OSError as exc:
+                hub = None
+                st.warning(f"Stream server not started: {exc}")
+            if hub is not None and broadcast_clicked:
+                if stream_content == "Scene Schedule":
+                    result = vr_schedule(vr_algo, vr_processes, vr_seed)
+                    broadcast = streaming.schedule_broadcast(result, [f"P{i+1}" for i in range(vr_processes)],
+                                                             speed=stream_speed)
+                else:
+                    events = random_trace(stream_events, seed=vr_seed, max_size=max(1, stream_capacity // 16))
+                    broadcast = streaming.memory_broadcast(events, stream_capacity, stream_strategy, speed=stream_speed)
+                hub.publish(stream_session, broadcast)
+            elif hub is not None:
+                hub.control(stream_session, playing=not pause_clicked, speed=stream_speed,
+                            seek=0.0 if restart_clicked else None)
+
+        hub = streaming.running()
+        status = hub.status(stream_session) if hub is not None else None
+        if status is not None:
+            # Viewers reach the stream on the host they loaded the app from, unless a public URL is configured
+            host = (st.context.headers.get("Host") or "localhost").rsplit(":", 1)[0]
+            stream_url = f"{STREAM_URL or f'ws://{host}:{STREAM_PORT}'}/{quote(stream_session)}"
+            st.write(f"Clock {status['clock']:.1f} / {status['end']:.1f}, "
+                     f"{'playing' if status['playing'] else 'paused'} at {status['speed']}x, "
+                     f"{status['viewers']} viewer(s)")
+            viewer_payload = scenes.stream_payload(stream_url)
+            st.markdown(f"[Open the live scene in a new tab]({scenes.static_url('vr_scene.html', viewer_payload)})")
+            if st.toggle("Watch the live stream here"):
+                components.html(scenes.embed("vr_scene.html", viewer_payload, asset_base), height=600)
+
+        # Interactive Memory Blocks 3D: a WebGL grid with one tower per block, replaying the placements step by step
+        st.subheader("🌐 Interactive Memory Allocation in VR")
+        st.write("Explore how First-Fit, Best-Fit and Worst-Fit place processes into memory blocks, one step at a time.")
+        import numpy as np
+        from osplatform import allocation as allocation_engine
+        from osplatform import workloads
+
+        grid_source = st.radio("Grid Layout:", ["Enter Sizes", "Random"], horizontal=True)
+        col1, col2 = st.columns(2)
+        if grid_source == "Enter Sizes":
+            with col1:
+                grid_block_input = st.text_input("Grid Memory Blocks (comma-separated)", "100, 500, 200, 300, 600")
+            with col2:
+                grid_process_input = st.text_input("Grid Process Sizes (comma-separated)", "212, 417, 112, 426")
+            grid_blocks = np.array([int(x.strip()) for x in grid_block_input.split(",") if x.strip().isdigit()], dtype=np.int64)
+            grid_processes = np.array([int(x.strip()) for x in grid_process_input.split(",") if x.strip().isdigit()],
+                                      dtype=np.int64)
+        else:
+            with col1:
+                grid_block_count = st.number_input("Grid Blocks:", min_value=1, max_value=200_000, value=10_000)
+                grid_distribution = st.selectbox("Size Distribution:", list(workloads.BLOCK_DISTRIBUTIONS))
+            with col2:
+                grid_process_count = st.number_input("Grid Processes:", min_value=1, max_value=200_000, value=10_000)
+                grid_seed = st.number_input("Grid Seed:", min_value=0, value=0)
+            grid_blocks = workloads.block_sizes(grid_block_count, grid_distribution, seed=grid_seed)
+            grid_processes = workloads.block_sizes(grid_process_count, grid_distribution, seed=grid_seed + 1, mean=256)
+        grid_strategy = st.selectbox("Grid Allocation Strategy:", list(allocation_engine.STRATEGIES))
+
+        # The placement travels to the browser as typed arrays; the page itself is the same static asset every run
+        @st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL, show_spinner=False)
+        def memory_grid(strategy, blocks, processes, asset_base):
+            payload = scenes.allocation_payload(allocation_engine.allocate(strategy, blocks, processes))
+            url = scenes.static_url("memory_grid.html", payload) if len(payload) <= scenes.MAX_FRAGMENT else None
+            return scenes.embed("memory_grid.html", payload, asset_base), url
+
+        if st.button("Launch Memory Grid"):
+            if len(grid_blocks) == 0:
+                st.warning("Enter at least one memory block.")
+            else:
+                grid_html, grid_url = memory_grid(grid_strategy, grid_blocks, grid_processes, asset_base)
+                components.html(grid_html, height=600)
+                if grid_url:
+                    st.markdown(f"[Open the grid in a new tab]({grid_url})")
+
+# Profiling Panel, rendered after the page so its stages from this run are included
+if show_profiling:
+    import pandas as pd
+
+    with st.sidebar:
+        st.subheader("⏱ Profiling")
+        stages = telemetry.REGISTRY.snapshot()
+        if stages:
+            st.dataframe(pd.DataFrame(stages).set_index("stage").round(2))
+        caches = telemetry.REGISTRY.caches()
+        if caches:
+            st.dataframe(pd.DataFrame([{"Cache": name, "Requests": requests, "Misses": misses, "Hit Rate": hit_rate}
+                                       for name, (requests, misses, hit_rate) in caches.items()]).set_index("Cache"))
+        if profile_report is not None:
+            with st.expander(f"{profiler} report", expanded=True):
+                st.code(profile_report["text"], language=None)
+            st.download_button("Download profile", profile_report["data"],
+                               file_name="page.prof" if profiler == "cProfile" else "page.html")
+        st.download_button("Download metrics (Prometheus text)", telemetry.REGISTRY.prometheus_text(),
+                           file_name="metrics.prom", mime="text/plain")
+        if st.button("Reset metrics"):
+            telemetry.REGISTRY.reset()
@@ -0,0 +1,241 @@
+"""Scaling benchmarks for the scheduling, allocation and paging engines.
+
+Every scheduler (over each burst distribution, with Poisson arrivals),
+every multi-core policy and queue topology (on ``MULTICORE_CPUS`` cores),
+every static allocation strategy, every dynamic-trace strategy and every
+page-replacement policy (at ``PAGING_FRAMES`` frames, plus the LRU fault
+curve up to that many) is timed at sizes from 10 up to ``--max-size``
+items.  Each point records the best wall time over a few repeats,
+throughput in items per second and the peak traced memory
+(``tracemalloc``, measured in a separate run so it does not skew the
+timing).  Per benchmark, the empirical complexity slope is the
+least-squares fit of log(time) against log(n) over sizes of at least 1000.
+
+Results are written as JSON; pass an earlier file with ``--compare`` to
+flag regressions::
+
+    python benchmarks/engines.py --output bench.json
+    python benchmarks/engines.py --compare bench.json --output bench-new.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from osplatform import allocation, dynamic_allocation, multicore, paging, scheduling, workloads  # noqa: E402
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+# Larger sizes of a benchmark are skipped once one run takes longer than this.
+BUDGET_SECONDS = 10.0
+# Repeat small runs until this much time has been spent, keeping the best.
+MIN_TIMING_SECONDS = 0.2
+MAX_REPEATS = 5
+# A point counts as a regression when it is this much slower than before.
+REGRESSION_RATIO = 1.25
+# Cores in the multi-core benchmarks; arrivals are compressed to keep them all busy.
+MULTICORE_CPUS = 64
+# Frames for the page-replacement benchmarks, over a few thousand distinct pages.
+PAGING_FRAMES = 256
+PAGING_PAGES = 4096
+
+
+def scheduling_cases():
+    for distribution in workloads.BURST_DISTRIBUTIONS:
+        for algorithm in scheduling.ALGORITHMS:
+            def case(n, algorithm=algorithm, distribution=distribution):
+                workload = workloads.synthetic_workload(n, distribution, seed=n)
+                return lambda: scheduling.simulate(algorithm, workload.burst, workload.arrival,
+                                                   quantum=4, priority_level=workload.priority)
+            yield f"scheduling/{algorithm}/{distribution}", case
+
+
+def multicore_cases():
+    for policy in multicore.POLICIES:
+        for topology in multicore.TOPOLOGIES:
+            def case(n, policy=policy, topology=topology):
+                workload = workloads.synthetic_workload(n, "heavy-tailed", seed=n)
+                arrival = workload.arrival // MULTICORE_CPUS
+                return lambda: multicore.simulate(workload.burst, arrival, policy, cpus=MULTICORE_CPUS,
+                                                  topology=topology, quantum=4, switch_cost=1)
+            yield f"multicore/{policy}/{topology}", case
+
+
+def allocation_cases():
+    for distribution in workloads.BLOCK_DISTRIBUTIONS:
+        for strategy in allocation.STRATEGIES:
+            def case(n, strategy=strategy, distribution=distribution):
+                blocks = workloads.block_sizes(n, distribution, seed=n)
+                requests = workloads.block_sizes(n, distribution, seed=n + 1, mean=256)
+                return lambda: allocation.allocate(strategy, blocks, requests)
+            yield f"allocation/{strategy}/{distribution}", case
+
+
+def trace_cases():
+    for strategy in dynamic_allocation.STRATEGIES:
+        def case(n, strategy=strategy):
+            events = list(workloads.random_trace(n, seed=n, max_size=512, free_probability=0.5))
+            return lambda: dynamic_allocation.replay(iter(events), 1 << 20, strategy)
+        yield f"dynamic/{strategy}", case
+
+
+def paging_cases():
+    for algorithm in paging.ALGORITHMS:
+        def case(n, algorithm=algorithm):
+            references = workloads.random_references(n, PAGING_PAGES, seed=n, working_set=PAGING_FRAMES // 2)
+            return lambda: paging.simulate(algorithm, references, PAGING_FRAMES)
+        yield f"paging/{algorithm}", case
+
+    def curve(n):
+        references = workloads.random_references(n, PAGING_PAGES, seed=n, working_set=PAGING_FRAMES // 2)
+        return lambda: paging.fault_curve("LRU", references, range(1, PAGING_FRAMES + 1))
+    yield "paging/LRU-curve", curve
+
+
+CASES = {
+    "scheduling": scheduling_cases,
+    "multicore": multicore_cases,
+    "allocation": allocation_cases,
+    "dynamic": trace_cases,
+    "paging": paging_cases,
+}
+
+
+def time_run(run):
+    best = float("inf")
+    spent = 0.0
+    for _ in range(MAX_REPEATS):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= MIN_TIMING_SECONDS:
+            break
+    return best
+
+
+def peak_memory(run):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def complexity_slope(points):
+    """Slope of log(seconds) against log(n) over points with ``n >= 1000``."""
+    usable = [(n, t) for n, t in points if n >= 1000 and t > 0]
+    if len(usable) < 2:
+        return None
+    n, t = np.log(np.array(usable)).T
+    return round(float(np.polyfit(n, t, 1)[0]), 3)
+
+
+def run_benchmarks(groups, sizes, budget, trace_memory=True, match=None):
+    results = []
+    slopes = {}
+    for group in groups:
+        for name, case in CASES[group]():
+            if match and match not in name:
+                continue
+            points = []
+            for n in sizes:
+                run = case(n)
+                seconds = time_run(run)
+                row = {
+                    "benchmark": name,
+                    "n": n,
+                    "seconds": seconds,
+                    "throughput": n / seconds if seconds > 0 else None,
+                }
+                if trace_memory:
+                    row["peak_bytes"] = peak_memory(run)
+                results.append(row)
+                points.append((n, seconds))
+                print(f"{name:<52} n={n:<9} {seconds * 1e3:>10.2f} ms  {row['throughput'] or 0:>12,.0f} items/s",
+                      flush=True)
+                if seconds > budget:
+                    break
+            slopes[name] = complexity_slope(points)
+    return results, slopes
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(previous, current, ratio=REGRESSION_RATIO):
+    """Return ``(benchmark, n, old_seconds, new_seconds)`` for every regression."""
+    before = {(row["benchmark"], row["n"]): row["seconds"] for row in previous["results"]}
+    regressions = []
+    for row in current["results"]:
+        old = before.get((row["benchmark"], row["n"]))
+        if old and row["seconds"] > old * ratio:
+            regressions.append((row["benchmark"], row["n"], old, row["seconds"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--budget", type=float, default=BUDGET_SECONDS,
+                        help="skip larger sizes once a run exceeds this many seconds")
+    parser.add_argument("--match", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc runs")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="earlier JSON results to check for regressions")
+    args = parser.parse_args(argv)
+
+    sizes = [n for n in SIZES if n <= args.max_size]
+    results, slopes = run_benchmarks(args.groups, sizes, args.budget, not args.no_memory, args.match)
+    report = {"meta": metadata(), "results": results, "slopes": slopes}
+
+    print("\nEmpirical complexity (slope of log time vs log n):")
+    for name, slope in slopes.items():
+        print(f"  {name:<52} {slope if slope is not None else '-'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        regressions = compare(previous, report)
+        for name, n, old, new in regressions:
+            print(f"REGRESSION {name} n={n}: {old * 1e3:.2f} ms -> {new * 1e3:.2f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Import-time report for every page of app.py.
+
+Each page is rendered once in a fresh interpreter started with
+``python -X importtime`` (through Streamlit's ``AppTest`` harness), and the
+import log is summarised: total import time, time on top of the bare
+harness, which heavy libraries the page pulled in, and the slowest
+top-level imports.  Run from the repository root::
+
+    python benchmarks/import_time.py --output import_time.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+PAGES = ["Home", "Process Scheduling", "Memory Management", "AR/VR Visualization"]
+
+# Libraries whose presence on a page is worth flagging in the report.
+HEAVY_MODULES = [
+    "numpy", "pandas", "matplotlib", "plotly", "plotly.figure_factory",
+    "vispy", "osplatform.sweep", "concurrent.futures.process",
+]
+
+_CHILD = """
+import sys
+from streamlit.testing.v1 import AppTest
+if sys.argv[1] != "-":
+    at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+    if sys.argv[2] != "Home":
+        at.sidebar.radio[0].set_value(sys.argv[2]).run()
+    if at.exception:
+        raise SystemExit(str(at.exception))
+"""
+
+
+def parse_importtime(log):
+    """Parse ``-X importtime`` stderr into ``(self_us, cumulative_us, depth, name)`` rows."""
+    rows = []
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        depth = (len(raw_name) - len(raw_name.lstrip(" ")) - 1) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, raw_name.strip()))
+    return rows
+
+
+def measure(page, top=10):
+    script = "-" if page is None else APP
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, script, page or "-"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{page or 'baseline'} failed:\n{proc.stderr[-2000:]}")
+    rows = parse_importtime(proc.stderr)
+    modules = {name for _, _, _, name in rows}
+    top_level = sorted((row for row in rows if row[2] == 0), key=lambda row: -row[1])
+    return {
+        "total_ms": round(sum(row[0] for row in rows) / 1000, 1),
+        "modules": len(modules),
+        "heavy": [name for name in HEAVY_MODULES if name in modules],
+        "slowest": [{"module": name, "cumulative_ms": round(cum / 1000, 1)}
+                    for _, cum, _, name in top_level[:top]],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--top", type=int, default=10, help="slowest top-level imports to list")
+    args = parser.parse_args(argv)
+
+    baseline = measure(None, args.top)
+    report = {"baseline": baseline, "pages": {}}
+    for page in PAGES:
+        result = measure(page, args.top)
+        result["over_baseline_ms"] = round(result["total_ms"] - baseline["total_ms"], 1)
+        report["pages"][page] = result
+        print(f"{page:<22} {result['total_ms']:>8.1f} ms  (+{result['over_baseline_ms']:.1f} ms over harness)"
+              f"  heavy: {', '.join(result['heavy']) or '-'}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Headless simulation engines behind the AR/VR OS Learning Platform.
+
+The engine names re-exported here are resolved on first access, so
+importing a light submodule such as ``osplatform.telemetry`` does not
+load numpy and every engine with it.
+"""
+
+import importlib
+
+# Re-exported name -> submodule that defines it.
+_EXPORTS = {
+    "ALGORITHMS": "scheduling",
+    "AllocationResult": "allocation",
+    "FaultCurve": "paging",
+    "PagingResult": "paging",
+    "ProcessTable": "scheduling",
+    "STRATEGIES": "allocation",
+    "ScheduleResult": "scheduling",
+    "Workload": "workloads",
+    "allocate": "allocation",
+    "belady_anomalies": "paging",
+    "best_fit": "allocation",
+    "fault_curve": "paging",
+    "fcfs": "scheduling",
+    "first_fit": "allocation",
+    "priority": "scheduling",
+    "random_references": "workloads",
+    "random_trace": "workloads",
+    "random_workload": "workloads",
+    "reallocate": "allocation",
+    "resimulate": "scheduling",
+    "round_robin": "scheduling",
+    "simulate": "scheduling",
+    "sjf": "scheduling",
+    "srtf": "scheduling",
+    "summarize": "scheduling",
+    "worst_fit": "allocation",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,281 @@
+"""Headless contiguous memory allocation engine.
+
+First-, Best- and Worst-Fit place each process, in order, into a block with
+enough free space and split the remainder off within that same block.  Each
+strategy is backed by an index over the free sizes so a placement costs
+O(log m) rather than a scan over all ``m`` blocks.
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from heapq import heapify, heapreplace
+
+import numpy as np
+
+
+@dataclass
+class AllocationResult:
+    """Placement of each process plus the leftover space in each block.
+
+    ``allocation[i]`` is the block index of process ``i`` (``-1`` if it did
+    not fit) and ``offset[i]`` its position inside that block.  ``remaining``
+    is the free space left at the end of every block.
+    """
+
+    strategy: str
+    blocks: np.ndarray
+    processes: np.ndarray
+    allocation: np.ndarray
+    offset: np.ndarray
+    remaining: np.ndarray
+
+    def __len__(self):
+        return len(self.processes)
+
+
+def _as_columns(blocks, processes):
+    blocks = np.asarray(blocks, dtype=np.int64)
+    processes = np.asarray(processes, dtype=np.int64)
+    if blocks.ndim != 1 or processes.ndim != 1:
+        raise ValueError("blocks and processes must be 1-D")
+    return blocks, processes
+
+
+def _finish(strategy, blocks, processes, allocation, offset, remaining):
+    return AllocationResult(
+        strategy=strategy,
+        blocks=blocks,
+        processes=processes,
+        allocation=np.asarray(allocation, dtype=np.int64),
+        offset=np.asarray(offset, dtype=np.int64),
+        remaining=np.asarray(remaining, dtype=np.int64),
+    )
+
+
+class _MaxSegmentTree:
+    """Max tree over free sizes that finds the leftmost block that fits."""
+
+    def __init__(self, sizes):
+        leaves = 1
+        while leaves < len(sizes):
+            leaves *= 2
+        tree = np.full(2 * leaves, -1, dtype=np.int64)
+        tree[leaves:leaves + len(sizes)] = sizes
+        for level in range(leaves.bit_length() - 1):
+            lo = leaves >> (level + 1)
+            tree[lo:2 * lo] = np.maximum(tree[2 * lo:4 * lo:2], tree[2 * lo + 1:4 * lo:2])
+        self.leaves = leaves
+        self.tree = tree.tolist()
+
+    def leftmost_at_least(self, size):
+        tree = self.tree
+        if tree[1] < size:
+            return -1
+        node = 1
+        while node < self.leaves:
+            node *= 2
+            if tree[node] < size:
+                node += 1
+        return node - self.leaves
+
+    def update(self, index, value):
+        tree = self.tree
+        node = index + self.leaves
+        tree[node] = value
+        node //= 2
+        while node:
+            best = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == best:
+                break
+            tree[node] = best
+            node //= 2
+
+
+class _SortedKeys:
+    """Sorted integer keys kept in bounded buckets.
+
+    A flat list would make every insert and delete an O(m) memmove; buckets
+    of at most ``2 * LOAD`` keep those moves small while lookups stay two
+    bisects.
+    """
+
+    LOAD = 512
+
+    def __init__(self, keys):
+        keys = sorted(keys)
+        self.buckets = [keys[i:i + self.LOAD] for i in range(0, len(keys), self.LOAD)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+
+    def pop_at_least(self, key):
+        """Remove and return the smallest key ``>= key``, or ``None``."""
+        b = bisect_left(self.maxes, key)
+        if b == len(self.buckets):
+            return None
+        bucket = self.buckets[b]
+        found = bucket.pop(bisect_left(bucket, key))
+        if bucket:
+            self.maxes[b] = bucket[-1]
+        else:
+            del self.buckets[b]
+            del self.maxes[b]
+        return found
+
+    def first(self):
+        return self.buckets[0][0] if self.buckets else None
+
+    def last(self):
+        return self.maxes[-1] if self.buckets else None
+
+    def ceiling(self, key):
+        """Smallest key ``>= key`` without removing it, or ``None``."""
+        b = bisect_left(self.maxes, key)
+        if b == len(self.buckets):
+            return None
+        bucket = self.buckets[b]
+        return bucket[bisect_left(bucket, key)]
+
+    def discard(self, key):
+        if self.ceiling(key) == key:
+            self.pop_at_least(key)
+
+    def add(self, key):
+        if not self.buckets:
+            self.buckets.append([key])
+            self.maxes.append(key)
+            return
+        b = min(bisect_left(self.maxes, key), len(self.buckets) - 1)
+        bucket = self.buckets[b]
+        insort(bucket, key)
+        self.maxes[b] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            self.buckets[b:b + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            self.maxes[b:b + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+
+
+def _fresh(blocks, processes):
+    blocks, processes = _as_columns(blocks, processes)
+    return blocks, processes, blocks.tolist(), [-1] * len(processes), [-1] * len(processes), 0
+
+
+def first_fit(blocks, processes):
+    """Place each process in the lowest-indexed block with enough space."""
+    return _first_fit(*_fresh(blocks, processes))
+
+
+def _first_fit(blocks, processes, free, allocation, offset, first):
+    capacity = blocks.tolist()
+    if free:
+        tree = _MaxSegmentTree(free)
+        for i, size in enumerate(processes[first:].tolist(), first):
+            j = tree.leftmost_at_least(size)
+            if j != -1:
+                allocation[i] = j
+                offset[i] = capacity[j] - free[j]
+                free[j] -= size
+                tree.update(j, free[j])
+    return _finish("First-Fit", blocks, processes, allocation, offset, free)
+
+
+def best_fit(blocks, processes):
+    """Place each process in the block whose space fits it most tightly.
+
+    Ties go to the lowest block index.  Free blocks are indexed by the single
+    integer ``space * m + j``, which orders like ``(space, j)`` but compares
+    faster than a tuple.
+    """
+    return _best_fit(*_fresh(blocks, processes))
+
+
+def _best_fit(blocks, processes, free, allocation, offset, first):
+    capacity = blocks.tolist()
+    m = len(free)
+    index = _SortedKeys(space * m + j for j, space in enumerate(free))
+    for i, size in enumerate(processes[first:].tolist(), first):
+        key = index.pop_at_least(size * m)
+        if key is not None:
+            j = key % m
+            allocation[i] = j
+            offset[i] = capacity[j] - free[j]
+            free[j] -= size
+            index.add(free[j] * m + j)
+    return _finish("Best-Fit", blocks, processes, allocation, offset, free)
+
+
+def worst_fit(blocks, processes):
+    """Place each process in the block with the most free space.
+
+    Ties go to the lowest block index.  The max-heap holds one integer key
+    ``j - space * m`` per block, which orders like ``(-space, j)``.
+    """
+    return _worst_fit(*_fresh(blocks, processes))
+
+
+def _worst_fit(blocks, processes, free, allocation, offset, first):
+    capacity = blocks.tolist()
+    m = len(free)
+    heap = [j - space * m for j, space in enumerate(free)]
+    heapify(heap)
+    for i, size in enumerate(processes[first:].tolist(), first):
+        if heap and free[heap[0] % m] >= size:
+            j = heap[0] % m
+            allocation[i] = j
+            offset[i] = capacity[j] - free[j]
+            free[j] -= size
+            heapreplace(heap, j - free[j] * m)
+    return _finish("Worst-Fit", blocks, processes, allocation, offset, free)
+
+
+STRATEGIES = {
+    "First-Fit": first_fit,
+    "Best-Fit": best_fit,
+    "Worst-Fit": worst_fit,
+}
+# The placement loops behind ``STRATEGIES``, resumable from any process.
+_PLACERS = {
+    "First-Fit": _first_fit,
+    "Best-Fit": _best_fit,
+    "Worst-Fit": _worst_fit,
+}
+
+
+def allocate(strategy, blocks, processes):
+    """Run any entry of ``STRATEGIES`` by name."""
+    if strategy not in STRATEGIES:
+        raise ValueError(f"unknown allocation strategy: {strategy!r}")
+    return STRATEGIES[strategy](blocks, processes)
+
+
+def reallocate(previous, blocks, processes):
+    """Re-run ``previous.strategy`` on edited inputs, keeping the unaffected prefix.
+
+    Every placement before the first edited process is kept, except that a
+    resized block ``j`` also invalidates placements from the first process
+    small enough to fit its old or new capacity -- earlier processes could
+    never have used ``j`` under either size.  The free space left by the
+    kept prefix seeds the strategy's index and placement resumes from
+    there.  A different block count falls back to a full ``allocate``.
+    """
+    strategy = previous.strategy
+    blocks, processes = _as_columns(blocks, processes)
+    if len(blocks) != len(previous.blocks):
+        return allocate(strategy, blocks, processes)
+
+    n = min(len(processes), len(previous.processes))
+    edited = np.flatnonzero(processes[:n] != previous.processes[:n])
+    first = int(edited[0]) if len(edited) else n
+    resized = np.flatnonzero(blocks != previous.blocks)
+    if len(resized):
+        fits = np.maximum(blocks[resized], previous.blocks[resized]).max()
+        small = np.flatnonzero(processes[:first] <= fits)
+        if len(small):
+            first = int(small[0])
+    elif first == len(processes) == len(previous.processes):
+        return previous
+
+    kept = previous.allocation[:first]
+    placed = kept >= 0
+    used = np.bincount(kept[placed], weights=processes[:first][placed], minlength=len(blocks))
+    free = (blocks - used.astype(np.int64)).tolist()
+    allocation = kept.tolist() + [-1] * (len(processes) - first)
+    offset = previous.offset[:first].tolist() + [-1] * (len(processes) - first)
+    return _PLACERS[strategy](blocks, processes, free, allocation, offset, first)
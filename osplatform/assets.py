@@ -0,0 +1,361 @@
+"""Vendored static media: the three.js bundle and the Home page hero image.
+
+Pages must render without outbound fetches, so both live in
+``static/vendor/`` and are served by the app itself; nothing falls back
+to a CDN.  ``python -m osplatform.assets build`` (re)creates them and
+records the result in ``static/vendor/assets.json``:
+
+* ``three`` is three.js's minified UMD build (``three.min.js``), fetched
+  from ``SOURCES`` or read from a local copy given with ``--from``, and
+  copied byte for byte with its Subresource Integrity hash;
+* ``hero`` is drawn locally by ``draw_hero`` (or read with ``--from``)
+  and re-encoded at each of ``HERO_WIDTHS`` (never wider than the
+  original) as progressive JPEG and WebP, for an ``<img srcset>`` that
+  lets each browser download only the variant its layout needs.
+
+Every URL carries the file's content hash: the hero variants in their
+names, and the bundle, which scene pages on the static route load by its
+fixed name, as ``?v=<hash>`` (the same versioning ``scenes.static_url``
+uses).  A versioned URL never changes content, so it can be cached
+forever.  Streamlit's ``app/static`` route serves files with ETags but
+no ``Cache-Control``, which costs a revalidation round trip per file and
+page; ``serve`` runs a small HTTP server that sends ``CACHE_CONTROL``
+(one year, immutable) instead.  URLs are built against a base: the
+``app/static`` route by default, or that server's address.
+
+A missing asset is an error (``AssetMissing``), never a silent remote
+fetch.
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import mimetypes
+import random
+import sys
+import threading
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+STATIC_ROUTE = "app/static"
+VENDOR_DIR = STATIC_DIR / "vendor"
+MANIFEST = VENDOR_DIR / "assets.json"
+
+ASSETS = ("three", "hero")
+# Where ``build`` fetches assets it cannot make locally.
+SOURCES = {"three": "https://unpkg.com/three@0.140.0/build/three.min.js"}
+# Scene pages load three.js from this path next to them; ``link`` rewrites it.
+THREE_SRC = "vendor/three.min.js"
+# Hero variant widths in CSS pixels: phones, laptops, wide and high-DPI screens.
+HERO_WIDTHS = (480, 960, 1600)
+HERO_SIZE = (1600, 560)
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+FETCH_TIMEOUT = 30
+
+
+class AssetMissing(FileNotFoundError):
+    """A page needs an asset that ``python -m osplatform.assets build`` has not vendored."""
+
+    def __init__(self, name):
+        super().__init__(f"static asset {name!r} is not vendored; run `python -m osplatform.assets build`")
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _write(name, suffix, data):
+    """Write ``data`` to ``VENDOR_DIR`` as ``name.<hash>suffix`` and return the file name."""
+    filename = f"{name}.{_digest(data)}{suffix}"
+    (VENDOR_DIR / filename).write_bytes(data)
+    return filename
+
+
+def fetch(url, timeout=FETCH_TIMEOUT):
+    """Download ``url`` and return its bytes."""
+    import urllib.request
+
+    request = urllib.request.Request(url, headers={"User-Agent": "osplatform-assets"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def draw_hero(size=HERO_SIZE, seed=0):
+    """PNG of the Home page banner: memory blocks filling up above a Gantt timeline."""
+    from PIL import Image, ImageDraw
+
+    width, height = size
+    rng = random.Random(seed)
+    image = Image.new("RGB", size)
+    draw = ImageDraw.Draw(image)
+    for y in range(height):
+        t = y / (height - 1)
+        draw.line([(0, y), (width, y)], fill=(int(14 + 17 * t), int(26 + 52 * t), int(43 + 78 * t)))
+    palette = [(31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40), (148, 103, 189), (23, 190, 207)]
+
+    # Memory blocks: outlined towers, each partly filled by process slabs
+    columns, gap = 24, width // 96
+    tower = (width - gap * (columns + 1)) // columns
+    floor = int(height * 0.68)
+    for c in range(columns):
+        x = gap + c * (tower + gap)
+        top = floor - rng.randint(height // 6, int(height * 0.55))
+        draw.rectangle([x, top, x + tower, floor], outline=(120, 150, 200), width=2)
+        y = floor
+        while y - top > 12 and rng.random() < 0.8:
+            slab = rng.randint(8, max(9, (y - top) // 2))
+            draw.rectangle([x + 4, y - slab + 2, x + tower - 4, y - 2], fill=rng.choice(palette))
+            y -= slab
+
+    # Gantt timeline: consecutive slices on one CPU lane
+    lane_top, lane_bottom = int(height * 0.78), int(height * 0.9)
+    x = gap
+    while x < width - gap:
+        run = min(rng.randint(width // 40, width // 12), width - gap - x)
+        draw.rectangle([x, lane_top, x + run - 2, lane_bottom], fill=rng.choice(palette))
+        x += run
+    out = io.BytesIO()
+    image.save(out, "PNG")
+    return out.getvalue()
+
+
+def vendor_script(data):
+    """Vendor the three.js bundle under the fixed name scene pages load, versioned by its hash."""
+    (VENDOR_DIR / "three.min.js").write_bytes(data)
+    integrity = base64.b64encode(hashlib.sha384(data).digest()).decode("ascii")
+    return {"file": "three.min.js", "version": _digest(data), "integrity": f"sha384-{integrity}"}
+
+
+def vendor_image(data, widths=HERO_WIDTHS):
+    """Vendor the hero image as JPEG and WebP variants at each of ``widths``."""
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    image = image.convert("RGB")
+    sizes = sorted({width for width in widths if width < image.width} | {min(max(widths), image.width)})
+    jpeg, webp = [], []
+    for width in sizes:
+        height = round(image.height * width / image.width)
+        variant = image.resize((width, height), Image.Resampling.LANCZOS) if width != image.width else image
+        for variants, format, suffix, options in (
+            (jpeg, "JPEG", ".jpg", {"quality": JPEG_QUALITY, "progressive": True, "optimize": True}),
+            (webp, "WEBP", ".webp", {"quality": WEBP_QUALITY, "method": 6}),
+        ):
+            out = io.BytesIO()
+            variant.save(out, format, **options)
+            variants.append([width, _write(f"hero-{width}", suffix, out.getvalue())])
+    return {"width": sizes[-1], "height": round(image.height * sizes[-1] / image.width), "jpeg": jpeg, "webp": webp}
+
+
+_VENDORS = {"three": vendor_script, "hero": vendor_image}
+
+
+def build(local=None, offline=False, log=print):
+    """Vendor every asset in ``ASSETS`` and write the manifest.
+
+    ``local`` maps asset names to files read instead of the default source
+    (a fetch from ``SOURCES``, or ``draw_hero``).  An asset that can be
+    neither read locally nor fetched (or with ``offline``, has no local
+    copy) keeps its previous manifest entry, if any.  Files that no
+    manifest entry refers to any more are removed.
+    """
+    local = local or {}
+    VENDOR_DIR.mkdir(parents=True, exist_ok=True)
+    entries = _read_manifest()
+    for name in ASSETS:
+        if name in local:
+            data = Path(local[name]).read_bytes()
+        elif name == "hero":
+            data = draw_hero()
+        elif offline:
+            log(f"{name}: skipped (offline, no local copy)")
+            continue
+        else:
+            try:
+                data = fetch(SOURCES[name])
+            except OSError as exc:
+                log(f"{name}: not fetched from {SOURCES[name]}: {exc}")
+                continue
+        entries[name] = _VENDORS[name](data)
+        log(f"{name}: vendored {len(data)} bytes")
+    MANIFEST.write_text(json.dumps(entries, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    keep = {MANIFEST.name} | set(_files(entries))
+    for path in VENDOR_DIR.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+    manifest.cache_clear()
+    return entries
+
+
+def _read_manifest():
+    try:
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def _files(entries):
+    """``{file name: version}`` of every file the manifest ``entries`` refer to.
+
+    The version is the ``?v=`` a fixed-name file must be requested with, or
+    ``None`` for files whose name already carries their hash.
+    """
+    files = {}
+    for entry in entries.values():
+        if "file" in entry:
+            files[entry["file"]] = entry.get("version")
+        for key in ("jpeg", "webp"):
+            for _, filename in entry.get(key, []):
+                files[filename] = None
+    return files
+
+
+@lru_cache(maxsize=None)
+def manifest():
+    """The vendored assets, read once per process; empty until ``build`` has run."""
+    return _read_manifest()
+
+
+def _entry(name):
+    entry = manifest().get(name)
+    if entry is None:
+        raise AssetMissing(name)
+    return entry
+
+
+def asset_url(name, base=STATIC_ROUTE):
+    """Versioned URL of vendored script ``name`` under ``base``; raises ``AssetMissing``."""
+    entry = _entry(name)
+    return f"{base}/vendor/{entry['file']}?v={entry['version']}"
+
+
+def link(html, base=STATIC_ROUTE):
+    """Point a scene page's three.js script at the versioned, integrity-checked bundle under ``base``.
+
+    Used for pages inlined with ``st.components.v1.html``, whose relative
+    URLs resolve against the app rather than ``static/``.  Raises
+    ``AssetMissing`` if the bundle was not vendored.
+    """
+    src = f'src="{asset_url("three", base)}" integrity="{_entry("three")["integrity"]}" crossorigin="anonymous"'
+    return html.replace(f'src="{THREE_SRC}"', src, 1)
+
+
+def picture(name, alt, base=STATIC_ROUTE, sizes="100vw"):
+    """Responsive ``<picture>`` markup for vendored image ``name``; raises ``AssetMissing``.
+
+    Browsers that decode WebP pick from the WebP variants, the rest from the
+    JPEGs; ``width`` and ``height`` reserve the layout box before any bytes
+    arrive.
+    """
+    entry = _entry(name)
+
+    def srcset(variants):
+        return ", ".join(f"{base}/vendor/{filename} {width}w" for width, filename in variants)
+
+    fallback = entry["jpeg"][len(entry["jpeg"]) // 2][1]
+    return (
+        f'<picture><source type="image/webp" srcset="{srcset(entry["webp"])}" sizes="{sizes}">'
+        f'<img src="{base}/vendor/{fallback}" srcset="{srcset(entry["jpeg"])}" sizes="{sizes}" '
+        f'width="{entry["width"]}" height="{entry["height"]}" alt="{escape(alt)}" decoding="async" '
+        f'style="width:100%;height:auto"></picture>'
+    )
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port, host="0.0.0.0"):
+    """Serve the vendored files on ``http://host:port/vendor/`` from a daemon thread.
+
+    Only files listed in the manifest are served, fixed-name ones only at
+    their current ``?v=``, each with ``CACHE_CONTROL``.  Only one server
+    runs per process; later calls return the running one.
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = _start_server(host, port)
+    return _server
+
+
+def running():
+    """The server started by ``serve``, or ``None``."""
+    return _server
+
+
+def _start_server(host, port):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            filename = url.path[len("/vendor/"):] if url.path.startswith("/vendor/") else None
+            files = _files(manifest())
+            if filename not in files or parse_qs(url.query).get("v", [None])[0] != files[filename]:
+                self.send_error(404)
+                return
+            body = (VENDOR_DIR / filename).read_bytes()
+            self.send_response(200)
+            self.send_header("Content-Type", mimetypes.guess_type(filename)[0] or "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="assets", daemon=True).start()
+    return server
+
+
+def _local_source(value):
+    name, sep, path = value.partition("=")
+    if not sep or name not in ASSETS:
+        raise argparse.ArgumentTypeError(f"expected NAME=PATH with NAME one of {', '.join(ASSETS)}")
+    return name, path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m osplatform.assets",
+                                     description="Vendor the app's third-party media into static/vendor/.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="fetch or draw, resize and hash every asset")
+    build_parser.add_argument("--from", dest="local", type=_local_source, action="append", default=[],
+                              metavar="NAME=PATH", help="read an asset from a local file instead of its default source")
+    build_parser.add_argument("--offline", action="store_true", help="never fetch; keep assets that would need it")
+    serve_parser = commands.add_parser("serve", help="serve the vendored files with immutable cache headers")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        entries = build(dict(args.local), offline=args.offline)
+        missing = [name for name in ASSETS if name not in entries]
+        if missing:
+            print(f"not vendored: {', '.join(missing)}", file=sys.stderr)
+        return 1 if missing else 0
+
+    server = serve(args.port, args.host)
+    print(f"serving {VENDOR_DIR} on http://{args.host}:{server.server_address[1]}/vendor/", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Plotly and matplotlib renderers for engine results.
+
+Kept out of the package ``__init__`` so headless users of the engines never
+import plotting libraries, and each renderer imports its plotting library
+on first call so a page only loads the one it draws with.
+"""
+
+import numpy as np
+
+# Above this many Gantt segments the chart switches to a decimated WebGL trace.
+GANTT_WEBGL_THRESHOLD = 2000
+# Horizontal resolution the decimation assumes when merging sub-pixel slices.
+GANTT_WIDTH_PX = 1200
+# Allocation charts with more placed processes than this are drawn unlabelled.
+ALLOCATION_LABEL_LIMIT = 60
+
+
+def merge_segments(pid, start, end, resolution):
+    """Merge slices of the same process (or core lane) separated by at most ``resolution``.
+
+    Returns ``(pid, start, end)`` arrays sorted by process then start time.
+    Slices closer together than one pixel render as one bar anyway, so
+    merging them loses nothing visible.
+    """
+    order = np.lexsort((start, pid))
+    pid, start, end = pid[order], start[order], end[order]
+    if len(pid) == 0:
+        return pid, start, end
+    # A process runs on at most one CPU at a time, so its slices never
+    # overlap and each lane's ends are already increasing.
+    new_group = np.empty(len(pid), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = (pid[1:] != pid[:-1]) | (start[1:] - end[:-1] > resolution)
+    heads = np.flatnonzero(new_group)
+    tails = np.r_[heads[1:], len(pid)] - 1
+    return pid[heads], start[heads], end[tails]
+
+
+def gantt_figure(gantt, names, title, color, webgl_threshold=GANTT_WEBGL_THRESHOLD,
+                 width_px=GANTT_WIDTH_PX):
+    """Build a Gantt chart from a ``ScheduleResult.gantt`` table.
+
+    All slices go into one horizontal ``go.Bar`` with array-valued ``base``
+    and ``x``.  Past ``webgl_threshold`` segments, slices shorter than a
+    pixel are merged and the result is drawn as a single ``go.Scattergl``
+    line trace instead, keeping the payload and browser cost bounded.
+    A multi-core table (with a ``cpu`` column) gets one lane per core, with
+    process names on hover.
+    """
+    import plotly.graph_objects as go
+
+    names = np.asarray(names, dtype=object)
+    pid, start, end = gantt["pid"], gantt["start"], gantt["end"]
+    if "cpu" in gantt:
+        row = gantt["cpu"]
+        labels = np.array([f"CPU {core}" for core in range(int(row.max()) + 1 if len(row) else 0)], dtype=object)
+    else:
+        row, labels = pid, names
+    fig = go.Figure()
+
+    if len(pid) <= webgl_threshold:
+        fig.add_trace(go.Bar(
+            y=labels[row],
+            x=end - start,
+            base=start,
+            orientation='h',
+            hovertext=names[pid] if "cpu" in gantt else None,
+            hoverinfo='x+y+text' if "cpu" in gantt else 'x+y',
+            marker=dict(color=color, line=dict(color='white', width=1) if "cpu" in gantt else None)
+        ))
+    else:
+        span = float(end.max() - start.min())
+        row, start, end = merge_segments(row, start, end, span / width_px)
+        # One polyline with None breaks draws every slice as a thick segment.
+        lanes = labels[row]
+        x = np.empty(len(row) * 3, dtype=object)
+        y = np.empty(len(row) * 3, dtype=object)
+        x[0::3], x[1::3], x[2::3] = start, end, None
+        y[0::3], y[1::3], y[2::3] = lanes, lanes, None
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
+            mode='lines',
+            line=dict(color=color, width=max(2, min(20, 400 // max(1, len(labels))))),
+            hoverinfo='x+y'
+        ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="Time",
+        yaxis_title="CPU" if "cpu" in gantt else "Process",
+        showlegend=False
+    )
+    return fig
+
+
+def _bar_collection(x, width, y, height, **kwargs):
+    """One ``PolyCollection`` of axis-aligned bars built from array vertices."""
+    from matplotlib.collections import PolyCollection
+
+    x = np.asarray(x, dtype=float)
+    right = x + np.asarray(width, dtype=float)
+    verts = np.empty((len(x), 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = x
+    verts[:, 2, 0] = verts[:, 3, 0] = right
+    verts[:, 0, 1] = verts[:, 3, 1] = y
+    verts[:, 1, 1] = verts[:, 2, 1] = y + height
+    return PolyCollection(verts, **kwargs)
+
+
+def allocation_figure(result, label_limit=ALLOCATION_LABEL_LIMIT):
+    """Draw an ``AllocationResult`` as one memory bar.
+
+    Block offsets come from a single cumulative sum and each process sits at
+    its own offset inside its block, so several processes sharing a block
+    are laid out side by side.  Processes and block outlines are each one
+    ``PolyCollection`` built from vertex arrays; labels are dropped past ``label_limit``
+    placed processes, where they would only overlap.
+    """
+    from matplotlib.figure import Figure
+
+    blocks = result.blocks
+    block_start = np.cumsum(blocks) - blocks
+    placed = np.flatnonzero(result.allocation >= 0)
+    start = block_start[result.allocation[placed]] + result.offset[placed]
+    width = result.processes[placed]
+
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    y = 1
+    ax.add_collection(_bar_collection(start, width, y-0.4, 0.8, facecolors='tab:blue', edgecolors='white', linewidths=0.5), autolim=False)
+    ax.add_collection(_bar_collection(block_start, blocks, y-0.4, 0.8, facecolors='none', edgecolors='black'), autolim=False)
+    if len(placed) <= label_limit:
+        for i, x in zip(placed.tolist(), (start + width / 2).tolist()):
+            ax.text(x, y, f"P{i+1}", ha='center', va='center', color='white')
+
+    ax.set_ylim(0, 2)
+    ax.set_xlim(0, max(1, int(blocks.sum())))
+    ax.set_xlabel("Memory Size")
+    ax.set_yticks([])
+    ax.set_title("Memory Blocks and Process Allocation")
+    return fig
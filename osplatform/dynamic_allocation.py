@@ -0,0 +1,329 @@
+"""Trace-driven dynamic memory allocation.
+
+Unlike the one-shot placement in ``osplatform.allocation``, these allocators
+manage a single contiguous memory of ``capacity`` units through a stream of
+``("alloc", id, size)`` and ``("free", id, size)`` events.  Freed space is
+coalesced with free neighbours, and ``replay`` records external
+fragmentation, the largest free hole and the allocation-failure rate as the
+trace streams through.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+
+import numpy as np
+
+from osplatform.allocation import _SortedKeys
+
+# Upper bound on stored samples per metric; longer traces are decimated.
+MAX_SAMPLES = 2000
+
+
+class _HoleIndex:
+    """Free-hole start addresses in bounded sorted buckets.
+
+    Each bucket remembers its largest hole, so an address-ordered search for
+    the first hole that fits skips whole buckets that cannot satisfy it.
+    """
+
+    LOAD = 256
+
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.buckets = []
+        self.firsts = []
+        self.largest = []
+
+    def _locate(self, address):
+        return max(0, bisect_right(self.firsts, address) - 1)
+
+    def add(self, start, size):
+        if not self.buckets:
+            self.buckets.append([start])
+            self.firsts.append(start)
+            self.largest.append(size)
+            return
+        b = self._locate(start)
+        bucket = self.buckets[b]
+        insort(bucket, start)
+        self.firsts[b] = bucket[0]
+        self.largest[b] = max(self.largest[b], size)
+        if len(bucket) > 2 * self.LOAD:
+            halves = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            self.buckets[b:b + 1] = halves
+            self.firsts[b:b + 1] = [half[0] for half in halves]
+            self.largest[b:b + 1] = [max(self.sizes[s] for s in half) for half in halves]
+
+    def remove(self, start, size):
+        b = self._locate(start)
+        bucket = self.buckets[b]
+        del bucket[bisect_left(bucket, start)]
+        if not bucket:
+            del self.buckets[b], self.firsts[b], self.largest[b]
+            return
+        self.firsts[b] = bucket[0]
+        if size == self.largest[b]:
+            self.largest[b] = max(self.sizes[s] for s in bucket)
+
+    def find(self, size, address=0):
+        """Lowest hole start ``>= address`` whose hole holds ``size``."""
+        if not self.buckets:
+            return None
+        b = self._locate(address)
+        bucket = self.buckets[b]
+        if self.largest[b] >= size:
+            for start in bucket[bisect_left(bucket, address):]:
+                if self.sizes[start] >= size:
+                    return start
+        for b in range(b + 1, len(self.buckets)):
+            if self.largest[b] >= size:
+                for start in self.buckets[b]:
+                    if self.sizes[start] >= size:
+                        return start
+        return None
+
+
+class FreeListAllocator:
+    """Variable-size allocator over an address-ordered, coalescing free list.
+
+    ``strategy`` is one of First-Fit, Next-Fit, Best-Fit or Worst-Fit.  Holes
+    are indexed both by address (first/next fit and neighbour lookup) and by
+    ``(size, address)`` packed into one integer (best/worst fit and the
+    largest-hole metric).
+    """
+
+    def __init__(self, capacity, strategy="First-Fit"):
+        if strategy not in FREE_LIST_STRATEGIES:
+            raise ValueError(f"unknown free-list strategy: {strategy!r}")
+        self.capacity = capacity
+        self.strategy = strategy
+        self.free_total = 0
+        self.rover = 0
+        self._stride = capacity + 1
+        self._by_start = {}
+        self._by_end = {}
+        self._addresses = _HoleIndex(self._by_start)
+        self._sizes = _SortedKeys([])
+        if capacity > 0:
+            self._insert(0, capacity)
+
+    def _insert(self, start, size):
+        self._by_start[start] = size
+        self._by_end[start + size] = start
+        self._addresses.add(start, size)
+        self._sizes.add(size * self._stride + start)
+        self.free_total += size
+
+    def _delete(self, start):
+        size = self._by_start[start]
+        self._addresses.remove(start, size)
+        self._sizes.discard(size * self._stride + start)
+        del self._by_start[start], self._by_end[start + size]
+        self.free_total -= size
+        return size
+
+    @property
+    def largest_hole(self):
+        key = self._sizes.last()
+        return 0 if key is None else key // self._stride
+
+    @property
+    def holes(self):
+        return len(self._by_start)
+
+    def malloc(self, size):
+        """Allocate ``size`` units and return the start address, or ``None``."""
+        if size <= 0:
+            raise ValueError("allocation size must be positive")
+        if self.strategy == "First-Fit":
+            start = self._addresses.find(size)
+        elif self.strategy == "Next-Fit":
+            start = self._addresses.find(size, self.rover)
+            if start is None:
+                start = self._addresses.find(size)
+        elif self.strategy == "Best-Fit":
+            key = self._sizes.ceiling(size * self._stride)
+            start = None if key is None else key % self._stride
+        else:
+            # Largest hole, lowest address among equally large ones.
+            key = self._sizes.last()
+            if key is not None:
+                key = self._sizes.ceiling(key // self._stride * self._stride)
+            start = key % self._stride if key is not None and key // self._stride >= size else None
+        if start is None:
+            return None
+
+        hole = self._delete(start)
+        if hole > size:
+            self._insert(start + size, hole - size)
+        self.rover = start + size
+        return start
+
+    def free(self, start, size):
+        """Return ``[start, start + size)`` and merge it with free neighbours."""
+        left = self._by_end.get(start)
+        if left is not None:
+            size += self._delete(left)
+            start = left
+        if start + size in self._by_start:
+            size += self._delete(start + size)
+        self._insert(start, size)
+
+
+class BuddyAllocator:
+    """Binary buddy allocator over the largest power-of-two prefix of memory.
+
+    Requests are rounded up to a power of two (at least ``min_block``); a
+    freed block merges with its buddy for as long as the buddy is free.
+    """
+
+    def __init__(self, capacity, min_block=1):
+        self.min_block = 1 << max(0, (min_block - 1).bit_length())
+        self.top = capacity.bit_length() - 1 if capacity > 0 else -1
+        self.capacity = 1 << self.top if self.top >= 0 else 0
+        self.free_lists = [_SortedKeys([]) for _ in range(self.top + 1)]
+        self.free_total = 0
+        if self.top >= 0 and (1 << self.top) >= self.min_block:
+            self.free_lists[self.top].add(0)
+            self.free_total = 1 << self.top
+
+    def _order(self, size):
+        return (max(size, self.min_block) - 1).bit_length()
+
+    @property
+    def largest_hole(self):
+        for order in range(self.top, -1, -1):
+            if self.free_lists[order].first() is not None:
+                return 1 << order
+        return 0
+
+    def malloc(self, size):
+        if size <= 0:
+            raise ValueError("allocation size must be positive")
+        order = self._order(size)
+        for k in range(order, self.top + 1):
+            address = self.free_lists[k].first()
+            if address is not None:
+                break
+        else:
+            return None
+        self.free_lists[k].discard(address)
+        while k > order:
+            k -= 1
+            self.free_lists[k].add(address + (1 << k))
+        self.free_total -= 1 << order
+        return address
+
+    def free(self, address, size):
+        order = self._order(size)
+        self.free_total += 1 << order
+        while order < self.top:
+            buddy = address ^ (1 << order)
+            if self.free_lists[order].ceiling(buddy) != buddy:
+                break
+            self.free_lists[order].discard(buddy)
+            address = min(address, buddy)
+            order += 1
+        self.free_lists[order].add(address)
+
+
+FREE_LIST_STRATEGIES = ("First-Fit", "Next-Fit", "Best-Fit", "Worst-Fit")
+STRATEGIES = FREE_LIST_STRATEGIES + ("Buddy",)
+
+
+def make_allocator(strategy, capacity):
+    if strategy == "Buddy":
+        return BuddyAllocator(capacity)
+    return FreeListAllocator(capacity, strategy)
+
+
+def external_fragmentation(free_total, largest_hole):
+    """Share of free memory that lies outside the largest hole."""
+    return 1.0 - largest_hole / free_total if free_total else 0.0
+
+
+@dataclass
+class TraceMetrics:
+    """Sampled metric time series of one trace replay plus final totals."""
+
+    strategy: str
+    capacity: int
+    step: np.ndarray
+    used: np.ndarray
+    largest_hole: np.ndarray
+    fragmentation: np.ndarray
+    failure_rate: np.ndarray
+    events: int = 0
+    allocations: int = 0
+    failures: int = 0
+    frees: int = 0
+
+
+def replay(events, capacity, strategy="First-Fit", max_samples=MAX_SAMPLES):
+    """Stream ``(op, id, size)`` events through an allocator.
+
+    ``op`` is ``"alloc"`` or ``"free"``.  An allocation of a non-positive
+    size or of an id that is still live is refused and counts as a failure;
+    freeing an id that is not live (for example one whose allocation
+    failed) is a no-op.  Metrics are sampled
+    every ``stride`` events; whenever ``max_samples`` samples are held, every
+    other one is dropped and the stride doubles, so memory stays bounded by
+    the live allocations plus ``max_samples`` regardless of trace length.
+    """
+    allocator = make_allocator(strategy, capacity)
+    capacity = allocator.capacity
+    live = {}
+    samples = []
+    stride = 1
+    allocations = failures = frees = 0
+    step = -1
+
+    def sample(step):
+        largest = allocator.largest_hole
+        samples.append((
+            step,
+            allocator.capacity - allocator.free_total,
+            largest,
+            external_fragmentation(allocator.free_total, largest),
+            failures / allocations if allocations else 0.0,
+        ))
+
+    for step, (op, block_id, size) in enumerate(events):
+        if op == "alloc":
+            allocations += 1
+            address = allocator.malloc(size) if size > 0 and block_id not in live else None
+            if address is None:
+                failures += 1
+            else:
+                live[block_id] = (address, size)
+        elif op == "free":
+            placed = live.pop(block_id, None)
+            if placed is not None:
+                allocator.free(*placed)
+                frees += 1
+        else:
+            raise ValueError(f"unknown trace operation: {op!r}")
+
+        if step % stride == 0:
+            sample(step)
+            if len(samples) >= max_samples:
+                del samples[1::2]
+                stride *= 2
+
+    if step >= 0 and (not samples or samples[-1][0] != step):
+        sample(step)
+
+    columns = list(zip(*samples)) if samples else [()] * 5
+    return TraceMetrics(
+        strategy=strategy,
+        capacity=capacity,
+        step=np.asarray(columns[0], dtype=np.int64),
+        used=np.asarray(columns[1], dtype=np.int64),
+        largest_hole=np.asarray(columns[2], dtype=np.int64),
+        fragmentation=np.asarray(columns[3], dtype=np.float64),
+        failure_rate=np.asarray(columns[4], dtype=np.float64),
+        events=step + 1,
+        allocations=allocations,
+        failures=failures,
+        frees=frees,
+    )
@@ -0,0 +1,273 @@
+"""Discrete-event multi-core scheduling engine.
+
+Where ``osplatform.scheduling`` models one CPU, this engine runs ``cpus``
+cores off an event calendar: a min-heap of ``(time, core)`` events, each
+the end of a slice on that core (or, with core ``-1``, an MLFQ priority
+boost), merged with the arrival-sorted stream of jobs.  Time jumps from
+one event to the next, so a run costs O((n + events) log n) however long
+the simulated span is.
+
+Every core dispatches from multi-level feedback queues; a plain FCFS or
+Round Robin policy is the one-level case.  With ``topology="global"`` all
+cores share one set of queues.  With ``"per-core"`` each core has its own,
+an arriving job joins the least loaded core, and a core that runs dry
+steals from the back of the longest queue.  Switching a core to a
+different job costs ``switch_cost`` time units, and running a job on a
+different core than last time costs ``migration_cost`` more.
+
+The result is a ``scheduling.ScheduleResult`` whose Gantt table has an
+extra ``cpu`` column, one lane per core, and whose ``switch_time`` is the
+total context-switch and migration overhead.
+"""
+
+from array import array
+from collections import deque
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+from osplatform.scheduling import ProcessTable, ScheduleResult, _as_columns, _complete_idle
+
+POLICIES = ("FCFS", "Round Robin", "MLFQ")
+TOPOLOGIES = ("global", "per-core")
+# Rebuild a lazy load heap once it holds this many entries per core.
+STALE_FACTOR = 8
+
+
+def level_quanta(policy, quantum=2, levels=3):
+    """Time quantum of each queue level; ``None`` runs a job to completion.
+
+    MLFQ doubles the quantum at every level down, so CPU-bound jobs sink
+    to long, rare slices while short interactive jobs finish near the top.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown multi-core policy: {policy!r}")
+    if policy == "FCFS":
+        return [None]
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+    if policy == "Round Robin":
+        return [quantum]
+    if levels < 1:
+        raise ValueError("MLFQ needs at least one level")
+    return [quantum * (1 << level) for level in range(levels)]
+
+
+class _LoadHeap:
+    """Lazy heap of ``(sign * load, core)`` over a list of per-core loads.
+
+    Callers add changed cores to ``dirty`` (a cheap set insert per event);
+    ``top`` pushes their current loads once and skips stale entries, so
+    many changes between two queries cost one push per core.
+    """
+
+    def __init__(self, loads, sign):
+        self.loads = loads
+        self.sign = sign
+        self.dirty = set()
+        self.rebuild()
+
+    def rebuild(self):
+        self.heap = [(self.sign * load, core) for core, load in enumerate(self.loads)]
+        heapify(self.heap)
+
+    def top(self):
+        heap, loads, sign = self.heap, self.loads, self.sign
+        if self.dirty:
+            for core in self.dirty:
+                heappush(heap, (sign * loads[core], core))
+            self.dirty.clear()
+            if len(heap) > STALE_FACTOR * len(loads):
+                self.rebuild()
+        while heap[0][0] != sign * loads[heap[0][1]]:
+            heappop(heap)
+        return heap[0][1]
+
+
+def simulate(burst_time, arrival_time, policy="MLFQ", cpus=1, topology="global", quantum=2, levels=3,
+             boost=None, switch_cost=0, migration_cost=0):
+    """Schedule the jobs on ``cpus`` cores and return a ``ScheduleResult``.
+
+    A job enters the top queue level and drops one level each time it uses
+    a full quantum.  With ``boost`` set, every queued job returns to the top
+    level every ``boost`` time units so long jobs cannot starve.  A level is
+    only picked at dispatch: an arrival never cuts short a running slice.
+    Events are handled in time order, so a job that arrives during a slice
+    queues ahead of the job that slice preempts.  At equal times slice ends
+    come first, then arrivals (in process id order), then dispatches to
+    idle cores, lowest core first.
+    """
+    if cpus < 1:
+        raise ValueError("cpus must be at least 1")
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"unknown topology: {topology!r}")
+    if boost is not None and boost <= 0:
+        raise ValueError("boost must be positive")
+    quanta = level_quanta(policy, quantum, levels)
+    bottom = len(quanta) - 1
+    burst, arrival = _as_columns(burst_time, arrival_time)
+    # Switch and migration overhead can push completions past the work-only
+    # bound int32 tables rely on, so costed runs always get 64-bit columns.
+    wide = burst.dtype.kind == "i" and (switch_cost or migration_cost)
+    table = ProcessTable(burst, arrival, dtype=np.int64 if wide else None)
+    n = len(table)
+    order_index = np.argsort(table.arrival, kind="stable")
+    order = order_index.tolist()
+    sorted_arrivals = table.arrival[order_index].tolist()
+    remaining = table.remaining.tolist()
+    start = table.view("start")
+    completion = table.view("completion")
+    level = [0] * n
+    last_cpu = [-1] * n
+
+    shared = topology == "global"
+    queues = [[deque() for _ in quanta] for _ in range(1 if shared else cpus)]
+    queued = [0] * len(queues)
+    waiting = 0
+    # Per-core loads (queued plus running) pick arrival targets and steal victims.
+    load = [0] * cpus
+    least_loaded = _LoadHeap(load, 1) if not shared else None
+    most_queued = _LoadHeap(queued, -1) if not shared else None
+    load_changed = least_loaded.dirty if not shared else None
+    queue_changed = most_queued.dirty if not shared else None
+
+    running = [-1] * cpus
+    last_job = [-1] * cpus
+    idle = list(range(cpus))
+    calendar = []
+    # A boost with nothing queued is a no-op, so the boost event is dropped
+    # while the queues are empty and re-armed, at the next boost time, by
+    # the next enqueue; idle gaps are then jumped in one event.
+    boost_idle = False
+    if boost is not None and bottom:
+        calendar.append((boost, -1))
+    typecode = "q" if table.dtype.kind == "i" else "d"
+    gantt_pid, gantt_cpu = array("q"), array("q")
+    gantt_start, gantt_end = array(typecode), array(typecode)
+    switch_time = 0
+
+    def enqueue(core, i):
+        nonlocal waiting, boost_idle
+        if boost_idle:
+            boost_idle = False
+            heappush(calendar, ((time // boost + 1) * boost, -1))
+        queues[core][level[i]].append(i)
+        queued[core] += 1
+        waiting += 1
+        if not shared:
+            load[core] += 1
+            load_changed.add(core)
+            queue_changed.add(core)
+
+    def dequeue(core, back=False):
+        nonlocal waiting
+        for queue in queues[core]:
+            if queue:
+                queued[core] -= 1
+                waiting -= 1
+                if not shared:
+                    load[core] -= 1
+                    load_changed.add(core)
+                    queue_changed.add(core)
+                return queue.pop() if back else queue.popleft()
+
+    cursor = 0
+    pending = int(np.count_nonzero(table.remaining > 0))
+    time = 0
+    while pending:
+        next_event = calendar[0][0] if calendar else None
+        if cursor < n and (next_event is None or sorted_arrivals[cursor] < next_event):
+            time = sorted_arrivals[cursor]
+        else:
+            time = next_event
+
+        # Slice ends (and boosts) due now.
+        while calendar and calendar[0][0] == time:
+            _, core = heappop(calendar)
+            if core < 0:
+                for core_queues in queues:
+                    for queue in core_queues[1:]:
+                        core_queues[0].extend(queue)
+                        for i in queue:
+                            level[i] = 0
+                        queue.clear()
+                if waiting:
+                    heappush(calendar, (time + boost, -1))
+                else:
+                    boost_idle = True
+                continue
+            i = running[core]
+            running[core] = -1
+            heappush(idle, core)
+            if remaining[i] > 0:
+                if level[i] < bottom:
+                    level[i] += 1
+                if not shared:
+                    load[core] -= 1
+                enqueue(0 if shared else core, i)
+            else:
+                completion[i] = time
+                pending -= 1
+                if not shared:
+                    load[core] -= 1
+                    load_changed.add(core)
+
+        # Arrivals due now; per-core, each joins the least loaded core.
+        while cursor < n and sorted_arrivals[cursor] <= time:
+            i = order[cursor]
+            cursor += 1
+            if remaining[i] > 0:
+                enqueue(0 if shared else least_loaded.top(), i)
+
+        # Dispatch idle cores while any job waits; per-core, a core with an
+        # empty queue steals, and some queue is non-empty while jobs wait.
+        while idle and waiting:
+            core = heappop(idle)
+            if shared:
+                i = dequeue(0)
+            elif queued[core]:
+                i = dequeue(core)
+            else:
+                i = dequeue(most_queued.top(), back=True)
+
+            cost = 0
+            if last_job[core] != i and last_job[core] >= 0:
+                cost += switch_cost
+            if last_cpu[i] != core and last_cpu[i] >= 0:
+                cost += migration_cost
+            switch_time += cost
+            begin = time + cost
+            quantum_i = quanta[level[i]]
+            run = remaining[i] if quantum_i is None or remaining[i] < quantum_i else quantum_i
+            remaining[i] -= run
+            if start[i] < 0:
+                start[i] = begin
+            running[core] = i
+            last_job[core] = i
+            last_cpu[i] = core
+            if not shared:
+                load[core] += 1
+                load_changed.add(core)
+            gantt_pid.append(i)
+            gantt_cpu.append(core)
+            gantt_start.append(begin)
+            gantt_end.append(begin + run)
+            heappush(calendar, (begin + run, core))
+
+    table.remaining[:] = remaining
+    _complete_idle(table)
+    table.finish()
+    dtype = np.int64 if table.dtype.kind == "i" else np.float64
+    return ScheduleResult(
+        algorithm=policy,
+        table=table,
+        gantt={
+            "pid": np.asarray(gantt_pid, dtype=np.int64),
+            "start": np.asarray(gantt_start, dtype=dtype),
+            "end": np.asarray(gantt_end, dtype=dtype),
+            "cpu": np.asarray(gantt_cpu, dtype=np.int64),
+        },
+        quantum=quantum if policy != "FCFS" else None,
+        cpus=cpus,
+        switch_time=switch_time,
+    )
@@ -0,0 +1,350 @@
+"""Demand-paging page-replacement simulation.
+
+A reference string is a sequence of page numbers.  With ``frames``
+physical frames every reference either hits a resident page or faults,
+and once the frames are full a fault evicts the victim its policy picks:
+
+``FIFO``   the page loaded longest ago;
+``LRU``    the page used longest ago;
+``Clock``  FIFO order, but a page whose reference bit is set gets a
+           second chance (its bit is cleared and the hand moves on);
+``LFU``    the page with the fewest uses since it was loaded, least
+           recently used first among ties;
+``OPT``    the page whose next use lies furthest in the future.
+
+Page numbers are first mapped to dense ids, so per-page state lives in
+flat lists.  OPT reads a next-use index built in one vectorised pass and
+keeps resident pages in a max-heap on it, so a fault costs O(log frames)
+rather than a forward scan of the trace; LRU keeps pages in an
+``OrderedDict``, whose move-to-end and pop-oldest are O(1).
+
+``fault_curve`` evaluates a policy over many frame counts.  LRU is a stack
+algorithm -- the pages resident with ``f`` frames are always among those
+resident with ``f + 1`` -- so one pass computing each reference's stack
+distance yields the faults at every frame count at once.  The other
+policies run once per frame count, which is how FIFO shows Belady's
+anomaly: more frames, more faults.
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+ALGORITHMS = ("FIFO", "LRU", "Clock", "LFU", "OPT")
+# Policies whose state a repeat of the page just referenced cannot change.
+_REPEAT_SAFE = ("FIFO", "LRU", "Clock", "OPT")
+# Rebuild a lazy victim heap once it holds this many entries per frame.
+STALE_FACTOR = 8
+
+
+@dataclass
+class PagingResult:
+    """Per-reference outcome of one policy at one frame count.
+
+    ``fault`` flags the references that faulted and ``victim`` holds the
+    page each one evicted, or -1 where nothing was evicted.
+    """
+
+    algorithm: str
+    frames: int
+    fault: np.ndarray
+    victim: np.ndarray
+
+    def __len__(self):
+        return len(self.fault)
+
+    @property
+    def faults(self):
+        return int(np.count_nonzero(self.fault))
+
+    @property
+    def fault_rate(self):
+        return self.faults / len(self) if len(self) else 0.0
+
+
+@dataclass
+class FaultCurve:
+    """Fault counts of one policy over a range of frame counts."""
+
+    algorithm: str
+    frames: np.ndarray
+    faults: np.ndarray
+    references: int
+
+    @property
+    def fault_rate(self):
+        return self.faults / self.references if self.references else np.zeros(len(self.faults))
+
+    @property
+    def hit_ratio(self):
+        return 1 - self.fault_rate
+
+
+def as_references(references):
+    """Validate a reference string as a 1-D array of non-negative integers."""
+    references = np.asarray(references)
+    if references.ndim != 1:
+        raise ValueError("references must be one-dimensional")
+    if len(references) and references.dtype.kind not in "iu":
+        raise ValueError("page numbers must be integers")
+    if len(references) and references.min() < 0:
+        raise ValueError("page numbers must be non-negative")
+    return references.astype(np.int64, copy=False)
+
+
+def dense_pages(references):
+    """``(pages, ids)``: the distinct page numbers and each reference's index into them."""
+    pages, ids = np.unique(references, return_inverse=True)
+    return pages, ids.astype(np.int64, copy=False)
+
+
+def next_use(ids):
+    """Position of the next reference to the same page, ``len(ids)`` if none.
+
+    A stable sort by page lists each page's references in time order, so
+    every reference's successor within its page run is its next use.
+    """
+    n = len(ids)
+    upcoming = np.full(n, n, dtype=np.int64)
+    if n > 1:
+        order = np.argsort(ids, kind="stable")
+        same = ids[order[1:]] == ids[order[:-1]]
+        upcoming[order[:-1][same]] = order[1:][same]
+    return upcoming
+
+
+def previous_use(ids):
+    """Position of the previous reference to the same page, -1 if none."""
+    n = len(ids)
+    previous = np.full(n, -1, dtype=np.int64)
+    if n > 1:
+        order = np.argsort(ids, kind="stable")
+        same = ids[order[1:]] == ids[order[:-1]]
+        previous[order[1:][same]] = order[:-1][same]
+    return previous
+
+
+def stack_distances(ids, depth):
+    """LRU stack distance of every reference, 0 where it exceeds ``depth``.
+
+    A reference at distance ``d`` is to the ``d``-th most recently used
+    page, so it hits exactly when there are at least ``d`` frames; first
+    references have no distance and count as 0.  The pass keeps the last
+    use times of the ``depth`` most recent pages in a sorted array: a
+    page's distance is the number of entries from its last use to the end,
+    and the current time is always appended, so each reference costs one
+    binary search and a move of at most ``depth`` entries.
+    """
+    distance = [0] * len(ids)
+    recent = []
+    for i, j in enumerate(previous_use(ids).tolist()):
+        if j >= 0 and recent and j >= recent[0]:
+            k = bisect_left(recent, j)
+            distance[i] = len(recent) - k
+            del recent[k]
+        elif len(recent) == depth:
+            del recent[0]
+        recent.append(i)
+    return np.asarray(distance, dtype=np.int64)
+
+
+def _fifo(ids, pages, frames):
+    slot_of = [-1] * pages
+    slots = []
+    hand = 0
+    fault = bytearray(len(ids))
+    victim = [-1] * len(ids)
+    for i, page in enumerate(ids):
+        if slot_of[page] >= 0:
+            continue
+        fault[i] = 1
+        if len(slots) < frames:
+            slot_of[page] = len(slots)
+            slots.append(page)
+            continue
+        evicted = slots[hand]
+        slot_of[evicted] = -1
+        victim[i] = evicted
+        slots[hand] = page
+        slot_of[page] = hand
+        hand = hand + 1 if hand + 1 < frames else 0
+    return fault, victim
+
+
+def _lru(ids, pages, frames):
+    resident = OrderedDict()
+    fault = bytearray(len(ids))
+    victim = [-1] * len(ids)
+    for i, page in enumerate(ids):
+        if page in resident:
+            resident.move_to_end(page)
+            continue
+        fault[i] = 1
+        if len(resident) == frames:
+            victim[i] = resident.popitem(last=False)[0]
+        resident[page] = None
+    return fault, victim
+
+
+def _clock(ids, pages, frames):
+    slot_of = [-1] * pages
+    slots = []
+    referenced = [0] * frames
+    hand = 0
+    fault = bytearray(len(ids))
+    victim = [-1] * len(ids)
+    for i, page in enumerate(ids):
+        slot = slot_of[page]
+        if slot >= 0:
+            referenced[slot] = 1
+            continue
+        fault[i] = 1
+        if len(slots) < frames:
+            slot_of[page] = len(slots)
+            referenced[len(slots)] = 1
+            slots.append(page)
+            continue
+        while referenced[hand]:
+            referenced[hand] = 0
+            hand = hand + 1 if hand + 1 < frames else 0
+        evicted = slots[hand]
+        slot_of[evicted] = -1
+        victim[i] = evicted
+        slots[hand] = page
+        slot_of[page] = hand
+        referenced[hand] = 1
+        hand = hand + 1 if hand + 1 < frames else 0
+    return fault, victim
+
+
+def _lfu(ids, pages, frames):
+    # Heap entries are (uses, last use, page); an entry is stale once the
+    # page has been used again or evicted, i.e. its last use no longer matches.
+    uses = [0] * pages
+    last = [-1] * pages
+    heap = []
+    resident = 0
+    fault = bytearray(len(ids))
+    victim = [-1] * len(ids)
+    for i, page in enumerate(ids):
+        if last[page] >= 0:
+            uses[page] += 1
+        else:
+            fault[i] = 1
+            if resident == frames:
+                while True:
+                    _, when, evicted = heappop(heap)
+                    if last[evicted] == when:
+                        break
+                last[evicted] = -1
+                victim[i] = evicted
+            else:
+                resident += 1
+            uses[page] = 1
+        last[page] = i
+        heappush(heap, (uses[page], i, page))
+        if len(heap) > STALE_FACTOR * frames:
+            heap = [entry for entry in heap if last[entry[2]] == entry[1]]
+            heapify(heap)
+    return fault, victim
+
+
+def _opt(ids, pages, frames):
+    # Max-heap of (-next use, page); an entry is stale once the page's
+    # upcoming use has moved on (it was referenced again) or it was evicted.
+    upcoming = [-1] * pages
+    heap = []
+    resident = 0
+    fault = bytearray(len(ids))
+    victim = [-1] * len(ids)
+    for i, (page, after) in enumerate(zip(ids, next_use(np.asarray(ids)).tolist())):
+        if upcoming[page] < 0:
+            fault[i] = 1
+            if resident == frames:
+                while True:
+                    when, evicted = heappop(heap)
+                    if upcoming[evicted] == -when:
+                        break
+                upcoming[evicted] = -1
+                victim[i] = evicted
+            else:
+                resident += 1
+        upcoming[page] = after
+        heappush(heap, (-after, page))
+        if len(heap) > STALE_FACTOR * frames:
+            heap = [entry for entry in heap if upcoming[entry[1]] == -entry[0]]
+            heapify(heap)
+    return fault, victim
+
+
+_POLICIES = {"FIFO": _fifo, "LRU": _lru, "Clock": _clock, "LFU": _lfu, "OPT": _opt}
+
+
+def _repeats(ids):
+    """Mask of references to the page referenced just before, which always hit."""
+    repeat = np.zeros(len(ids), dtype=bool)
+    repeat[1:] = ids[1:] == ids[:-1]
+    return repeat
+
+
+def simulate(algorithm, references, frames):
+    """Run ``references`` through ``frames`` frames under ``algorithm``.
+
+    Immediate repeats of a page are hits that leave FIFO, LRU, Clock and
+    OPT state unchanged, so those policies only walk the remaining
+    references.
+    """
+    if algorithm not in _POLICIES:
+        raise ValueError(f"unknown page-replacement algorithm: {algorithm!r}")
+    if frames < 1:
+        raise ValueError("frames must be at least 1")
+    references = as_references(references)
+    pages, ids = dense_pages(references)
+    fault = np.zeros(len(ids), dtype=bool)
+    victim = np.full(len(ids), -1, dtype=np.int64)
+    keep = ~_repeats(ids) if algorithm in _REPEAT_SAFE else slice(None)
+    walked_fault, walked_victim = _POLICIES[algorithm](ids[keep].tolist(), len(pages), frames)
+    fault[keep] = np.frombuffer(walked_fault, dtype=bool)
+    walked_victim = np.asarray(walked_victim, dtype=np.int64)
+    victim[keep] = np.where(walked_victim >= 0, pages[walked_victim], -1)
+    return PagingResult(algorithm=algorithm, frames=frames, fault=fault, victim=victim)
+
+
+def fault_curve(algorithm, references, frame_counts):
+    """Faults of ``algorithm`` at each of ``frame_counts`` (sorted ascending).
+
+    LRU takes a single stack-distance pass; the other policies run once per
+    frame count.  With at least as many frames as distinct pages only the
+    first reference to each page faults, so those counts are not simulated.
+    """
+    if algorithm not in _POLICIES:
+        raise ValueError(f"unknown page-replacement algorithm: {algorithm!r}")
+    frame_counts = np.unique(np.asarray(frame_counts, dtype=np.int64))
+    if len(frame_counts) and frame_counts[0] < 1:
+        raise ValueError("frames must be at least 1")
+    references = as_references(references)
+    pages, ids = dense_pages(references)
+    faults = np.full(len(frame_counts), len(pages), dtype=np.int64)
+    needed = frame_counts < len(pages)
+    if algorithm == "LRU" and needed.any():
+        keep = ~_repeats(ids)
+        depth = int(frame_counts[needed][-1])
+        hits = np.bincount(stack_distances(ids[keep], depth), minlength=depth + 1)
+        hits[0] = 0
+        faults[needed] = len(ids) - np.count_nonzero(~keep) - np.cumsum(hits)[frame_counts[needed]]
+    elif needed.any():
+        keep = ~_repeats(ids) if algorithm in _REPEAT_SAFE else slice(None)
+        walked = ids[keep].tolist()
+        for k in np.flatnonzero(needed).tolist():
+            fault, _ = _POLICIES[algorithm](walked, len(pages), int(frame_counts[k]))
+            faults[k] = sum(fault)
+    return FaultCurve(algorithm=algorithm, frames=frame_counts, faults=faults, references=len(ids))
+
+
+def belady_anomalies(curve):
+    """``(frames, more_frames)`` pairs of consecutive curve points where faults went up."""
+    rises = np.flatnonzero(np.diff(curve.faults) > 0)
+    return [(int(curve.frames[k]), int(curve.frames[k + 1])) for k in rises.tolist()]
@@ -0,0 +1,114 @@
+"""Static Three.js scenes and the simulation payloads that drive them.
+
+Scene pages live in the app's ``static/`` directory, which Streamlit serves
+under ``app/static/`` when ``server.enableStaticServing`` is on.  A page is
+read and hashed once per process; each simulation only contributes a
+compact JSON payload, either inlined into the page for
+``st.components.v1.html`` or appended as the URL fragment of the static
+route, so the served file itself never changes between runs.
+``vr_scene.html`` replays a schedule, or given a ``stream`` URL follows a
+live broadcast; ``memory_grid.html`` draws a static allocation.  Pages
+load three.js from ``static/vendor/`` (see ``osplatform.assets``).
+"""
+
+import base64
+import hashlib
+import json
+from functools import lru_cache
+from urllib.parse import quote
+
+import numpy as np
+
+from osplatform import assets
+from osplatform.assets import STATIC_DIR, STATIC_ROUTE
+
+# Milliseconds of scene time per simulated time unit.
+TIME_UNIT_MS = 100
+# Longest payload offered in a URL fragment; larger scenes are only inlined.
+MAX_FRAGMENT = 1 << 16
+
+_DATA_SLOT = '<script id="scene-data" type="application/json">null</script>'
+
+
+@lru_cache(maxsize=None)
+def scene_asset(name):
+    """Return ``(html, digest)`` for a page in ``STATIC_DIR``.
+
+    ``digest`` is the first 12 hex digits of the page's SHA-256, used to
+    version the static URL so browsers may cache it until the file changes.
+    """
+    html = (STATIC_DIR / name).read_text(encoding="utf-8")
+    if _DATA_SLOT not in html:
+        raise ValueError(f"{name} has no scene-data slot")
+    return html, hashlib.sha256(html.encode("utf-8")).hexdigest()[:12]
+
+
+def schedule_columns(result, names, time_unit_ms=TIME_UNIT_MS):
+    """The per-process columns and Gantt slices a scene reads, as plain lists.
+
+    Besides the per-process columns this carries the Gantt slices in
+    execution order and the process ids sorted by arrival, so a scene can
+    replay the schedule with two forward-only cursors.
+    """
+    return {
+        "algorithm": result.algorithm,
+        "timeUnitMs": time_unit_ms,
+        "names": [str(name) for name in names],
+        "arrival": result.arrival.tolist(),
+        "burst": result.burst.tolist(),
+        "completion": result.completion.tolist(),
+        "arrivalOrder": np.argsort(result.arrival, kind="stable").tolist(),
+        "gantt": {key: values.tolist() for key, values in result.gantt.items()},
+    }
+
+
+def schedule_payload(result, names, time_unit_ms=TIME_UNIT_MS):
+    """Serialize a ``ScheduleResult`` as the compact JSON a scene reads."""
+    return json.dumps(schedule_columns(result, names, time_unit_ms), separators=(",", ":"))
+
+
+def allocation_payload(result):
+    """Serialize an ``AllocationResult`` for the memory grid scene.
+
+    The columns travel as base64 little-endian typed arrays rather than
+    per-object JSON, so a scene decodes 100k blocks into ``Float64Array``
+    and ``Int32Array`` views without parsing a number at a time: block
+    sizes, then each process's size, block (-1 if it did not fit) and
+    offset in that block, in placement order.
+    """
+
+    def column(values, dtype):
+        return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode("ascii")
+
+    return json.dumps({
+        "strategy": result.strategy,
+        "blocks": len(result.blocks),
+        "processes": len(result),
+        "blockSize": column(result.blocks, "<f8"),
+        "size": column(result.processes, "<f8"),
+        "block": column(result.allocation, "<i4"),
+        "offset": column(result.offset, "<f8"),
+    }, separators=(",", ":"))
+
+
+def stream_payload(url):
+    """Payload that makes a scene follow the live broadcast at ``url`` (see ``osplatform.streaming``)."""
+    return json.dumps({"stream": url}, separators=(",", ":"))
+
+
+def embed(name, payload, asset_base=STATIC_ROUTE):
+    """Page ``name`` with ``payload`` inlined, for ``st.components.v1.html``.
+
+    ``asset_base`` is where the vendored three.js bundle is served from.
+    """
+    html, _ = scene_asset(name)
+    # "</" would end the script element early; "<\/" is the same JSON string.
+    data = payload.replace("</", "<\\/")
+    return assets.link(html.replace(_DATA_SLOT, _DATA_SLOT.replace("null", data), 1), asset_base)
+
+
+def static_url(name, payload=None):
+    """Versioned ``app/static`` URL of page ``name``, carrying ``payload`` in the fragment."""
+    _, digest = scene_asset(name)
+    url = f"{STATIC_ROUTE}/{name}?v={digest}"
+    return f"{url}#{quote(payload, safe='')}" if payload else url
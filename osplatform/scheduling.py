@@ -0,0 +1,569 @@
+"""Headless CPU scheduling engine.
+
+Every scheduler takes per-process burst and arrival vectors (any sequence or
+NumPy array, indexed by process id) and returns a ``ScheduleResult`` whose
+columns live in one typed ``ProcessTable``, so the same code backs the
+Streamlit page, benchmarks and batch runs without touching any UI library.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from heapq import heapify, heappop, heappush
+
+import numpy as np
+
+
+# Per-process columns of a ``ProcessTable``.  The result columns come first
+# so the displayed table is one contiguous slice of the backing array.
+RESULT_COLUMNS = ("arrival", "burst", "completion", "turnaround", "waiting")
+TABLE_COLUMNS = RESULT_COLUMNS + ("start", "remaining")
+
+
+def _table_dtype(burst, arrival):
+    """int32 when every time the schedule can produce fits, else int64/float64."""
+    if burst.dtype.kind != "i":
+        return np.dtype(np.float64)
+    if len(burst) == 0:
+        return np.dtype(np.int32)
+    # No completion is later than the last arrival plus all the work, and
+    # turnaround/waiting are bounded by twice that.
+    bound = float(np.abs(arrival).max()) + float(np.abs(burst).sum(dtype=np.float64))
+    return np.dtype(np.int32 if 2 * bound < np.iinfo(np.int32).max else np.int64)
+
+
+class ProcessTable:
+    """Struct-of-arrays state shared by every scheduler.
+
+    All columns live in one ``(len(TABLE_COLUMNS), n)`` array, so each column
+    is a contiguous typed view (``table.burst``, ``table.remaining``, ...)
+    that the schedulers fill in place.  Integer workloads use int32 columns
+    whenever the schedule's times are known to fit, halving the footprint of
+    int64; a caller whose schedule can outrun that bound (e.g. by adding
+    switch overhead) passes ``dtype``.  ``start`` is ``-1`` until the
+    process is first dispatched.
+
+    ``remaining`` is the one column touched on every CPU slice; the event
+    loops keep it as a Python list while they run (typed-buffer access costs
+    10-20% there) and write it back when they finish.
+    """
+
+    def __init__(self, burst, arrival, dtype=None):
+        dtype = _table_dtype(burst, arrival) if dtype is None else np.dtype(dtype)
+        self.data = np.empty((len(TABLE_COLUMNS), len(burst)), dtype=dtype)
+        (self.arrival, self.burst, self.completion, self.turnaround,
+         self.waiting, self.start, self.remaining) = self.data
+        self.arrival[:] = arrival
+        self.burst[:] = burst
+        self.remaining[:] = burst
+        self.completion.fill(0)
+        self.start.fill(-1)
+
+    def __len__(self):
+        return self.data.shape[1]
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def view(self, name):
+        """Writable ``memoryview`` of one column for scalar access in hot loops.
+
+        Reads and writes go straight to the typed buffer, so no per-process
+        Python list is ever built.
+        """
+        return memoryview(self.data[TABLE_COLUMNS.index(name)])
+
+    def finish(self):
+        """Fill the derived columns once ``start`` and ``completion`` are set."""
+        np.subtract(self.completion, self.arrival, out=self.turnaround)
+        np.subtract(self.turnaround, self.burst, out=self.waiting)
+
+    def frame(self, rows=slice(None), labels=RESULT_COLUMNS):
+        """``RESULT_COLUMNS`` as a DataFrame that shares memory with the table.
+
+        ``rows`` must be a slice (fancy indexing would copy); ``labels``
+        renames the columns in ``RESULT_COLUMNS`` order.
+        """
+        import pandas as pd
+
+        block = self.data[:len(RESULT_COLUMNS), rows]
+        return pd.DataFrame(block.T, columns=list(labels), copy=False)
+
+    def records(self):
+        """Copy of the table as a structured array, one record per process."""
+        records = np.empty(len(self), dtype=[(name, self.dtype) for name in TABLE_COLUMNS])
+        for name, column in zip(TABLE_COLUMNS, self.data):
+            records[name] = column
+        return records
+
+
+@dataclass
+class ScheduleResult:
+    """A filled ``ProcessTable`` plus a Gantt segment table.
+
+    All per-process columns are indexed by the original process id.
+    ``start`` is the first time the process was dispatched.  ``gantt`` holds
+    three equal-length arrays -- ``pid``, ``start`` and ``end`` -- one row per
+    CPU slice, in execution order.  ``quantum`` and ``priority`` record the
+    remaining scheduler inputs, where used, so ``resimulate`` can tell what
+    changed.  Multi-core runs (``osplatform.multicore``) add a ``cpu`` Gantt
+    column and set ``cpus`` and ``switch_time``, the total time cores spent
+    switching between jobs.
+    """
+
+    algorithm: str
+    table: ProcessTable
+    gantt: dict = field(default_factory=dict)
+    quantum: int = None
+    priority: np.ndarray = None
+    cpus: int = 1
+    switch_time: int = 0
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def arrival(self):
+        return self.table.arrival
+
+    @property
+    def burst(self):
+        return self.table.burst
+
+    @property
+    def start(self):
+        return self.table.start
+
+    @property
+    def completion(self):
+        return self.table.completion
+
+    @property
+    def turnaround(self):
+        return self.table.turnaround
+
+    @property
+    def waiting(self):
+        return self.table.waiting
+
+    @property
+    def response(self):
+        return self.start - self.arrival
+
+
+def _as_columns(burst_time, arrival_time):
+    burst = np.asarray(burst_time)
+    arrival = np.asarray(arrival_time)
+    if burst.shape != arrival.shape or burst.ndim != 1:
+        raise ValueError("burst_time and arrival_time must be 1-D and the same length")
+    dtype = np.result_type(burst, arrival, np.int64)
+    return burst.astype(dtype, copy=False), arrival.astype(dtype, copy=False)
+
+
+def _gantt_buffers(table):
+    typecode = "q" if table.dtype.kind == "i" else "d"
+    return array("q"), array(typecode), array(typecode)
+
+
+def _complete_idle(table):
+    # Zero-length jobs never occupy the CPU and complete on arrival.
+    idle = table.burst <= 0
+    table.start[idle] = table.completion[idle] = table.arrival[idle]
+
+
+def _finish(algorithm, table, gantt_pid, gantt_start, gantt_end, quantum=None, priority=None):
+    table.finish()
+    dtype = np.int64 if table.dtype.kind == "i" else np.float64
+    return ScheduleResult(
+        algorithm=algorithm,
+        table=table,
+        gantt={
+            "pid": np.asarray(gantt_pid, dtype=np.int64),
+            "start": np.asarray(gantt_start, dtype=dtype),
+            "end": np.asarray(gantt_end, dtype=dtype),
+        },
+        quantum=quantum,
+        priority=priority,
+    )
+
+
+def fcfs(burst_time, arrival_time):
+    """First-Come-First-Served in input order.
+
+    ``completion[i] = max(completion[i-1], arrival[i]) + burst[i]`` unrolls to
+    ``S[i] + max(0, max_{j<=i}(arrival[j] - S[j-1]))`` with ``S`` the running
+    burst sum, so the whole schedule is one cumulative sum and one cumulative
+    max.
+    """
+    table = ProcessTable(*_as_columns(burst_time, arrival_time))
+    return _fcfs_from(table, 0)
+
+
+def _fcfs_from(table, first):
+    """Fill FCFS rows ``first:`` of ``table``, whose earlier rows are already set.
+
+    The CPU is free from ``completion[first - 1]`` (time 0 for the first
+    row), which simply replaces the 0 in the closed form above.
+    """
+    burst = table.burst[first:]
+    served = np.cumsum(burst)
+    offset = np.maximum.accumulate(table.arrival[first:] - (served - burst)) if len(burst) else served
+    free_at = table.completion[first - 1] if first else 0
+    table.completion[first:] = served + np.maximum(offset, free_at)
+    np.subtract(table.completion, table.burst, out=table.start)
+    table.remaining.fill(0)
+    pid = np.arange(len(table))
+    return _finish("FCFS", table, pid, table.start, table.completion)
+
+
+def _heap_schedule(algorithm, table, rank, preemptive, resume=None):
+    """Shared min-heap dispatcher for SJF, SRTF and Priority.
+
+    The ready heap is keyed on ``(rank, arrival, pid)``; ``rank=None`` ranks
+    by remaining time (SRTF).  Processes are fed in from an arrival-sorted
+    cursor, and a preemptive run is only cut short at the next arrival -- the
+    one point where the heap top can change -- so time never advances in
+    unit steps.  ``resume`` continues a partial schedule (see ``resimulate``).
+    """
+    n = len(table)
+    order_index = np.argsort(table.arrival, kind="stable")
+    order = memoryview(order_index)
+    sorted_arrivals = memoryview(table.arrival[order_index])
+    arrivals = table.view("arrival")
+    remaining_time = table.remaining.tolist()
+    start = table.view("start")
+    completion = table.view("completion")
+    ranks = memoryview(np.ascontiguousarray(rank, dtype=np.result_type(rank, np.int64))) if rank is not None else None
+    if resume is None:
+        gantt_pid, gantt_start, gantt_end = _gantt_buffers(table)
+        heap = []
+        time = 0
+        cursor = 0
+    else:
+        time, cursor, ready, (gantt_pid, gantt_start, gantt_end) = resume
+        heap = [(ranks[i] if ranks is not None else remaining_time[i], arrivals[i], i) for i in ready]
+        heapify(heap)
+
+    pending = int(np.count_nonzero(table.remaining > 0))
+    while pending:
+        while cursor < n and sorted_arrivals[cursor] <= time:
+            i = order[cursor]
+            if remaining_time[i] > 0:
+                key = ranks[i] if ranks is not None else remaining_time[i]
+                heappush(heap, (key, arrivals[i], i))
+            cursor += 1
+
+        if not heap:
+            time = max(time, sorted_arrivals[cursor])
+            continue
+
+        _, _, i = heappop(heap)
+        if start[i] < 0:
+            start[i] = time
+        run = remaining_time[i]
+        if preemptive and cursor < n:
+            run = min(run, sorted_arrivals[cursor] - time)
+
+        # A preemption check that keeps the same process running extends its
+        # current slice instead of opening a new one.
+        if gantt_pid and gantt_pid[-1] == i and gantt_end[-1] == time:
+            gantt_end[-1] = time + run
+        else:
+            gantt_pid.append(i)
+            gantt_start.append(time)
+            gantt_end.append(time + run)
+        time += run
+        remaining_time[i] -= run
+        if remaining_time[i] > 0:
+            key = ranks[i] if ranks is not None else remaining_time[i]
+            heappush(heap, (key, arrivals[i], i))
+        else:
+            completion[i] = time
+            pending -= 1
+
+    table.remaining[:] = remaining_time
+    _complete_idle(table)
+    return _finish(algorithm, table, gantt_pid, gantt_start, gantt_end,
+                   priority=np.array(rank) if algorithm in PRIORITY_ALGORITHMS else None)
+
+
+def sjf(burst_time, arrival_time):
+    """Non-preemptive Shortest-Job-First.
+
+    Ties on burst go to the earlier arrival, then the lower process id.
+    """
+    table = ProcessTable(*_as_columns(burst_time, arrival_time))
+    return _heap_schedule("SJF", table, table.burst, preemptive=False)
+
+
+def srtf(burst_time, arrival_time):
+    """Shortest-Remaining-Time-First, the preemptive form of SJF.
+
+    A running process is only preempted by an arrival with strictly less
+    remaining work; ties go to the earlier arrival, then the lower process id.
+    """
+    table = ProcessTable(*_as_columns(burst_time, arrival_time))
+    return _heap_schedule("SRTF", table, None, preemptive=True)
+
+
+def priority(burst_time, arrival_time, priority_level, preemptive=False):
+    """Priority scheduling; a lower ``priority_level`` runs first.
+
+    Ties go to the earlier arrival, then the lower process id.  With
+    ``preemptive=True`` a newly arrived process with a strictly better
+    priority takes the CPU immediately.
+    """
+    burst, arrival = _as_columns(burst_time, arrival_time)
+    rank = np.asarray(priority_level)
+    if rank.shape != burst.shape:
+        raise ValueError("priority_level must have one entry per process")
+    name = "Priority (Preemptive)" if preemptive else "Priority (Non-preemptive)"
+    return _heap_schedule(name, ProcessTable(burst, arrival), rank, preemptive)
+
+
+def round_robin(burst_time, arrival_time, quantum=2):
+    """Round Robin with a fixed time ``quantum``.
+
+    Event driven: processes are admitted from an arrival-sorted cursor into a
+    deque, and an idle CPU jumps straight to the next arrival.  A process
+    preempted at the end of its slice re-enters the ready queue ahead of
+    anything that arrived during that slice; processes arriving in the same
+    admission step are queued in process-id order.
+    """
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+    return _round_robin(ProcessTable(*_as_columns(burst_time, arrival_time)), quantum)
+
+
+def _round_robin(table, quantum, resume=None):
+    n = len(table)
+    order_index = np.argsort(table.arrival, kind="stable")
+    order = memoryview(order_index)
+    sorted_arrivals = memoryview(table.arrival[order_index])
+    remaining_time = table.remaining.tolist()
+    start = table.view("start")
+    completion = table.view("completion")
+    if resume is None:
+        gantt_pid, gantt_start, gantt_end = _gantt_buffers(table)
+        queue = deque()
+        time = 0
+        cursor = 0
+    else:
+        time, cursor, ready, (gantt_pid, gantt_start, gantt_end) = resume
+        queue = deque(ready)
+
+    pending = int(np.count_nonzero(table.remaining > 0))
+    while pending:
+        if cursor < n and sorted_arrivals[cursor] <= time:
+            stop = bisect_right(sorted_arrivals, time, cursor)
+            batch = order[cursor:stop]
+            if len(batch) > 1:
+                batch = sorted(batch)
+            queue.extend(i for i in batch if remaining_time[i] > 0)
+            cursor = stop
+
+        if not queue:
+            time = max(time, sorted_arrivals[cursor])
+            continue
+
+        i = queue.popleft()
+        if start[i] < 0:
+            start[i] = time
+        execution_time = min(quantum, remaining_time[i])
+        gantt_pid.append(i)
+        gantt_start.append(time)
+        time += execution_time
+        gantt_end.append(time)
+        remaining_time[i] -= execution_time
+        if remaining_time[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = time
+            pending -= 1
+
+    table.remaining[:] = remaining_time
+    _complete_idle(table)
+    return _finish("Round Robin", table, gantt_pid, gantt_start, gantt_end, quantum=quantum)
+
+
+ALGORITHMS = {
+    "FCFS": fcfs,
+    "SJF": sjf,
+    "SRTF": srtf,
+    "Round Robin": round_robin,
+    "Priority (Non-preemptive)": priority,
+    "Priority (Preemptive)": partial(priority, preemptive=True),
+}
+
+# Algorithms whose behaviour depends on the time quantum.
+QUANTUM_ALGORITHMS = {"Round Robin"}
+# Algorithms that need a per-process priority vector.
+PRIORITY_ALGORITHMS = {"Priority (Non-preemptive)", "Priority (Preemptive)"}
+
+
+def simulate(algorithm, burst_time, arrival_time, quantum=2, priority_level=None):
+    """Run any entry of ``ALGORITHMS`` through one uniform signature."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown scheduling algorithm: {algorithm!r}")
+    scheduler = ALGORITHMS[algorithm]
+    if algorithm in QUANTUM_ALGORITHMS:
+        return scheduler(burst_time, arrival_time, quantum=quantum)
+    if algorithm in PRIORITY_ALGORITHMS:
+        if priority_level is None:
+            raise ValueError(f"{algorithm} needs a priority for every process")
+        return scheduler(burst_time, arrival_time, priority_level)
+    return scheduler(burst_time, arrival_time)
+
+
+def _replay_prefix(previous, table, slices, until=None):
+    """Load the first ``slices`` Gantt slices of ``previous`` into ``table``.
+
+    The last kept slice is clipped to end at ``until`` when given.  Sets the
+    start, remaining and completion columns the prefix implies and returns
+    it as fresh Gantt buffers for the scheduler to append to.
+    """
+    pid = previous.gantt["pid"][:slices]
+    begin = previous.gantt["start"][:slices]
+    end = previous.gantt["end"][:slices]
+    if until is not None:
+        end = np.minimum(end, until)
+    executed = np.bincount(pid, weights=end - begin, minlength=len(table))
+    np.subtract(table.burst, executed.astype(table.dtype), out=table.remaining)
+    ran, first = np.unique(pid, return_index=True)
+    table.start[ran] = begin[first]
+    _, last = np.unique(pid[::-1], return_index=True)
+    done = table.remaining[ran] <= 0
+    table.completion[ran[done]] = end[slices - 1 - last[done]]
+
+    gantt_pid, gantt_start, gantt_end = _gantt_buffers(table)
+    gantt_pid.frombytes(np.ascontiguousarray(pid, dtype=np.int64).tobytes())
+    gantt_start.frombytes(np.ascontiguousarray(begin, dtype=gantt_start.typecode).tobytes())
+    gantt_end.frombytes(np.ascontiguousarray(end, dtype=gantt_end.typecode).tobytes())
+    return gantt_pid, gantt_start, gantt_end
+
+
+def _heap_resume(previous, table, since, preemptive):
+    """Resume state for ``_heap_schedule`` when nothing before ``since`` changed.
+
+    Slices dispatched before ``since`` are kept.  A preemptive run is cut at
+    ``since`` (the new run can only differ from there); a non-preemptive one
+    keeps the slice in progress and resumes when it ends.
+    """
+    slices = int(np.searchsorted(previous.gantt["start"], since, side="left"))
+    if not slices:
+        return None
+    end = previous.gantt["end"][slices - 1].item()
+    if preemptive or end <= since:
+        time, until = since, since
+    else:
+        time, until = end, None
+    gantt = _replay_prefix(previous, table, slices, until)
+    order = np.argsort(table.arrival, kind="stable")
+    cursor = int(np.searchsorted(table.arrival[order], time, side="right"))
+    admitted = order[:cursor]
+    ready = admitted[table.remaining[admitted] > 0].tolist()
+    return time, cursor, ready, gantt
+
+
+def _round_robin_resume(previous, table, since):
+    """Resume state for ``_round_robin`` when nothing before ``since`` changed.
+
+    The last slice dispatched before ``since`` always runs its full quantum,
+    so the run resumes where it ends.  The ready queue at that point holds
+    every admitted, unfinished process, in the order the previous run went
+    on to dispatch them.
+    """
+    slices = int(np.searchsorted(previous.gantt["start"], since, side="left"))
+    if not slices:
+        return None
+    dispatched = previous.gantt["start"][slices - 1]
+    time = previous.gantt["end"][slices - 1].item()
+    gantt = _replay_prefix(previous, table, slices)
+    order = np.argsort(table.arrival, kind="stable")
+    cursor = int(np.searchsorted(table.arrival[order], dispatched, side="right"))
+    admitted = order[:cursor]
+    waiting = admitted[table.remaining[admitted] > 0]
+    queue = previous.gantt["pid"][slices:slices + len(waiting)]
+    if not np.array_equal(np.sort(queue), np.sort(waiting)):
+        return None
+    return time, cursor, queue.tolist(), gantt
+
+
+def resimulate(previous, burst_time, arrival_time, quantum=None, priority_level=None):
+    """Re-run ``previous.algorithm`` on edited inputs, reusing what cannot change.
+
+    Editing one process can only change the schedule from the earliest of
+    its old and new arrival times, so the Gantt slices dispatched before
+    that point are copied and the scheduler resumes from there with its
+    ready set rebuilt.  FCFS recomputes only the rows from the first edited
+    process on.  A different process count, quantum or column dtype, or
+    float times, fall back to a full ``simulate``; unchanged inputs return
+    ``previous``.
+    """
+    algorithm = previous.algorithm
+    quantum = previous.quantum if quantum is None else quantum
+    burst, arrival = _as_columns(burst_time, arrival_time)
+    rank = np.asarray(priority_level) if algorithm in PRIORITY_ALGORITHMS else None
+    if (len(burst) != len(previous) or quantum != previous.quantum
+            or (rank is not None and rank.shape != burst.shape)):
+        return simulate(algorithm, burst, arrival, quantum=quantum, priority_level=priority_level)
+
+    changed = (burst != previous.burst) | (arrival != previous.arrival)
+    if rank is not None:
+        changed |= rank != previous.priority
+    edited = np.flatnonzero(changed)
+    if not len(edited):
+        return previous
+    table = ProcessTable(burst, arrival)
+    # Replaying a prefix re-derives remaining work from slice lengths, which
+    # is only exact for integer times.
+    if table.dtype != previous.table.dtype or table.dtype.kind != "i":
+        return simulate(algorithm, burst, arrival, quantum=quantum, priority_level=priority_level)
+
+    if algorithm == "FCFS":
+        first = int(edited[0])
+        table.completion[:first] = previous.completion[:first]
+        return _fcfs_from(table, first)
+
+    since = min(previous.arrival[edited].min(), arrival[edited].min()).item()
+    if algorithm in QUANTUM_ALGORITHMS:
+        return _round_robin(table, quantum, _round_robin_resume(previous, table, since))
+    preemptive = algorithm in ("SRTF", "Priority (Preemptive)")
+    if algorithm == "SRTF":
+        rank = None
+    elif algorithm == "SJF":
+        rank = table.burst
+    return _heap_schedule(algorithm, table, rank, preemptive, _heap_resume(previous, table, since, preemptive))
+
+
+def summarize(result):
+    """Aggregate metrics of one schedule as a flat dict.
+
+    Throughput is completed processes per time unit over the span from the
+    first arrival to the last completion; a context switch is counted every
+    time consecutive Gantt slices (on the same core) belong to different
+    processes.
+    """
+    n = len(result)
+    if n == 0:
+        return {"processes": 0, "avg_waiting": 0.0, "avg_turnaround": 0.0,
+                "avg_response": 0.0, "throughput": 0.0, "context_switches": 0}
+    pid = result.gantt["pid"]
+    switches = pid[1:] != pid[:-1]
+    if "cpu" in result.gantt:
+        # Cores switch independently, so only neighbours within a lane count.
+        lanes = np.argsort(result.gantt["cpu"], kind="stable")
+        pid, cpu = pid[lanes], result.gantt["cpu"][lanes]
+        switches = (pid[1:] != pid[:-1]) & (cpu[1:] == cpu[:-1])
+    makespan = result.completion.max() - result.arrival.min()
+    return {
+        "processes": n,
+        "avg_waiting": float(result.waiting.mean()),
+        "avg_turnaround": float(result.turnaround.mean()),
+        "avg_response": float(result.response.mean()),
+        "throughput": float(n / makespan) if makespan > 0 else float("inf"),
+        "context_switches": int(np.count_nonzero(switches)),
+    }
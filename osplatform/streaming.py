@@ -0,0 +1,608 @@
+"""Live streaming of one simulation to many 3D-scene viewers over WebSockets.
+
+An instructor publishes a ``Broadcast`` -- the event log of a simulation
+that has already run once, in Python -- under a session name on a
+``StreamHub``.  Every scene that connects to ``ws://host:port/<session>``
+follows the broadcast's single clock, which the instructor plays, pauses,
+speeds up or restarts; viewers never simulate anything themselves, and one
+more viewer costs one more socket, not one more simulation.
+
+On connecting, a viewer receives a JSON text ``hello`` with the static
+columns it needs to build its scene, then one or more binary frames
+catching it up to the current clock.  After that the hub pushes one binary
+frame per animation frame (``FRAME_SECONDS``) carrying every event that
+became due.  A frame is a ``HEADER`` (version, channel, flags, record
+count, clock) followed by ``EVENT_DTYPE`` records, all little-endian, so a
+browser reads it with one ``DataView``.  Frames for one viewer are encoded
+from bytes shared by all viewers.
+
+Each viewer has a bounded outgoing queue.  A viewer whose socket drains
+slower than frames are produced first has further frames merged into its
+last queued one (fewer, larger frames, nothing lost); once more than
+``MAX_PENDING_BYTES`` are queued it is disconnected with close code 1013,
+and the scene reconnects and catches up from the shared log.
+
+The server is a small RFC 6455 implementation on ``asyncio`` streams with
+no dependency beyond the standard library, so the same code is the
+production endpoint (``serve`` runs it on a daemon thread next to the
+app) and a local stand-in for tests::
+
+    python -m osplatform.streaming --port 8765 --algo rr --processes 20
+
+``watch`` is the matching client, yielding decoded messages.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import deque
+
+import numpy as np
+
+from osplatform import dynamic_allocation, scenes
+
+VERSION = 2
+SCHEDULE, MEMORY = 1, 2
+CHANNELS = {"schedule": SCHEDULE, "memory": MEMORY}
+ARRIVE, DISPATCH, RELEASE, ALLOC, FREE = 1, 2, 3, 4, 5
+# Event flags: a RELEASE that completes its process, an ALLOC that failed.
+DONE = FAILED = 1
+
+HEADER = struct.Struct("<BBHId")
+EVENT_DTYPE = np.dtype([("op", "u1"), ("flags", "u1"), ("lane", "<u2"), ("id", "<u4"),
+                        ("time", "<f8"), ("a", "<i8"), ("b", "<i8")])
+
+# One frame per display refresh; events due between ticks share a frame.
+FRAME_SECONDS = 1 / 60
+# Queued frames per viewer before new events are merged into the last one.
+MAX_PENDING_FRAMES = 8
+# Queued bytes after which a lagging viewer is dropped (it reconnects).
+MAX_PENDING_BYTES = 8 << 20
+# Records per catch-up frame sent to a viewer that joins mid-broadcast.
+CATCH_UP_RECORDS = 1 << 16
+# Milliseconds of stream time per allocator event at 1x.
+MEMORY_UNIT_MS = 10
+# Largest message accepted from a viewer (they only send control frames).
+MAX_CLIENT_MESSAGE = 1 << 16
+# Seconds a closing socket may take to flush before it is aborted.
+CLOSE_TIMEOUT = 5
+
+_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_TEXT, _BINARY, _CLOSE, _PING, _PONG = 0x1, 0x2, 0x8, 0x9, 0xA
+CLOSE_NORMAL, CLOSE_TOO_BIG, CLOSE_TRY_AGAIN = 1000, 1009, 1013
+
+
+def schedule_events(result):
+    """Arrival, dispatch and release events of a ``ScheduleResult`` in time order.
+
+    ``ARRIVE`` carries the burst in ``a``; ``DISPATCH`` and ``RELEASE``
+    bracket each Gantt slice on its ``lane`` (core), and a release that
+    finishes the process is flagged ``DONE``.  At equal times releases come
+    first, then arrivals, then dispatches.
+    """
+    n = len(result)
+    gantt = result.gantt
+    pid = gantt["pid"]
+    m = len(pid)
+    lane = gantt.get("cpu", np.zeros(m, dtype=np.int64))
+    events = np.zeros(n + 2 * m, dtype=EVENT_DTYPE)
+    arrive, dispatch, release = events[:n], events[n:n + m], events[n + m:]
+    arrive["op"] = ARRIVE
+    arrive["id"] = np.arange(n)
+    arrive["time"] = result.arrival
+    arrive["a"] = result.burst
+    for part, op, time in ((dispatch, DISPATCH, gantt["start"]), (release, RELEASE, gantt["end"])):
+        part["op"] = op
+        part["id"] = pid
+        part["lane"] = lane
+        part["time"] = time
+    release["flags"] = gantt["end"] >= result.completion[pid]
+    rank = np.select([events["op"] == RELEASE, events["op"] == ARRIVE], [0, 1], 2)
+    return events[np.lexsort((rank, events["time"]))]
+
+
+def memory_events(events, capacity, strategy="First-Fit"):
+    """Replay ``(op, id, size)`` events and return the placements as event records.
+
+    ``ALLOC`` and ``FREE`` carry the address in ``a`` and the size in ``b``
+    and are timed by event number; a failed allocation (including one
+    ``replay`` refuses) is flagged ``FAILED`` with address -1, and frees of
+    ids that are not live are dropped.  Ids are stored modulo 2**32.
+    """
+    allocator = dynamic_allocation.make_allocator(strategy, capacity)
+    live = {}
+    ops, flags, ids, steps = array("B"), array("B"), array("q"), array("q")
+    addresses, sizes = array("q"), array("q")
+    for step, (op, block_id, size) in enumerate(events):
+        if op == "alloc":
+            address = allocator.malloc(size) if size > 0 and block_id not in live else None
+            if address is not None:
+                live[block_id] = (address, size)
+            row = (ALLOC, FAILED if address is None else 0, -1 if address is None else address)
+        elif op == "free":
+            placed = live.pop(block_id, None)
+            if placed is None:
+                continue
+            allocator.free(*placed)
+            address, size = placed
+            row = (FREE, 0, address)
+        else:
+            raise ValueError(f"unknown trace operation: {op!r}")
+        ops.append(row[0])
+        flags.append(row[1])
+        addresses.append(row[2])
+        ids.append(block_id)
+        steps.append(step)
+        sizes.append(size)
+    records = np.zeros(len(ops), dtype=EVENT_DTYPE)
+    records["op"] = ops
+    records["flags"] = flags
+    records["id"] = np.asarray(ids, dtype=np.int64).astype(np.uint32)
+    records["time"] = steps
+    records["a"] = addresses
+    records["b"] = sizes
+    return records
+
+
+def encode_frame(channel, records, clock, flags=0):
+    """One binary frame: the header followed by the raw records."""
+    return HEADER.pack(VERSION, channel, flags, len(records), clock) + records.tobytes()
+
+
+def decode_frame(frame):
+    """``(channel, clock, records)`` of a binary frame, the records as a read-only view."""
+    version, channel, _, count, clock = HEADER.unpack_from(frame)
+    if version != VERSION:
+        raise ValueError(f"unsupported stream frame version: {version}")
+    return channel, clock, np.frombuffer(frame, dtype=EVENT_DTYPE, count=count, offset=HEADER.size)
+
+
+class Broadcast:
+    """A simulation's event log played on one clock to every viewer of a session.
+
+    ``hello`` is the JSON-serializable dict sent to each viewer on joining;
+    ``time_unit_ms`` is the wall time one unit of ``events["time"]`` takes
+    at 1x.  A broadcast starts playing as soon as it is published.
+    """
+
+    def __init__(self, channel, hello, events, time_unit_ms=scenes.TIME_UNIT_MS, speed=1.0):
+        self.channel = CHANNELS[channel]
+        self.events = events
+        self.times = events["time"]
+        self.end = float(self.times[-1]) if len(events) else 0.0
+        self.time_unit_ms = time_unit_ms
+        self.hello = dict(hello, type="hello", channel=channel, timeUnitMs=time_unit_ms, end=self.end)
+        self.speed = speed
+        self.playing = True
+        self.clock = 0.0
+        self.cursor = 0
+        self.viewers = set()
+
+    def advance(self, seconds):
+        """Move the clock on by ``seconds`` of wall time; return the events now due."""
+        self.clock = min(self.clock + seconds * 1000 / self.time_unit_ms * self.speed, self.end)
+        return self.seek(self.clock)
+
+    def seek(self, clock):
+        """Put the clock at ``clock``; return the events between the old and new cursor."""
+        self.clock = min(max(clock, 0.0), self.end)
+        stop = int(np.searchsorted(self.times, self.clock, side="right"))
+        due = self.events[self.cursor:stop]
+        self.cursor = stop
+        return due
+
+    def status(self):
+        return {"clock": self.clock, "end": self.end, "playing": self.playing, "speed": self.speed,
+                "viewers": len(self.viewers)}
+
+
+class _Viewer:
+    """Outgoing queue of one connected scene.
+
+    Items are ``("text", bytes)`` or ``[channel, chunks, count, clock]``
+    binary frames whose records are joined only when sent.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.broadcast = None
+        self.pending = deque()
+        self.pending_bytes = 0
+        self.lagging = asyncio.Event()
+        self.ready = asyncio.Event()
+
+    def send_text(self, message):
+        self.pending.append(("text", json.dumps(message, separators=(",", ":")).encode("utf-8")))
+        self.ready.set()
+
+    def send_records(self, channel, data, count, clock, limit=True):
+        last = self.pending[-1] if self.pending else None
+        if limit and len(self.pending) >= MAX_PENDING_FRAMES and isinstance(last, list) and last[0] == channel:
+            last[1].append(data)
+            last[2] += count
+            last[3] = clock
+        else:
+            self.pending.append([channel, [data], count, clock])
+        self.pending_bytes += len(data)
+        if limit and self.pending_bytes > MAX_PENDING_BYTES:
+            self.lagging.set()
+        self.ready.set()
+
+    def join(self, broadcast):
+        """Switch to ``broadcast``: forget queued frames, send its hello and catch up."""
+        if self.broadcast is not None:
+            self.broadcast.viewers.discard(self)
+        self.broadcast = broadcast
+        broadcast.viewers.add(self)
+        self.pending.clear()
+        self.pending_bytes = 0
+        self.send_text(broadcast.hello)
+        self.catch_up()
+
+    def catch_up(self):
+        # Catch-up frames are bounded in size but never count as lag
+        broadcast = self.broadcast
+        for lo in range(0, broadcast.cursor, CATCH_UP_RECORDS):
+            part = broadcast.events[lo:min(lo + CATCH_UP_RECORDS, broadcast.cursor)]
+            self.send_records(broadcast.channel, part.tobytes(), len(part), float(part["time"][-1]), limit=False)
+        self.send_records(broadcast.channel, b"", 0, broadcast.clock, limit=False)
+        self.pending_bytes = 0
+
+
+def _frame(opcode, payload=b"", mask=None):
+    # Clients must mask what they send (RFC 6455, section 5.3); servers must not
+    n = len(payload)
+    bit = 0x80 if mask else 0
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, bit | n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, bit | 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, bit | 127, n)
+    return header + mask + _unmask(payload, mask) if mask else header + payload
+
+
+def _unmask(payload, mask):
+    data = np.frombuffer(payload, dtype=np.uint8)
+    key = np.resize(np.frombuffer(mask, dtype=np.uint8), len(data))
+    return (data ^ key).tobytes()
+
+
+async def _read_message(reader, limit=None):
+    """``(opcode, payload)`` of the next frame, unmasking it if needed."""
+    first, second = await reader.readexactly(2)
+    n = second & 0x7F
+    if n == 126:
+        n, = struct.unpack("!H", await reader.readexactly(2))
+    elif n == 127:
+        n, = struct.unpack("!Q", await reader.readexactly(8))
+    if limit is not None and n > limit:
+        raise ValueError("message too big")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(n)
+    return first & 0x0F, _unmask(payload, mask) if mask else payload
+
+
+async def _read_headers(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+def _accept_key(key):
+    return base64.b64encode(hashlib.sha1((key + _GUID).encode("ascii")).digest()).decode("ascii")
+
+
+class StreamHub:
+    """Sessions of ``Broadcast`` objects and the WebSocket server streaming them.
+
+    ``start`` runs on the hub's event loop; ``publish``, ``control`` and
+    ``status`` may be called from any thread.
+    """
+
+    def __init__(self):
+        self.broadcasts = {}
+        self.loop = None
+        self.server = None
+
+    async def start(self, host="0.0.0.0", port=8765):
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self._handle, host, port)
+        self._ticker = self.loop.create_task(self._tick())
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    def _call(self, function, *args):
+        if self.loop is None:
+            function(*args)
+        else:
+            self.loop.call_soon_threadsafe(function, *args)
+
+    def publish(self, session, broadcast):
+        """Start ``broadcast`` under ``session``; viewers of an earlier one switch to it."""
+        self._call(self._publish, session, broadcast)
+
+    def control(self, session, playing=None, speed=None, seek=None):
+        """Play or pause a session, change its speed, or move its clock to ``seek``."""
+        self._call(self._control, session, playing, speed, seek)
+
+    def status(self, session):
+        broadcast = self.broadcasts.get(session)
+        return broadcast.status() if broadcast is not None else None
+
+    def _publish(self, session, broadcast):
+        previous = self.broadcasts.get(session)
+        self.broadcasts[session] = broadcast
+        if previous is not None:
+            for viewer in list(previous.viewers):
+                viewer.join(broadcast)
+
+    def _control(self, session, playing, speed, seek):
+        broadcast = self.broadcasts.get(session)
+        if broadcast is None:
+            return
+        if speed is not None:
+            broadcast.speed = speed
+        if playing is not None:
+            broadcast.playing = playing
+        if seek is not None and seek < broadcast.clock:
+            # Viewers cannot rewind a log they have applied: start them over
+            broadcast.cursor = 0
+            broadcast.seek(seek)
+            for viewer in broadcast.viewers:
+                viewer.pending.clear()
+                viewer.send_text({"type": "reset"})
+                viewer.catch_up()
+        elif seek is not None:
+            self._push(broadcast, broadcast.seek(seek))
+
+    def _push(self, broadcast, due):
+        if not broadcast.viewers:
+            return
+        data = due.tobytes()
+        for viewer in broadcast.viewers:
+            viewer.send_records(broadcast.channel, data, len(due), broadcast.clock)
+
+    async def _tick(self):
+        last = self.loop.time()
+        while True:
+            await asyncio.sleep(FRAME_SECONDS)
+            now = self.loop.time()
+            for broadcast in self.broadcasts.values():
+                if broadcast.playing:
+                    self._push(broadcast, broadcast.advance(now - last))
+                    if broadcast.clock >= broadcast.end:
+                        broadcast.playing = False
+            last = now
+
+    async def _handle(self, reader, writer):
+        viewer = None
+        try:
+            request, headers = await _read_headers(reader)
+            method, path = (request.split(" ") + ["", ""])[:2]
+            session = path.split("?")[0].strip("/")
+            if method != "GET" or headers.get("upgrade", "").lower() != "websocket" or "sec-websocket-key" not in headers:
+                writer.write(b"HTTP/1.1 426 Upgrade Required\r\nUpgrade: websocket\r\nContent-Length: 0\r\n\r\n")
+                return
+            if session not in self.broadcasts:
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+                return
+            writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                          f"Sec-WebSocket-Accept: {_accept_key(headers['sec-websocket-key'])}\r\n\r\n").encode("ascii"))
+            viewer = _Viewer(writer)
+            viewer.join(self.broadcasts[session])
+            # The sender may be stuck in drain() on a client that stopped
+            # reading, so lag is watched separately
+            tasks = [asyncio.ensure_future(self._receive(reader, writer)), asyncio.ensure_future(self._send(viewer)),
+                     asyncio.ensure_future(viewer.lagging.wait())]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            if viewer.lagging.is_set():
+                writer.write(_frame(_CLOSE, struct.pack("!H", CLOSE_TRY_AGAIN) + b"lagging"))
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            if viewer is not None and viewer.broadcast is not None:
+                viewer.broadcast.viewers.discard(viewer)
+            writer.close()
+            try:
+                await asyncio.wait_for(writer.wait_closed(), CLOSE_TIMEOUT)
+            except (asyncio.TimeoutError, ConnectionError):
+                writer.transport.abort()
+
+    async def _receive(self, reader, writer):
+        while True:
+            try:
+                opcode, payload = await _read_message(reader, MAX_CLIENT_MESSAGE)
+            except ValueError:
+                writer.write(_frame(_CLOSE, struct.pack("!H", CLOSE_TOO_BIG)))
+                return
+            if opcode == _CLOSE:
+                writer.write(_frame(_CLOSE, payload[:2]))
+                return
+            if opcode == _PING:
+                writer.write(_frame(_PONG, payload))
+
+    async def _send(self, viewer):
+        writer = viewer.writer
+        while True:
+            await viewer.ready.wait()
+            viewer.ready.clear()
+            while viewer.pending:
+                item = viewer.pending.popleft()
+                if item[0] == "text":
+                    writer.write(_frame(_TEXT, item[1]))
+                else:
+                    channel, chunks, count, clock = item
+                    data = b"".join(chunks)
+                    viewer.pending_bytes = max(0, viewer.pending_bytes - len(data))
+                    writer.write(_frame(_BINARY, HEADER.pack(VERSION, channel, 0, count, clock) + data))
+                await writer.drain()
+
+
+def schedule_broadcast(result, names, time_unit_ms=scenes.TIME_UNIT_MS, speed=1.0):
+    """``Broadcast`` of a ``ScheduleResult``; its hello holds the scene's per-process columns."""
+    hello = scenes.schedule_columns(result, names, time_unit_ms)
+    del hello["gantt"]
+    hello["lanes"] = result.cpus
+    return Broadcast("schedule", hello, schedule_events(result), time_unit_ms, speed)
+
+
+def memory_broadcast(events, capacity, strategy="First-Fit", time_unit_ms=MEMORY_UNIT_MS, speed=1.0):
+    """``Broadcast`` of a dynamic-allocation trace replayed through ``strategy``."""
+    records = memory_events(events, capacity, strategy)
+    # Buddy only manages the largest power-of-two prefix; the viewer draws what is usable
+    usable = dynamic_allocation.make_allocator(strategy, capacity).capacity
+    hello = {"algorithm": strategy, "capacity": usable, "names": [], "arrival": [], "burst": [],
+             "completion": [], "arrivalOrder": []}
+    return Broadcast("memory", hello, records, time_unit_ms, speed)
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def serve(port, host="0.0.0.0"):
+    """Run a ``StreamHub`` on ``ws://host:port`` from a daemon thread.
+
+    Only one hub runs per process; later calls return the running one.
+    Raises ``OSError`` if the port cannot be bound.
+    """
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = _start_hub(host, port)
+    return _hub
+
+
+def running():
+    """The hub started by ``serve``, or ``None``."""
+    return _hub
+
+
+def _start_hub(host, port):
+    hub = StreamHub()
+    started = threading.Event()
+    errors = []
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(hub.start(host, port))
+        except OSError as exc:
+            errors.append(exc)
+            return
+        finally:
+            started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, name="stream", daemon=True).start()
+    started.wait()
+    if errors:
+        raise errors[0]
+    return hub
+
+
+async def watch(url, messages=None):
+    """Yield what a viewer of ``url`` (``ws://host:port/session``) receives.
+
+    Items are ``("hello", dict)``, ``("reset", dict)`` and
+    ``("frame", channel, clock, records)``; iteration stops after
+    ``messages`` items or when the server closes the stream.
+    """
+    if not url.startswith("ws://"):
+        raise ValueError("only ws:// stream URLs are supported")
+    address, _, path = url[len("ws://"):].partition("/")
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "80")
+    reader, writer = await asyncio.open_connection(host, int(port))
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    writer.write((f"GET /{path} HTTP/1.1\r\nHost: {address}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                  f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode("ascii"))
+    try:
+        status, headers = await _read_headers(reader)
+        if " 101 " not in status or headers.get("sec-websocket-accept") != _accept_key(key):
+            raise ConnectionError(f"stream refused: {status}")
+        received = 0
+        while messages is None or received < messages:
+            try:
+                opcode, payload = await _read_message(reader)
+            except asyncio.IncompleteReadError:
+                return
+            if opcode == _CLOSE:
+                return
+            if opcode == _TEXT:
+                message = json.loads(payload)
+                yield message.get("type"), message
+            elif opcode == _BINARY:
+                yield ("frame",) + decode_frame(payload)
+            else:
+                continue
+            received += 1
+        writer.write(_frame(_CLOSE, struct.pack("!H", CLOSE_NORMAL), os.urandom(4)))
+    finally:
+        writer.close()
+
+
+def main(argv=None):
+    from osplatform import random_trace, random_workload, scheduling
+    from osplatform.cli import algorithm_names, strategy_name
+
+    parser = argparse.ArgumentParser(prog="python -m osplatform.streaming",
+                                     description="Stream a demo simulation to 3D-scene viewers over WebSockets.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--session", default="class", help="viewers connect to ws://HOST:PORT/SESSION")
+    parser.add_argument("--algo", type=algorithm_names, default=["FCFS"], help="scheduling algorithm or alias")
+    parser.add_argument("--processes", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", type=int, metavar="EVENTS",
+                        help="stream a random allocate/free trace of this many events instead")
+    parser.add_argument("--strategy", type=strategy_name, default="First-Fit")
+    parser.add_argument("--capacity", type=int, default=1 << 12)
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    if args.memory is not None:
+        broadcast = memory_broadcast(random_trace(args.memory, seed=args.seed, max_size=args.capacity // 16),
+                                     args.capacity, args.strategy, speed=args.speed)
+    else:
+        workload = random_workload(args.processes, seed=args.seed)
+        result = scheduling.simulate(args.algo[0], workload.burst, workload.arrival, quantum=4,
+                                     priority_level=workload.priority)
+        broadcast = schedule_broadcast(result, [f"P{i + 1}" for i in range(args.processes)], speed=args.speed)
+
+    async def run():
+        hub = StreamHub()
+        hub.publish(args.session, broadcast)
+        await hub.start(args.host, args.port)
+        print(f"streaming {broadcast.hello['algorithm']} on ws://{args.host}:{hub.port}/{args.session}", flush=True)
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Batch parameter sweeps over the scheduling engine.
+
+A sweep expands ``algorithms x quanta x workloads`` into grid points and runs
+them on a ``ProcessPoolExecutor``.  Workloads are shipped to each worker once
+through the pool initializer, so a task is just an ``(algorithm, quantum,
+label)`` tuple, and tasks are handed out in chunks to keep per-task overhead
+low on large grids.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from osplatform import scheduling
+
+COLUMNS = [
+    "algorithm", "quantum", "workload", "processes", "avg_waiting",
+    "avg_turnaround", "avg_response", "throughput", "context_switches",
+]
+
+# Chunks handed to each worker; more than one evens out uneven point costs.
+CHUNKS_PER_WORKER = 4
+
+_worker_workloads = {}
+
+
+def grid(algorithms, quanta, workloads):
+    """Expand a sweep into ``(algorithm, quantum, label)`` points.
+
+    The quantum only varies for algorithms in ``QUANTUM_ALGORITHMS``; every
+    other algorithm gets a single point per workload with ``quantum=None``.
+    """
+    points = []
+    for algorithm in algorithms:
+        algorithm_quanta = quanta if algorithm in scheduling.QUANTUM_ALGORITHMS else [None]
+        for quantum in algorithm_quanta:
+            for label in workloads:
+                points.append((algorithm, quantum, label))
+    return points
+
+
+def run_point(point, workloads):
+    """Simulate one grid point and return its row of the aggregate table."""
+    algorithm, quantum, label = point
+    workload = workloads[label]
+    result = scheduling.simulate(
+        algorithm, workload.burst, workload.arrival,
+        quantum=quantum if quantum is not None else 2,
+        priority_level=workload.priority,
+    )
+    row = {"algorithm": algorithm, "quantum": quantum, "workload": label}
+    row.update(scheduling.summarize(result))
+    return row
+
+
+def _init_worker(workloads):
+    global _worker_workloads
+    _worker_workloads = workloads
+
+
+def _run_worker_point(point):
+    return run_point(point, _worker_workloads)
+
+
+def sweep(algorithms, quanta, workloads, max_workers=None, chunksize=None):
+    """Run every grid point and return one tidy ``DataFrame`` row per point.
+
+    ``workloads`` maps a label to a ``Workload``.  ``max_workers`` defaults to
+    the CPU count; with a single worker (or a single point) the sweep runs
+    in-process.  ``chunksize`` defaults to splitting the grid into
+    ``CHUNKS_PER_WORKER`` chunks per worker.
+    """
+    points = grid(algorithms, quanta, workloads)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(points)))
+
+    if max_workers == 1:
+        rows = [run_point(point, workloads) for point in points]
+    else:
+        if chunksize is None:
+            chunksize = max(1, math.ceil(len(points) / (max_workers * CHUNKS_PER_WORKER)))
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                                 initargs=(workloads,)) as executor:
+            rows = list(executor.map(_run_worker_point, points, chunksize=chunksize))
+    return pd.DataFrame(rows, columns=COLUMNS)
@@ -0,0 +1,222 @@
+"""Lightweight timing and counter instrumentation for the app's hot paths.
+
+``stage(name)`` times a block of code and records how many memory blocks
+it left allocated (``sys.getallocatedblocks``, so there is no tracing
+overhead); ``count(name, **labels)`` bumps a labelled counter, which the
+app uses to tell ``st.cache_data`` hits from misses.  Everything lands in
+one process-wide ``Metrics`` registry shared by all sessions, which can be
+rendered as a table (``snapshot``) or in the Prometheus text exposition
+format (``prometheus_text``), optionally served on ``/metrics`` by
+``serve``.  ``profiled`` wraps a block in cProfile or pyinstrument for an
+on-demand report.
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = "osplatform"
+PROFILERS = ("cProfile", "pyinstrument")
+
+
+@dataclass
+class StageStats:
+    """Running totals for one instrumented stage."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    last: float = 0.0
+    max: float = 0.0
+    last_blocks: int = 0
+
+    def add(self, seconds, blocks):
+        self.calls += 1
+        self.seconds += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+        self.last_blocks = blocks
+
+
+class Metrics:
+    """Thread-safe registry of stage timings and labelled counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name):
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            allocated = sys.getallocatedblocks() - blocks
+            with self._lock:
+                self.stages.setdefault(name, StageStats()).add(seconds, allocated)
+
+    def count(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def counter(self, name, **labels):
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def cache_hit_rate(self, cache):
+        """Share of ``cache_requests`` for ``cache`` that did not count a ``cache_misses``."""
+        requests = self.counter("cache_requests", cache=cache)
+        if not requests:
+            return None
+        return 1 - min(self.counter("cache_misses", cache=cache), requests) / requests
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    def snapshot(self):
+        """One dict per stage, sorted by name, with times in milliseconds."""
+        with self._lock:
+            stages = sorted((name, StageStats(**vars(stats))) for name, stats in self.stages.items())
+        return [{
+            "stage": name,
+            "calls": stats.calls,
+            "last_ms": stats.last * 1e3,
+            "mean_ms": stats.seconds / stats.calls * 1e3,
+            "max_ms": stats.max * 1e3,
+            "total_ms": stats.seconds * 1e3,
+            "last_blocks": stats.last_blocks,
+        } for name, stats in stages]
+
+    def caches(self):
+        """``{cache: (requests, misses, hit_rate)}`` for every counted cache."""
+        with self._lock:
+            names = sorted({dict(labels)["cache"] for name, labels in self.counters if name == "cache_requests"})
+        return {name: (self.counter("cache_requests", cache=name), self.counter("cache_misses", cache=name),
+                       self.cache_hit_rate(name)) for name in names}
+
+    def prometheus_text(self):
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            stages = sorted((name, StageStats(**vars(stats))) for name, stats in self.stages.items())
+            counters = sorted(self.counters.items())
+        lines = []
+
+        def family(name, kind, help, samples):
+            lines.append(f"# HELP {PREFIX}_{name} {help}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{PREFIX}_{name}{_labels(labels)} {value!r}")
+
+        family("stage_calls_total", "counter", "Times each instrumented stage ran.",
+               [((("stage", name),), stats.calls) for name, stats in stages])
+        family("stage_seconds_total", "counter", "Wall time spent in each instrumented stage.",
+               [((("stage", name),), stats.seconds) for name, stats in stages])
+        family("stage_last_seconds", "gauge", "Wall time of the latest run of each stage.",
+               [((("stage", name),), stats.last) for name, stats in stages])
+        family("stage_max_seconds", "gauge", "Slowest run of each stage.",
+               [((("stage", name),), stats.max) for name, stats in stages])
+        family("stage_allocated_blocks", "gauge", "Memory blocks left allocated by the latest run of each stage.",
+               [((("stage", name),), stats.last_blocks) for name, stats in stages])
+        for name in sorted({name for (name, _), _ in counters}):
+            family(f"{name}_total", "counter", f"Count of {name.replace('_', ' ')}.",
+                   [(labels, value) for (counter, labels), value in counters if counter == name])
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+
+REGISTRY = Metrics()
+stage = REGISTRY.stage
+count = REGISTRY.count
+
+
+@contextmanager
+def profiled(profiler="cProfile", sort="cumulative", limit=40):
+    """Profile the block; fills the yielded dict once it exits.
+
+    The dict gets ``text``, a readable report, and ``data``, the raw
+    profile for download: marshalled ``pstats`` data for cProfile (load it
+    with ``pstats.Stats``) or an HTML page for pyinstrument.
+    """
+    report = {}
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError as exc:
+            raise ImportError("pyinstrument profiling requires pyinstrument") from exc
+        session = Profiler()
+        session.start()
+        try:
+            yield report
+        finally:
+            session.stop()
+            report["text"] = session.output_text()
+            report["data"] = session.output_html().encode("utf-8")
+        return
+    if profiler != "cProfile":
+        raise ValueError(f"unknown profiler: {profiler!r}")
+    session = cProfile.Profile()
+    session.enable()
+    try:
+        yield report
+    finally:
+        session.disable()
+        text = io.StringIO()
+        stats = pstats.Stats(session, stream=text)
+        stats.sort_stats(sort).print_stats(limit)
+        report["text"] = text.getvalue()
+        report["data"] = marshal.dumps(stats.stats)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port, host="0.0.0.0", registry=REGISTRY):
+    """Serve ``registry`` on ``http://host:port/metrics`` from a daemon thread.
+
+    Only one server runs per process; later calls return the running one.
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = _start_server(host, port, registry)
+    return _server
+
+
+def _start_server(host, port, registry):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
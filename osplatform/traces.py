@@ -0,0 +1,232 @@
+"""Chunked readers and writers for process, memory and page-reference traces.
+
+Three trace kinds are supported:
+
+``process``
+    one row per process with columns ``pid``, ``arrival``, ``burst`` and
+    optionally ``priority``.
+``memory``
+    one row per allocation event with columns ``op`` (``alloc``/``free``),
+    ``id`` and ``size``, as replayed by ``osplatform.dynamic_allocation``.
+``page``
+    one row per memory reference with a ``page`` column, the reference
+    string simulated by ``osplatform.paging``.
+
+Each kind can be stored as CSV, Parquet (needs ``pyarrow``) or raw
+little-endian binary records (``.bin``, read through ``numpy.memmap``).
+Readers yield column chunks of at most ``chunksize`` rows, so a trace of
+tens of millions of rows never has to exist as Python objects; binary
+traces are read without copying at all.
+
+Run ``python -m osplatform.traces convert SRC DST`` to convert between
+formats chunk by chunk, e.g. a large CSV into a memory-mappable ``.bin``.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from osplatform.workloads import Workload
+
+CHUNK_ROWS = 1 << 16
+
+PROCESS_DTYPE = np.dtype([("pid", "<i8"), ("arrival", "<i8"), ("burst", "<i8"), ("priority", "<i8")])
+MEMORY_DTYPE = np.dtype([("op", "u1"), ("id", "<i8"), ("size", "<i8")])
+PAGE_DTYPE = np.dtype([("page", "<i8")])
+DTYPES = {"process": PROCESS_DTYPE, "memory": MEMORY_DTYPE, "page": PAGE_DTYPE}
+# Binary and Parquet memory traces store ``op`` as an index into this tuple.
+OPS = ("alloc", "free")
+
+FORMATS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet", ".bin": "binary"}
+
+
+def trace_format(source, format=None):
+    """Resolve ``format`` or infer it from the file name of ``source``."""
+    if format is not None:
+        if format not in FORMATS.values():
+            raise ValueError(f"unknown trace format: {format!r}")
+        return format
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    ext = os.path.splitext(os.fspath(name))[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"cannot infer trace format from {name!r}; pass format=")
+    return FORMATS[ext]
+
+
+def _normalize(kind, columns, start):
+    """Cast a raw column chunk to the trace kind's integer columns."""
+    n = len(next(iter(columns.values()))) if columns else 0
+    chunk = {}
+    for name in DTYPES[kind].names:
+        if name in columns:
+            values = columns[name]
+            if name == "op" and np.asarray(values).dtype.kind in "OUS":
+                values = _encode_ops(values)
+            chunk[name] = np.asarray(values, dtype=DTYPES[kind][name])
+        elif name == "pid":
+            chunk[name] = np.arange(start, start + n, dtype=np.int64)
+        elif name == "priority":
+            chunk[name] = np.zeros(n, dtype=np.int64)
+        else:
+            raise ValueError(f"{kind} trace is missing the {name!r} column")
+    return chunk
+
+
+def _encode_ops(values):
+    values = np.char.lower(np.asarray(values, dtype=str))
+    codes = np.full(len(values), 255, dtype=np.uint8)
+    for code, op in enumerate(OPS):
+        codes[values == op] = code
+    if (codes == 255).any():
+        raise ValueError(f"unknown memory trace operation: {values[codes == 255][0]!r}")
+    return codes
+
+
+def _binary_records(source, kind):
+    dtype = DTYPES[kind]
+    if isinstance(source, (str, os.PathLike)):
+        if os.path.getsize(source) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(source, dtype=dtype, mode="r")
+    buffer = source.getbuffer() if hasattr(source, "getbuffer") else source.read()
+    return np.frombuffer(buffer, dtype=dtype)
+
+
+def iter_chunks(source, kind, format=None, chunksize=CHUNK_ROWS):
+    """Yield dicts of NumPy columns, at most ``chunksize`` rows each.
+
+    ``source`` is a path or a binary file-like object (such as a Streamlit
+    upload).  Missing ``pid`` columns default to the row number and missing
+    ``priority`` columns to zero.
+    """
+    if kind not in DTYPES:
+        raise ValueError(f"unknown trace kind: {kind!r}")
+    format = trace_format(source, format)
+    start = 0
+    if format == "binary":
+        records = _binary_records(source, kind)
+        for lo in range(0, len(records), chunksize):
+            part = records[lo:lo + chunksize]
+            yield {name: part[name] for name in DTYPES[kind].names}
+        return
+    if format == "csv":
+        import pandas as pd
+
+        for frame in pd.read_csv(source, chunksize=chunksize, skipinitialspace=True):
+            frame.columns = [str(c).strip().lower() for c in frame.columns]
+            yield _normalize(kind, {c: frame[c].to_numpy() for c in frame.columns}, start)
+            start += len(frame)
+        return
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("reading Parquet traces requires pyarrow") from exc
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+        columns = {name.lower(): batch.column(i).to_numpy(zero_copy_only=False)
+                   for i, name in enumerate(batch.schema.names)}
+        yield _normalize(kind, columns, start)
+        start += batch.num_rows
+
+
+def load_processes(source, format=None, chunksize=CHUNK_ROWS):
+    """Read a process trace into a ``Workload`` of typed columns.
+
+    Binary traces come back as zero-copy views of the memory map; other
+    formats are concatenated chunk by chunk into int64 arrays.
+    """
+    format = trace_format(source, format)
+    if format == "binary":
+        records = _binary_records(source, "process")
+        columns = {name: records[name] for name in PROCESS_DTYPE.names}
+    else:
+        chunks = list(iter_chunks(source, "process", format, chunksize))
+        columns = {name: np.concatenate([chunk[name] for chunk in chunks]) if chunks
+                   else np.empty(0, dtype=np.int64) for name in PROCESS_DTYPE.names}
+    return Workload(columns["burst"], columns["arrival"], columns["priority"], pid=columns["pid"])
+
+
+def load_references(source, format=None, chunksize=CHUNK_ROWS):
+    """Read a page-reference trace into one int64 array of page numbers."""
+    format = trace_format(source, format)
+    if format == "binary":
+        return _binary_records(source, "page")["page"]
+    chunks = [chunk["page"] for chunk in iter_chunks(source, "page", format, chunksize)]
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+
+def iter_memory_events(source, format=None, chunksize=CHUNK_ROWS):
+    """Yield ``(op, id, size)`` events from a memory trace, chunk by chunk."""
+    for chunk in iter_chunks(source, "memory", format, chunksize):
+        ops = np.take(OPS, chunk["op"]).tolist()
+        yield from zip(ops, chunk["id"].tolist(), chunk["size"].tolist())
+
+
+def write_chunks(chunks, destination, kind, format=None):
+    """Write column chunks (as yielded by ``iter_chunks``) to ``destination``."""
+    format = trace_format(destination, format)
+    dtype = DTYPES[kind]
+    writer = None
+    with open(destination, "wb") as f:
+        for i, chunk in enumerate(chunks):
+            if format == "binary":
+                records = np.empty(len(chunk[dtype.names[0]]), dtype=dtype)
+                for name in dtype.names:
+                    records[name] = chunk[name]
+                f.write(records.tobytes())
+            elif format == "csv":
+                import pandas as pd
+
+                frame = pd.DataFrame({name: chunk[name] for name in dtype.names})
+                if kind == "memory":
+                    frame["op"] = np.take(OPS, frame["op"])
+                frame.to_csv(f, header=i == 0, index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.table({name: chunk[name] for name in dtype.names})
+                if writer is None:
+                    writer = pq.ParquetWriter(f, table.schema)
+                writer.write_table(table)
+        if writer is not None:
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m osplatform.traces",
+                                     description="Inspect and convert process, memory and page traces.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="convert a trace between csv, parquet and binary")
+    convert.add_argument("source")
+    convert.add_argument("destination")
+    info = commands.add_parser("info", help="print the row count and column ranges of a trace")
+    info.add_argument("source")
+    for command in (convert, info):
+        command.add_argument("--kind", choices=list(DTYPES), default="process")
+        command.add_argument("--chunksize", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    chunks = iter_chunks(args.source, args.kind, chunksize=args.chunksize)
+    if args.command == "convert":
+        write_chunks(chunks, args.destination, args.kind)
+        return 0
+
+    rows = 0
+    low, high = {}, {}
+    for chunk in chunks:
+        rows += len(chunk[DTYPES[args.kind].names[0]])
+        for name, values in chunk.items():
+            if len(values):
+                low[name] = min(low.get(name, values.min()), values.min())
+                high[name] = max(high.get(name, values.max()), values.max())
+    print(f"{args.source}: {rows} {args.kind} rows")
+    for name in DTYPES[args.kind].names:
+        if name in low:
+            print(f"  {name:<9} {low[name]} .. {high[name]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
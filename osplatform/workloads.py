@@ -0,0 +1,147 @@
+"""Deterministic synthetic workloads for the simulation engines."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Workload:
+    """Per-process input vectors for a scheduler run.
+
+    ``pid`` optionally carries external process ids (e.g. from a trace);
+    the engines themselves always index processes by position.
+    """
+
+    burst: np.ndarray
+    arrival: np.ndarray
+    priority: np.ndarray = None
+    pid: np.ndarray = None
+
+    def __len__(self):
+        return len(self.burst)
+
+
+def random_workload(n, seed=0, max_burst=20, arrival_span=None, max_priority=10):
+    """Uniform bursts in ``[1, max_burst]`` with arrivals spread over ``arrival_span``.
+
+    The same ``(n, seed, ...)`` always produces the same workload.  By default
+    arrivals span roughly half the total work, so the CPU sees both queueing
+    and idle gaps.
+    """
+    rng = np.random.default_rng(seed)
+    burst = rng.integers(1, max_burst + 1, n)
+    if arrival_span is None:
+        arrival_span = max(1, int(burst.sum()) // 2)
+    arrival = np.sort(rng.integers(0, arrival_span + 1, n))
+    priority = rng.integers(0, max_priority, n)
+    return Workload(burst, arrival, priority)
+
+
+BURST_DISTRIBUTIONS = ("uniform", "bursty", "heavy-tailed")
+BLOCK_DISTRIBUTIONS = ("uniform", "powers-of-two", "lognormal")
+
+
+def burst_times(n, distribution="uniform", seed=0, mean=10):
+    """Integer CPU bursts (all ``>= 1``) with roughly the given ``mean``.
+
+    ``uniform`` draws from ``[1, 2 * mean - 1]``.  ``bursty`` alternates runs
+    of short jobs and runs of jobs ten times longer, with geometric run
+    lengths.  ``heavy-tailed`` is Pareto with shape 1.5, so a few jobs
+    dominate the total work.
+    """
+    rng = np.random.default_rng(seed)
+    if distribution == "uniform":
+        return rng.integers(1, 2 * mean, n)
+    if distribution == "bursty":
+        # Run lengths average 20 jobs; every other run is the long phase.
+        runs = rng.geometric(1 / 20, n // 10 + 1)
+        phase = np.repeat(np.arange(len(runs)) % 2 == 1, runs)[:n]
+        if len(phase) < n:
+            phase = np.resize(phase, n)
+        short = rng.integers(1, max(2, mean // 2), n)
+        return np.where(phase, short * 10, short)
+    if distribution == "heavy-tailed":
+        shape = 1.5
+        scale = mean * (shape - 1) / shape
+        return np.maximum(1, (scale * (1 + rng.pareto(shape, n)))).astype(np.int64)
+    raise ValueError(f"unknown burst distribution: {distribution!r}")
+
+
+def poisson_arrivals(n, rate=0.1, seed=0):
+    """Sorted integer arrival times of a Poisson process with ``rate`` per time unit."""
+    rng = np.random.default_rng(seed)
+    return np.floor(np.cumsum(rng.exponential(1 / rate, n))).astype(np.int64)
+
+
+def block_sizes(n, distribution="uniform", seed=0, mean=512):
+    """Integer memory block or request sizes (all ``>= 1``) around ``mean``.
+
+    ``uniform`` draws from ``[1, 2 * mean - 1]``, ``powers-of-two`` picks
+    powers of two up to ``2 * mean`` and ``lognormal`` has median ``mean``
+    with a long right tail.
+    """
+    rng = np.random.default_rng(seed)
+    if distribution == "uniform":
+        return rng.integers(1, 2 * mean, n)
+    if distribution == "powers-of-two":
+        return 1 << rng.integers(0, max(1, int(2 * mean).bit_length()), n)
+    if distribution == "lognormal":
+        return np.maximum(1, rng.lognormal(np.log(mean), 1.0, n)).astype(np.int64)
+    raise ValueError(f"unknown block-size distribution: {distribution!r}")
+
+
+def synthetic_workload(n, burst="uniform", seed=0, mean_burst=10, load=0.9, max_priority=10):
+    """Workload with ``burst`` distributed bursts and Poisson arrivals.
+
+    The arrival rate is chosen so the CPU is busy about ``load`` of the time.
+    """
+    bursts = burst_times(n, burst, seed, mean_burst)
+    rate = load / max(float(bursts.mean()), 1e-9) if n else 1.0
+    arrival = poisson_arrivals(n, rate, seed + 1)
+    priority = np.random.default_rng(seed + 2).integers(0, max_priority, n)
+    return Workload(bursts, arrival, priority)
+
+
+def random_trace(n_events, seed=0, min_size=1, max_size=256, free_probability=0.45,
+                 chunk=65536):
+    """Yield a reproducible stream of ``(op, id, size)`` allocation events.
+
+    Each event frees a random live allocation with ``free_probability`` and
+    otherwise allocates a uniform size in ``[min_size, max_size]``.  Random
+    draws are made ``chunk`` at a time and only live ids are held, so
+    arbitrarily long traces stream in bounded memory.
+    """
+    rng = np.random.default_rng(seed)
+    live = []
+    next_id = 0
+    for lo in range(0, n_events, chunk):
+        count = min(chunk, n_events - lo)
+        draws = rng.random(count).tolist()
+        picks = rng.random(count).tolist()
+        sizes = rng.integers(min_size, max_size + 1, count).tolist()
+        for draw, pick, size in zip(draws, picks, sizes):
+            if live and draw < free_probability:
+                k = int(pick * len(live))
+                live[k], live[-1] = live[-1], live[k]
+                block_id, size = live.pop()
+                yield "free", block_id, size
+            else:
+                live.append((next_id, size))
+                yield "alloc", next_id, size
+                next_id += 1
+
+
+def random_references(n, pages=64, seed=0, working_set=8, phase=1000, locality=0.9):
+    """Page-reference string with a drifting working set.
+
+    References come in phases of about ``phase`` references; in each, a
+    share ``locality`` of them fall in a window of ``working_set``
+    consecutive pages at a random base, and the rest pick any of ``pages``.
+    """
+    rng = np.random.default_rng(seed)
+    phases = rng.integers(0, max(1, pages - working_set + 1), n // max(1, phase) + 1)
+    base = np.repeat(phases, phase)[:n]
+    local = base + rng.integers(0, min(working_set, pages), n)
+    anywhere = rng.integers(0, pages, n)
+    return np.where(rng.random(n) < locality, local, anywhere)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from osplatform import allocation
+
+
+def reference_fit(strategy, blocks, processes):
+    """The original app's linear scans, plus the offset of each placement."""
+    free = list(blocks)
+    placed, offset = [], []
+    for size in processes:
+        fits = [j for j in range(len(free)) if free[j] >= size]
+        if not fits:
+            placed.append(-1)
+            offset.append(-1)
+            continue
+        if strategy == "First-Fit":
+            j = fits[0]
+        elif strategy == "Best-Fit":
+            j = min(fits, key=lambda j: (free[j] - size, j))
+        else:
+            j = min(fits, key=lambda j: (-free[j], j))
+        placed.append(j)
+        offset.append(blocks[j] - free[j])
+        free[j] -= size
+    return placed, offset, free
+
+
+def assert_same(result, other):
+    for name in ("allocation", "offset", "remaining"):
+        assert getattr(result, name).tolist() == getattr(other, name).tolist(), name
+
+
+@pytest.fixture(params=[512, 2], ids=["default-buckets", "tiny-buckets"])
+def bucket_load(request, monkeypatch):
+    # Tiny buckets make the sorted index split and merge on every few keys
+    monkeypatch.setattr(allocation._SortedKeys, "LOAD", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("strategy", list(allocation.STRATEGIES))
+def test_fits_match_linear_scans(strategy, bucket_load):
+    rng = np.random.default_rng(0)
+    for _ in range(400):
+        blocks = rng.integers(0, 60, int(rng.integers(0, 12))).tolist()
+        processes = rng.integers(0, 40, int(rng.integers(0, 20))).tolist()
+        result = allocation.allocate(strategy, blocks, processes)
+        placed, offset, free = reference_fit(strategy, blocks, processes)
+        assert result.allocation.tolist() == placed
+        assert result.offset.tolist() == offset
+        assert result.remaining.tolist() == free
+
+
+@pytest.mark.parametrize("strategy", list(allocation.STRATEGIES))
+def test_reallocate_matches_full_run(strategy, bucket_load):
+    rng = np.random.default_rng(1)
+    for _ in range(400):
+        blocks = rng.integers(1, 60, int(rng.integers(1, 8)))
+        processes = rng.integers(1, 40, int(rng.integers(0, 15)))
+        previous = allocation.allocate(strategy, blocks, processes)
+        blocks, processes = blocks.copy(), processes.copy()
+        edit = rng.integers(5)
+        if edit == 0 and len(processes):
+            processes[rng.integers(len(processes))] = rng.integers(1, 40)
+        elif edit == 1:
+            blocks[rng.integers(len(blocks))] = rng.integers(1, 60)
+        elif edit == 2:
+            processes = np.append(processes, rng.integers(1, 40))
+        elif edit == 3:
+            processes = processes[:-1]
+        else:
+            blocks = np.append(blocks, rng.integers(1, 60))
+        assert_same(allocation.reallocate(previous, blocks, processes),
+                    allocation.allocate(strategy, blocks, processes))
+
+
+def test_reallocate_unchanged_returns_previous():
+    previous = allocation.first_fit([10, 20], [5, 15])
+    assert allocation.reallocate(previous, [10, 20], [5, 15]) is previous
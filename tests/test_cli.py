@@ -0,0 +1,21 @@
+import io
+import json
+
+import pytest
+
+from osplatform import cli
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl"])
+def test_record_writer_blanks_non_finite_floats(format):
+    stream = io.StringIO()
+    writer = cli.RecordWriter(stream, ["processes", "throughput", "avg_waiting"], format)
+    writer.write([{"processes": 1, "throughput": float("inf"), "avg_waiting": float("nan")},
+                  {"processes": 2, "throughput": 0.5, "avg_waiting": 1.0}])
+    lines = stream.getvalue().splitlines()
+    if format == "csv":
+        assert lines == ["processes,throughput,avg_waiting", "1,,", "2,0.5,1.0"]
+    else:
+        assert [json.loads(line) for line in lines] == [
+            {"processes": 1, "throughput": None, "avg_waiting": None},
+            {"processes": 2, "throughput": 0.5, "avg_waiting": 1.0}]
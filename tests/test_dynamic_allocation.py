@@ -0,0 +1,151 @@
+import pytest
+
+from osplatform import dynamic_allocation
+from osplatform.workloads import random_trace
+
+
+def holes(free):
+    """``(start, size)`` of every run of free units in a unit bitmap."""
+    runs, start = [], None
+    for address, unit in enumerate(list(free) + [0]):
+        if unit and start is None:
+            start = address
+        elif not unit and start is not None:
+            runs.append((start, address - start))
+            start = None
+    return runs
+
+
+class BitmapFreeList:
+    """One flag per unit; every request scans the runs of free units."""
+
+    def __init__(self, capacity, strategy):
+        self.free = bytearray([1]) * capacity
+        self.strategy = strategy
+        self.rover = 0
+
+    def malloc(self, size):
+        fits = [(start, length) for start, length in holes(self.free) if length >= size]
+        if self.strategy == "Next-Fit":
+            fits = [hole for hole in fits if hole[0] >= self.rover] or fits
+        if not fits:
+            return None
+        if self.strategy == "Best-Fit":
+            start = min(fits, key=lambda hole: (hole[1], hole[0]))[0]
+        elif self.strategy == "Worst-Fit":
+            start = min(fits, key=lambda hole: (-hole[1], hole[0]))[0]
+        else:
+            start = fits[0][0]
+        self.free[start:start + size] = bytes(size)
+        self.rover = start + size
+        return start
+
+    def release(self, start, size):
+        self.free[start:start + size] = bytearray([1]) * size
+
+
+class BlockSetBuddy:
+    """Free blocks as a set of ``(address, order)``, searched linearly."""
+
+    def __init__(self, capacity):
+        self.top = capacity.bit_length() - 1
+        self.blocks = {(0, self.top)}
+
+    def malloc(self, size):
+        order = (size - 1).bit_length()
+        fits = [block for block in self.blocks if block[1] >= order]
+        if not fits:
+            return None
+        address, k = min(fits, key=lambda block: (block[1], block[0]))
+        self.blocks.remove((address, k))
+        while k > order:
+            k -= 1
+            self.blocks.add((address + (1 << k), k))
+        return address
+
+    def release(self, address, size):
+        order = (size - 1).bit_length()
+        while order < self.top and (address ^ (1 << order), order) in self.blocks:
+            self.blocks.remove((address ^ (1 << order), order))
+            address &= ~(1 << order)
+            order += 1
+        self.blocks.add((address, order))
+
+    @property
+    def free_total(self):
+        return sum(1 << order for _, order in self.blocks)
+
+    @property
+    def largest_hole(self):
+        return max((1 << order for _, order in self.blocks), default=0)
+
+
+@pytest.fixture(params=[256, 2], ids=["default-buckets", "tiny-buckets"])
+def bucket_load(request, monkeypatch):
+    # Tiny buckets make the hole index split its buckets every few holes
+    monkeypatch.setattr(dynamic_allocation._HoleIndex, "LOAD", request.param)
+    monkeypatch.setattr(dynamic_allocation._SortedKeys, "LOAD", request.param)
+
+
+def run_trace(allocator, model, events, check):
+    live = {}
+    for op, block_id, size in events:
+        if op == "alloc":
+            address = allocator.malloc(size)
+            assert address == model.malloc(size)
+            if address is not None:
+                live[block_id] = (address, size)
+        elif block_id in live:
+            allocator.free(*live[block_id])
+            model.release(*live.pop(block_id))
+        check()
+
+
+@pytest.mark.parametrize("strategy", dynamic_allocation.FREE_LIST_STRATEGIES)
+@pytest.mark.parametrize("seed", range(4))
+def test_free_list_matches_bitmap(strategy, seed, bucket_load):
+    allocator = dynamic_allocation.FreeListAllocator(200, strategy)
+    model = BitmapFreeList(200, strategy)
+
+    def check():
+        runs = holes(model.free)
+        assert allocator.free_total == sum(length for _, length in runs)
+        assert allocator.largest_hole == max((length for _, length in runs), default=0)
+        assert allocator.holes == len(runs)
+
+    run_trace(allocator, model, random_trace(1500, seed=seed, max_size=24, free_probability=0.5), check)
+
+
+@pytest.mark.parametrize("capacity", [256, 300])
+@pytest.mark.parametrize("seed", range(4))
+def test_buddy_matches_block_set(capacity, seed, bucket_load):
+    allocator = dynamic_allocation.BuddyAllocator(capacity)
+    model = BlockSetBuddy(capacity)
+
+    def check():
+        assert allocator.free_total == model.free_total
+        assert allocator.largest_hole == model.largest_hole
+
+    run_trace(allocator, model, random_trace(1500, seed=seed, max_size=40, free_probability=0.5), check)
+    assert allocator.capacity == 256
+
+
+@pytest.mark.parametrize("strategy", dynamic_allocation.STRATEGIES)
+def test_replay_metrics(strategy):
+    events = list(random_trace(3000, seed=5, max_size=32))
+    metrics = dynamic_allocation.replay(events, 512, strategy, max_samples=64)
+    assert metrics.events == 3000
+    assert metrics.allocations == sum(op == "alloc" for op, _, _ in events)
+    assert len(metrics.step) <= 64 and metrics.step[-1] == 2999
+    assert ((metrics.fragmentation >= 0) & (metrics.fragmentation <= 1)).all()
+    assert metrics.failure_rate[-1] == metrics.failures / metrics.allocations
+
+
+@pytest.mark.parametrize("strategy", dynamic_allocation.STRATEGIES)
+def test_replay_refuses_bad_and_duplicate_allocations(strategy):
+    events = [("alloc", 1, 10), ("alloc", 1, 20), ("alloc", 2, 0), ("alloc", 3, -5), ("free", 1, 10)]
+    metrics = dynamic_allocation.replay(events, 64, strategy)
+    assert (metrics.allocations, metrics.failures, metrics.frees) == (4, 3, 1)
+    # The refused duplicate did not replace block 1, so freeing it empties memory
+    assert metrics.used[-1] == 0
+    assert metrics.largest_hole[-1] == 64
@@ -0,0 +1,145 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from osplatform import multicore, scheduling
+
+
+def reference_multicore(burst, arrival, policy, cpus, topology, quantum, levels, boost, switch_cost,
+                        migration_cost):
+    """Step time one unit at a time, handling each step's events in the documented order.
+
+    Boosts first, then slice ends by core, then arrivals by process id,
+    then dispatches to idle cores, lowest core first.  Per-core loads are
+    recounted from the queues at every decision.
+    """
+    quanta = multicore.level_quanta(policy, quantum, levels)
+    bottom = len(quanta) - 1
+    shared = topology == "global"
+    n = len(burst)
+    remaining = list(burst)
+    level = [0] * n
+    last_cpu = [-1] * n
+    start, completion = [-1] * n, [0] * n
+    for i in range(n):
+        if burst[i] == 0:
+            start[i] = completion[i] = arrival[i]
+    queues = [[deque() for _ in quanta] for _ in range(1 if shared else cpus)]
+    running = [None] * cpus
+    last_job = [-1] * cpus
+    slices, switch_time = [], 0
+
+    def queued(core):
+        return sum(len(queue) for queue in queues[core])
+
+    time = 0
+    while any(remaining) or any(running):
+        if boost and bottom and time and time % boost == 0:
+            for core_queues in queues:
+                for queue in core_queues[1:]:
+                    for i in queue:
+                        level[i] = 0
+                    core_queues[0].extend(queue)
+                    queue.clear()
+        for core in range(cpus):
+            if running[core] is not None and running[core][1] == time:
+                i = running[core][0]
+                running[core] = None
+                if remaining[i]:
+                    level[i] = min(level[i] + 1, bottom)
+                    queues[0 if shared else core][level[i]].append(i)
+                else:
+                    completion[i] = time
+        for i in range(n):
+            if arrival[i] == time and burst[i]:
+                if shared:
+                    target = 0
+                else:
+                    target = min(range(cpus), key=lambda c: (queued(c) + (running[c] is not None), c))
+                queues[target][0].append(i)
+        for core in range(cpus):
+            if running[core] is not None or not any(queued(c) for c in range(len(queues))):
+                continue
+            if shared:
+                source, back = 0, False
+            elif queued(core):
+                source, back = core, False
+            else:
+                source, back = min(range(cpus), key=lambda c: (-queued(c), c)), True
+            queue = next(queue for queue in queues[source] if queue)
+            i = queue.pop() if back else queue.popleft()
+            cost = 0
+            if last_job[core] >= 0 and last_job[core] != i:
+                cost += switch_cost
+            if last_cpu[i] >= 0 and last_cpu[i] != core:
+                cost += migration_cost
+            switch_time += cost
+            begin = time + cost
+            run = remaining[i] if quanta[level[i]] is None else min(remaining[i], quanta[level[i]])
+            remaining[i] -= run
+            if start[i] < 0:
+                start[i] = begin
+            running[core] = (i, begin + run)
+            last_job[core], last_cpu[i] = i, core
+            slices.append((i, core, begin, begin + run))
+        time += 1
+    return start, completion, slices, switch_time
+
+
+def gantt_slices(result):
+    gantt = result.gantt
+    return list(zip(gantt["pid"].tolist(), gantt["cpu"].tolist(), gantt["start"].tolist(), gantt["end"].tolist()))
+
+
+@pytest.mark.parametrize("topology", multicore.TOPOLOGIES)
+@pytest.mark.parametrize("policy", multicore.POLICIES)
+def test_matches_unit_step_reference(policy, topology):
+    rng = np.random.default_rng(len(policy) + len(topology))
+    for trial in range(150):
+        n = int(rng.integers(1, 14))
+        burst = rng.integers(0 if trial % 5 == 0 else 1, 12, n)
+        arrival = rng.integers(0, 20, n)
+        options = dict(cpus=int(rng.integers(1, 4)), topology=topology, quantum=int(rng.integers(1, 4)),
+                       levels=int(rng.integers(1, 4)), boost=[None, 3, 7][trial % 3],
+                       switch_cost=int(rng.integers(0, 3)), migration_cost=int(rng.integers(0, 3)))
+        result = multicore.simulate(burst, arrival, policy, **options)
+        start, completion, slices, switch_time = reference_multicore(burst.tolist(), arrival.tolist(), policy,
+                                                                     **options)
+        assert result.start.tolist() == start, (burst, arrival, options)
+        assert result.completion.tolist() == completion, (burst, arrival, options)
+        assert gantt_slices(result) == slices, (burst, arrival, options)
+        assert result.switch_time == switch_time
+
+
+def test_arrival_during_slice_queues_ahead_of_preempted_job():
+    result = multicore.simulate([4, 2], [0, 1], "Round Robin", quantum=2)
+    assert gantt_slices(result) == [(0, 0, 0, 2), (1, 0, 2, 4), (0, 0, 4, 6)]
+    # The single-core engine puts the preempted process first instead
+    single = scheduling.round_robin([4, 2], [0, 1], quantum=2)
+    assert single.gantt["pid"].tolist() == [0, 0, 1]
+
+
+def test_slice_end_comes_before_arrival_at_the_same_time():
+    result = multicore.simulate([4, 2], [0, 2], "Round Robin", quantum=2)
+    assert result.gantt["pid"].tolist() == [0, 0, 1]
+
+
+def test_idle_cores_dispatch_lowest_first():
+    result = multicore.simulate([3, 3, 3], [0, 0, 0], "FCFS", cpus=4)
+    assert gantt_slices(result) == [(0, 0, 0, 3), (1, 1, 0, 3), (2, 2, 0, 3)]
+
+
+def test_boost_after_idle_gap():
+    # Nothing waits between 8 and 100; later boosts must still fall on multiples of 4
+    result = multicore.simulate([8, 30, 2], [0, 100, 101], "MLFQ", quantum=1, levels=3, boost=4)
+    reference = reference_multicore([8, 30, 2], [0, 100, 101], "MLFQ", 1, "global", 1, 3, 4, 0, 0)
+    assert gantt_slices(result) == reference[2]
+
+
+def test_switch_costs_widen_int32_tables():
+    # Two jobs alternate for 8 slices, paying 7 switches on top of 2**29 units of work
+    result = multicore.simulate([2 ** 28] * 2, [0, 0], "Round Robin", quantum=2 ** 26, switch_cost=2 ** 29)
+    assert result.table.dtype == np.int64
+    assert result.switch_time == 7 * 2 ** 29
+    assert result.completion.max() == 2 ** 32
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from osplatform import paging
+from osplatform.workloads import random_references
+
+
+def reference_paging(algorithm, references, frames):
+    """Faults and victims with the resident set kept in a plain list."""
+    resident, loaded, last, uses, bits = [], {}, {}, {}, {}
+    hand = 0
+    fault, victim = [], []
+    for i, page in enumerate(references):
+        hit = page in resident
+        fault.append(not hit)
+        evicted = -1
+        if hit:
+            uses[page] += 1
+            bits[page] = 1
+        elif algorithm == "Clock" and len(resident) == frames:
+            while bits[resident[hand]]:
+                bits[resident[hand]] = 0
+                hand = (hand + 1) % frames
+            evicted = resident[hand]
+            resident[hand] = page
+            hand = (hand + 1) % frames
+        elif len(resident) == frames:
+            if algorithm == "FIFO":
+                evicted = min(resident, key=lambda p: loaded[p])
+            elif algorithm == "LRU":
+                evicted = min(resident, key=lambda p: last[p])
+            elif algorithm == "LFU":
+                evicted = min(resident, key=lambda p: (uses[p], last[p]))
+            else:
+                upcoming = {p: next((j for j in range(i + 1, len(references)) if references[j] == p), len(references))
+                            for p in resident}
+                evicted = max(resident, key=lambda p: (upcoming[p], -p))
+            resident.remove(evicted)
+        if not hit:
+            if algorithm != "Clock" or evicted < 0:
+                resident.append(page)
+            loaded[page], uses[page], bits[page] = i, 1, 1
+        last[page] = i
+        victim.append(evicted)
+    return fault, victim
+
+
+def reference_strings():
+    rng = np.random.default_rng(0)
+    yield [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+    # Belady's string, and runs of immediate repeats
+    yield [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+    yield [3, 3, 3, 1, 1, 2, 2, 2, 3, 1, 1, 4]
+    for trial in range(40):
+        yield rng.integers(0, 2 + trial % 9, int(rng.integers(1, 60))).tolist()
+    yield random_references(400, pages=24, seed=1, working_set=5, phase=50).tolist()
+
+
+@pytest.mark.parametrize("algorithm", paging.ALGORITHMS)
+def test_policies_match_reference(algorithm):
+    for references in reference_strings():
+        for frames in range(1, 7):
+            result = paging.simulate(algorithm, references, frames)
+            fault, victim = reference_paging(algorithm, references, frames)
+            assert result.fault.tolist() == fault, (references, frames)
+            assert result.victim.tolist() == victim, (references, frames)
+
+
+@pytest.mark.parametrize("algorithm", paging.ALGORITHMS)
+def test_fault_curve_matches_reference(algorithm):
+    for references in reference_strings():
+        counts = [1, 2, 3, 5, 8, 30]
+        curve = paging.fault_curve(algorithm, references, counts[::-1])
+        assert curve.frames.tolist() == counts
+        assert curve.faults.tolist() == [sum(reference_paging(algorithm, references, f)[0]) for f in counts]
+
+
+def test_lru_fault_curve_matches_simulate():
+    references = random_references(3000, pages=128, seed=4)
+    curve = paging.fault_curve("LRU", references, range(1, 129))
+    assert curve.faults.tolist() == [paging.simulate("LRU", references, f).faults for f in range(1, 129)]
+
+
+def test_belady_anomaly():
+    curve = paging.fault_curve("FIFO", [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5], range(1, 6))
+    assert curve.faults.tolist() == [12, 12, 9, 10, 5]
+    assert paging.belady_anomalies(curve) == [(3, 4)]
+
+
+def test_rejects_bad_references():
+    with pytest.raises(ValueError):
+        paging.simulate("LRU", [1, -1], 2)
+    with pytest.raises(ValueError):
+        paging.fault_curve("FIFO", [1, 2], [0, 1])
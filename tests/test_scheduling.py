@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from osplatform import scheduling
+
+
+def random_case(rng, zero_bursts=False):
+    n = int(rng.integers(1, 16))
+    burst = rng.integers(0 if zero_bursts else 1, 9, n)
+    arrival = rng.integers(0, 30, n)
+    priority = rng.integers(0, 4, n)
+    return burst, arrival, priority
+
+
+def gantt_slices(result):
+    gantt = result.gantt
+    return list(zip(gantt["pid"].tolist(), gantt["start"].tolist(), gantt["end"].tolist()))
+
+
+def assert_matches(result, start, completion, slices):
+    assert result.start.tolist() == start
+    assert result.completion.tolist() == completion
+    assert (result.turnaround == result.completion - result.arrival).all()
+    assert (result.waiting == result.turnaround - result.burst).all()
+    assert gantt_slices(result) == slices
+
+
+def reference_fcfs(burst, arrival):
+    time, start, completion = 0, [], []
+    for b, a in zip(burst, arrival):
+        time = max(time, a)
+        start.append(time)
+        time += b
+        completion.append(time)
+    return start, completion, [(i, s, c) for i, (s, c) in enumerate(zip(start, completion))]
+
+
+def reference_unit_steps(burst, arrival, key, preemptive):
+    """Step time one unit at a time, picking the smallest ``(key, arrival, pid)`` ready job."""
+    n = len(burst)
+    remaining = list(burst)
+    start, completion = [-1] * n, [0] * n
+    for i in range(n):
+        if burst[i] == 0:
+            start[i] = completion[i] = arrival[i]
+    slices = []
+    time, current = 0, None
+    while any(remaining):
+        if current is None or preemptive:
+            ready = [i for i in range(n) if arrival[i] <= time and remaining[i] > 0]
+            if not ready:
+                time += 1
+                continue
+            current = min(ready, key=lambda i: (key(i, remaining), arrival[i], i))
+        if start[current] < 0:
+            start[current] = time
+        if slices and slices[-1][0] == current and slices[-1][2] == time:
+            slices[-1] = (current, slices[-1][1], time + 1)
+        else:
+            slices.append((current, time, time + 1))
+        remaining[current] -= 1
+        time += 1
+        if remaining[current] == 0:
+            completion[current] = time
+            current = None
+    return start, completion, slices
+
+
+def reference_round_robin(burst, arrival, quantum):
+    """The original app's linear-scan Round Robin."""
+    n = len(burst)
+    remaining = list(burst)
+    start, completion = [-1] * n, [0] * n
+    for i in range(n):
+        if burst[i] == 0:
+            start[i] = completion[i] = arrival[i]
+    slices, queue = [], []
+    time = 0
+    while any(remaining):
+        for i in range(n):
+            if arrival[i] <= time and remaining[i] > 0 and i not in queue:
+                queue.append(i)
+        if not queue:
+            time += 1
+            continue
+        i = queue.pop(0)
+        if start[i] < 0:
+            start[i] = time
+        run = min(quantum, remaining[i])
+        slices.append((i, time, time + run))
+        time += run
+        remaining[i] -= run
+        if remaining[i] > 0:
+            queue.append(i)
+        else:
+            completion[i] = time
+    return start, completion, slices
+
+
+def test_fcfs_matches_reference():
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        burst, arrival, _ = random_case(rng, zero_bursts=True)
+        result = scheduling.fcfs(burst, arrival)
+        assert_matches(result, *reference_fcfs(burst.tolist(), arrival.tolist()))
+
+
+@pytest.mark.parametrize("algorithm, preemptive", [("SJF", False), ("SRTF", True), ("Priority", False),
+                                                    ("Priority", True)])
+def test_heap_schedulers_match_unit_steps(algorithm, preemptive):
+    rng = np.random.default_rng(1)
+    for trial in range(300):
+        burst, arrival, priority = random_case(rng, zero_bursts=trial % 4 == 0)
+        level = priority.tolist()
+        if algorithm == "SJF":
+            result, key = scheduling.sjf(burst, arrival), lambda i, remaining: burst[i]
+        elif algorithm == "SRTF":
+            result, key = scheduling.srtf(burst, arrival), lambda i, remaining: remaining[i]
+        else:
+            result, key = scheduling.priority(burst, arrival, priority, preemptive), lambda i, remaining: level[i]
+        assert_matches(result, *reference_unit_steps(burst.tolist(), arrival.tolist(), key, preemptive))
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 3, 5])
+def test_round_robin_matches_linear_scan(quantum):
+    rng = np.random.default_rng(quantum)
+    for trial in range(300):
+        burst, arrival, _ = random_case(rng, zero_bursts=trial % 4 == 0)
+        result = scheduling.round_robin(burst, arrival, quantum)
+        assert_matches(result, *reference_round_robin(burst.tolist(), arrival.tolist(), quantum))
+
+
+def test_int32_tables_fall_back_to_int64():
+    burst = np.array([2, 3])
+    assert scheduling.fcfs(burst, np.array([0, 1])).table.dtype == np.int32
+    wide = scheduling.fcfs(burst, np.array([0, 2 ** 31]))
+    assert wide.table.dtype == np.int64
+    assert wide.completion.tolist() == [2, 2 ** 31 + 3]
+
+
+def test_float_workloads():
+    result = scheduling.round_robin([1.5, 2.0], [0.0, 0.25], quantum=1)
+    assert result.completion.tolist() == [1.5, 3.5]
+    assert gantt_slices(result) == [(0, 0.0, 1.0), (0, 1.0, 1.5), (1, 1.5, 2.5), (1, 2.5, 3.5)]
+
+
+@pytest.mark.parametrize("algorithm", list(scheduling.ALGORITHMS))
+def test_resimulate_matches_full_run(algorithm):
+    rng = np.random.default_rng(7)
+    for trial in range(200):
+        burst, arrival, priority = random_case(rng, zero_bursts=trial % 5 == 0)
+        quantum = int(rng.integers(1, 5))
+        previous = scheduling.simulate(algorithm, burst, arrival, quantum=quantum, priority_level=priority)
+        burst, arrival, priority = burst.copy(), arrival.copy(), priority.copy()
+        for _ in range(int(rng.integers(1, 3))):
+            i = rng.integers(len(burst))
+            column = (burst, arrival, priority)[rng.integers(3)]
+            column[i] = rng.integers(1, 9) if column is burst else rng.integers(0, 30)
+        resumed = scheduling.resimulate(previous, burst, arrival, priority_level=priority)
+        full = scheduling.simulate(algorithm, burst, arrival, quantum=quantum, priority_level=priority)
+        assert (resumed.table.data == full.table.data).all()
+        assert gantt_slices(resumed) == gantt_slices(full)
@@ -0,0 +1,142 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from osplatform import random_trace, random_workload, scheduling, streaming
+
+
+def schedule_broadcast(speed):
+    workload = random_workload(40, seed=3)
+    result = scheduling.simulate("Round Robin", workload.burst, workload.arrival, quantum=4)
+    return streaming.schedule_broadcast(result, [f"P{i}" for i in range(40)], speed=speed)
+
+
+async def collect(url):
+    """Hello and every record a viewer applies until the broadcast ends."""
+    hello, parts = None, []
+    async for message in streaming.watch(url):
+        if message[0] == "hello":
+            hello = message[1]
+            continue
+        if message[0] == "reset":
+            parts = []
+            continue
+        _, channel, clock, records = message
+        assert channel == streaming.CHANNELS[hello["channel"]]
+        parts.append(records.copy())
+        if clock >= hello["end"]:
+            break
+    return hello, np.concatenate(parts)
+
+
+def run_hub(test):
+    async def main():
+        hub = streaming.StreamHub()
+        await hub.start("127.0.0.1", 0)
+        try:
+            await test(hub, f"ws://127.0.0.1:{hub.port}")
+        finally:
+            hub._ticker.cancel()
+            hub.server.close()
+            await hub.server.wait_closed()
+
+    asyncio.run(main())
+
+
+def test_frames_round_trip_wide_fields():
+    records = streaming.memory_events([("alloc", 1, 3 << 31), ("alloc", 2, 5 << 31), ("free", 1, 0)], 1 << 40)
+    assert streaming.EVENT_DTYPE.itemsize == 32
+    channel, clock, decoded = streaming.decode_frame(streaming.encode_frame(streaming.MEMORY, records, 2.0))
+    assert (channel, clock) == (streaming.MEMORY, 2.0)
+    assert decoded["a"].tolist() == [0, 3 << 31, 0]
+    assert decoded["b"].tolist() == [3 << 31, 5 << 31, 3 << 31]
+
+
+def test_viewers_and_late_joiner_receive_the_whole_log():
+    broadcast = schedule_broadcast(speed=400.0)
+    expected = broadcast.events.tobytes()
+
+    async def test(hub, base):
+        hub.publish("class", broadcast)
+        first, second = await asyncio.gather(collect(f"{base}/class"), collect(f"{base}/class"))
+        for hello, records in (first, second):
+            assert hello["channel"] == "schedule" and "gantt" not in hello
+            assert records.tobytes() == expected
+        # Joining after the end is all catch-up
+        assert hub.status("class")["clock"] == broadcast.end
+        hello, records = await collect(f"{base}/class")
+        assert records.tobytes() == expected
+
+    run_hub(test)
+
+
+def test_seeking_back_resets_viewers():
+    broadcast = schedule_broadcast(speed=50.0)
+
+    async def test(hub, base):
+        hub.publish("class", broadcast)
+        kinds, parts = [], []
+        async for message in streaming.watch(f"{base}/class"):
+            kinds.append(message[0])
+            if message[0] == "reset":
+                parts = []
+            elif message[0] == "frame":
+                parts.append(message[3].copy())
+                if kinds.count("frame") == 5 and "reset" not in kinds:
+                    hub.control("class", seek=0.0)
+                if message[2] >= broadcast.end:
+                    break
+        assert kinds.count("reset") == 1
+        assert np.concatenate(parts).tobytes() == broadcast.events.tobytes()
+
+    run_hub(test)
+
+
+def test_memory_broadcast():
+    broadcast = streaming.memory_broadcast(random_trace(500, seed=2, max_size=64), 1500, "Buddy", speed=1e4)
+
+    async def test(hub, base):
+        hub.publish("memory", broadcast)
+        hello, records = await collect(f"{base}/memory")
+        # Buddy manages only the power-of-two prefix of the 1500 units
+        assert hello["capacity"] == 1 << 10
+        assert records.tobytes() == broadcast.events.tobytes()
+
+    run_hub(test)
+
+
+@pytest.mark.parametrize("path, upgrade, status", [("missing", True, b" 404 "), ("class", False, b" 426 ")])
+def test_handshake_refusals(path, upgrade, status):
+    async def test(hub, base):
+        hub.publish("class", schedule_broadcast(speed=1.0))
+        reader, writer = await asyncio.open_connection("127.0.0.1", hub.port)
+        headers = "Upgrade: websocket\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n" if upgrade else ""
+        writer.write(f"GET /{path} HTTP/1.1\r\nHost: x\r\n{headers}\r\n".encode("ascii"))
+        assert status in await reader.readline()
+        writer.close()
+        with pytest.raises(ConnectionError, match="stream refused"):
+            async for _ in streaming.watch(f"{base}/missing"):
+                pass
+
+    run_hub(test)
+
+
+def test_watch_stops_after_messages():
+    async def test(hub, base):
+        hub.publish("class", schedule_broadcast(speed=1.0))
+        messages = [message async for message in streaming.watch(f"{base}/class", messages=2)]
+        assert [message[0] for message in messages] == ["hello", "frame"]
+        await asyncio.sleep(0.05)
+        assert hub.status("class")["viewers"] == 0
+
+    run_hub(test)
+
+
+def test_watch_rejects_other_schemes():
+    async def test(hub, base):
+        with pytest.raises(ValueError):
+            async for _ in streaming.watch(f"wss://127.0.0.1:{hub.port}/class"):
+                pass
+
+    run_hub(test)